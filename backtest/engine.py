@@ -79,6 +79,103 @@ class Backtester:
         
         return metrics, equity_curve, trades
     
+    def run_batch(self, prices, positions):
+        """
+        여러 포지션 시퀀스를 한 번에 백테스팅 (벡터화, 거래별 출력 없음)
+
+        run과 같은 규칙: 현금일 때 1이면 매수, 보유 중 -1이면 매도,
+        매매마다 수수료, 마지막에 보유 중이면 최종 매도 (거래 수/승률에만 반영)
+
+        Args:
+            prices: (T,) 가격
+            positions: (R, T) 또는 (T,) 실행할 포지션 (1=매수, -1=매도, 0=홀드)
+
+        Returns:
+            metrics (실행별 (R,) 배열 dict), equity_curves (R, T+1)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        positions = np.asarray(positions)
+        if positions.ndim == 1:
+            positions = positions[None, :]
+        num_runs, T = positions.shape
+
+        print(f"\n🔄 배치 백테스팅: {num_runs}개 실행 × {T}개 시간")
+
+        # 보유 상태: 마지막으로 유효했던 매매 방향
+        # (현금일 때 -1, 보유 중 1은 무시되므로 0이 아닌 마지막 포지션과 같음)
+        nonzero = positions != 0
+        idx = np.where(nonzero, np.arange(T), -1)
+        idx = np.maximum.accumulate(idx, axis=1)
+        last = np.take_along_axis(positions, np.maximum(idx, 0), axis=1)
+        held = (last == 1) & (idx >= 0)
+
+        prev_held = np.zeros_like(held)
+        prev_held[:, 1:] = held[:, :-1]
+        traded = held != prev_held
+
+        # 자산: 보유 중이면 가격 변화만큼, 매매 시점마다 (1 - 수수료)
+        growth = np.ones(T)
+        growth[1:] = prices[1:] / prices[:-1]
+        factors = np.where(prev_held, growth, 1.0) * np.where(traded, 1 - self.fee, 1.0)
+
+        equity_curves = np.empty((num_runs, T + 1))
+        equity_curves[:, 0] = self.initial_capital
+        np.cumprod(factors, axis=1, out=equity_curves[:, 1:])
+        equity_curves[:, 1:] *= self.initial_capital
+
+        # 거래: 상태 변화 + 최종 매도
+        buys = traded & held
+        sells = traded & ~held
+        final_sell = held[:, -1]
+        num_trades = traded.sum(axis=1) + final_sell
+
+        # 승률: 매도 가격 > 직전 매수 가격
+        buy_idx = np.maximum.accumulate(np.where(buys, np.arange(T), 0), axis=1)
+        entry_price = prices[buy_idx]
+        profitable = (sells[:, 1:] & (prices[1:] > entry_price[:, :-1])).sum(axis=1)
+        profitable += final_sell & (prices[-1] > entry_price[:, -1])
+
+        num_pairs = num_trades // 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            win_rate = np.where(num_pairs > 0, profitable / num_pairs * 100, 0.0)
+        win_rate = np.where(num_trades >= 2, win_rate, 0.0)
+
+        metrics = self.calculate_batch_metrics(equity_curves)
+        metrics['win_rate'] = win_rate
+        metrics['num_trades'] = num_trades
+
+        print(f"   ✅ 완료: 평균 거래 {num_trades.mean():.1f}회, "
+              f"최고 수익률 {metrics['total_return'].max():.2f}%")
+
+        return metrics, equity_curves
+
+    def calculate_batch_metrics(self, equity_curves):
+        """
+        실행별 성과 지표 (calculate_metrics의 벡터화 버전, 승률/거래 수 제외)
+
+        Args:
+            equity_curves: (R, T+1) 자산 곡선
+        """
+        equity_curves = np.asarray(equity_curves, dtype=np.float64)
+        final_capital = equity_curves[:, -1]
+
+        returns = np.diff(equity_curves, axis=1) / equity_curves[:, :-1]
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe_ratio = np.where(std > 0, mean / std * np.sqrt(8760), 0.0)
+
+        peak = np.maximum.accumulate(equity_curves, axis=1)
+        max_dd = ((peak - equity_curves) / peak).max(axis=1) * 100
+
+        return {
+            'initial_capital': np.full(len(equity_curves), float(self.initial_capital)),
+            'final_capital': final_capital,
+            'total_return': (final_capital / self.initial_capital - 1) * 100,
+            'sharpe_ratio': sharpe_ratio,
+            'max_drawdown': max_dd,
+        }
+
     def calculate_metrics(self, equity_curve, trades):
         """성과 지표 계산"""
         print(f"\n📊 성과 지표 계산 중...")
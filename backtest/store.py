@@ -0,0 +1,348 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+
+import numpy as np
+
+
+# 거래 기록 → 구조화 배열
+TRADE_DTYPE = np.dtype([
+    ('index', np.int64),
+    ('type', np.int8),      # 1=BUY, -1=SELL, -2=SELL (Final)
+    ('price', np.float64),
+    ('amount', np.float64),
+])
+
+TRADE_TYPES = {'BUY': 1, 'SELL': -1, 'SELL (Final)': -2}
+TRADE_NAMES = {code: name for name, code in TRADE_TYPES.items()}
+
+# 설정에서 컬럼으로 꺼내서 인덱스를 거는 키
+CONFIG_COLUMNS = ['symbol', 'timeframe', 'fee']
+
+# Backtester.calculate_metrics 결과
+METRIC_COLUMNS = [
+    'initial_capital', 'final_capital', 'total_return',
+    'sharpe_ratio', 'max_drawdown', 'win_rate', 'num_trades'
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at      REAL NOT NULL,
+    name            TEXT,
+    symbol          TEXT,
+    timeframe       TEXT,
+    fee             REAL,
+    initial_capital REAL,
+    final_capital   REAL,
+    total_return    REAL,
+    sharpe_ratio    REAL,
+    max_drawdown    REAL,
+    win_rate        REAL,
+    num_trades      INTEGER,
+    checkpoint      TEXT,
+    checkpoint_sha256 TEXT,
+    config          TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_fee_sharpe ON runs (fee, sharpe_ratio DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_sharpe ON runs (sharpe_ratio DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_return ON runs (total_return DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_symbol ON runs (symbol, timeframe);
+"""
+
+
+class RunStore:
+    """
+    실험 결과 저장소
+
+    - runs.db (SQLite): 실행별 설정 / 성과 지표 / 체크포인트 경로 + 해시 (인덱스)
+    - <run_id>/*.npy: 자산 곡선, 포지션, 거래 기록 (바이너리, 지연 로드)
+    - <run_id>/checkpoint.*: 실행 당시 체크포인트 사본 (원본은 다음 실행이 덮어씀)
+
+    예:
+        store = RunStore('runs')
+        run_id = store.record(config, metrics, equity_curve, positions, trades)
+        store.top('sharpe_ratio', n=20, fee=0.001)
+    """
+
+    def __init__(self, root='runs'):
+        """
+        초기화
+
+        Args:
+            root: 저장 폴더
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(root, 'runs.db'))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self._in_batch = False
+
+    def _migrate(self):
+        """예전 runs.db에 없는 컬럼 추가"""
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(runs)')}
+        if 'checkpoint_sha256' not in columns:
+            self.conn.execute('ALTER TABLE runs ADD COLUMN checkpoint_sha256 TEXT')
+            self.conn.commit()
+
+    def __enter__(self):
+        """with 블록 안의 record는 한 번에 커밋 (대량 스윕용)"""
+        self._in_batch = True
+        self.conn.execute('BEGIN')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._in_batch = False
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+    def run_dir(self, run_id):
+        return os.path.join(self.root, str(run_id))
+
+    def record(self, config, metrics, equity_curve=None, positions=None,
+               trades=None, checkpoint=None, name=None, copy_checkpoint=True):
+        """
+        실행 1개 기록
+
+        Args:
+            config: 설정 dict (main.py config)
+            metrics: Backtester.calculate_metrics 결과
+            equity_curve: 자산 곡선
+            positions: 포지션 배열 (1, -1, 0)
+            trades: Backtester.run 거래 기록
+            checkpoint: 모델 체크포인트 경로
+            name: 실행 이름
+            copy_checkpoint: 체크포인트를 <run_id>/에 복사 (False면 경로 + 해시만)
+
+        Returns:
+            run_id
+        """
+        row = {
+            'created_at': time.time(),
+            'name': name,
+            'checkpoint': checkpoint,
+            'checkpoint_sha256': self.file_hash(checkpoint) if checkpoint else None,
+            'config': json.dumps(config, default=str),
+        }
+        for key in CONFIG_COLUMNS:
+            row[key] = config.get(key)
+        for key in METRIC_COLUMNS:
+            value = metrics.get(key)
+            row[key] = float(value) if value is not None else None
+
+        columns = ', '.join(row)
+        placeholders = ', '.join('?' * len(row))
+        cursor = self.conn.execute(
+            f'INSERT INTO runs ({columns}) VALUES ({placeholders})',
+            list(row.values())
+        )
+        run_id = cursor.lastrowid
+
+        arrays = {}
+        if equity_curve is not None:
+            arrays['equity'] = np.asarray(equity_curve, dtype=np.float64)
+        if positions is not None:
+            arrays['positions'] = np.asarray(positions, dtype=np.int8)
+        if trades is not None:
+            arrays['trades'] = self.trades_to_array(trades)
+
+        if arrays:
+            os.makedirs(self.run_dir(run_id), exist_ok=True)
+            for key, array in arrays.items():
+                np.save(os.path.join(self.run_dir(run_id), f'{key}.npy'), array)
+
+        # 체크포인트 사본: 이 실행의 지표를 만든 모델 그대로 보관
+        if checkpoint and copy_checkpoint and os.path.exists(checkpoint):
+            os.makedirs(self.run_dir(run_id), exist_ok=True)
+            ext = os.path.splitext(checkpoint)[1]
+            copied = os.path.join(self.run_dir(run_id), f'checkpoint{ext}')
+            shutil.copyfile(checkpoint, copied)
+            self.conn.execute(
+                'UPDATE runs SET checkpoint = ? WHERE run_id = ?', (copied, run_id)
+            )
+
+        if not self._in_batch:
+            self.conn.commit()
+
+        return run_id
+
+    @staticmethod
+    def file_hash(path, chunk_size=1 << 20):
+        """파일 SHA-256 (없으면 None)"""
+        if not os.path.exists(path):
+            return None
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def trades_to_array(trades):
+        """거래 기록 (dict 리스트) → 구조화 배열"""
+        array = np.empty(len(trades), dtype=TRADE_DTYPE)
+        for i, trade in enumerate(trades):
+            array[i] = (
+                trade['index'], TRADE_TYPES[trade['type']],
+                trade['price'], trade['amount']
+            )
+        return array
+
+    def _where(self, filters):
+        """
+        필터 → WHERE 절 (컬럼은 인덱스 사용, 나머지는 config JSON)
+
+        컬럼 이름은 고정 목록에서만, config 키는 JSON 경로를 파라미터로 바인딩 (SQL에 직접 넣지 않음)
+        """
+        clauses, params = [], []
+        for key, value in filters.items():
+            if key in CONFIG_COLUMNS or key in METRIC_COLUMNS or key == 'name':
+                clauses.append(f'{key} = ?')
+            else:
+                clauses.append('json_extract(config, ?) = ?')
+                params.append(f'$.{key}')
+            params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, params
+
+    def top(self, metric='sharpe_ratio', n=20, ascending=False, **filters):
+        """
+        지표 상위 실행 조회
+
+        Args:
+            metric: 정렬 기준 (sharpe_ratio, total_return 등)
+            n: 개수
+            ascending: True면 낮은 순 (max_drawdown 등)
+            filters: 조건 (예: fee=0.001, symbol='BTC/USDT')
+
+        Returns:
+            dict 리스트
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"알 수 없는 지표: {metric}")
+
+        where, params = self._where(filters)
+        order = 'ASC' if ascending else 'DESC'
+        rows = self.conn.execute(
+            f'SELECT * FROM runs {where} '
+            f'ORDER BY {metric} {order} LIMIT ?',
+            params + [n]
+        ).fetchall()
+
+        return [self._to_dict(row) for row in rows]
+
+    def get(self, run_id):
+        row = self.conn.execute(
+            'SELECT * FROM runs WHERE run_id = ?', (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"실행 없음: {run_id}")
+        return self._to_dict(row)
+
+    def count(self, **filters):
+        where, params = self._where(filters)
+        return self.conn.execute(f'SELECT COUNT(*) FROM runs {where}', params).fetchone()[0]
+
+    def _to_dict(self, row):
+        run = dict(row)
+        run['config'] = json.loads(run['config']) if run['config'] else {}
+        return run
+
+    def load_array(self, run_id, key):
+        """
+        실행별 배열 지연 로드 (메모리 맵)
+
+        Args:
+            key: 'equity', 'positions', 'trades'
+        """
+        path = os.path.join(self.run_dir(run_id), f'{key}.npy')
+        if not os.path.exists(path):
+            return None
+        return np.load(path, mmap_mode='r')
+
+    def load_equity(self, run_id):
+        return self.load_array(run_id, 'equity')
+
+    def load_positions(self, run_id):
+        return self.load_array(run_id, 'positions')
+
+    def load_trades(self, run_id):
+        """거래 기록을 Backtester.run 형식 (dict 리스트)으로 복원"""
+        array = self.load_array(run_id, 'trades')
+        if array is None:
+            return None
+        return [
+            {
+                'index': int(t['index']),
+                'type': TRADE_NAMES[int(t['type'])],
+                'price': float(t['price']),
+                'amount': float(t['amount']),
+            }
+            for t in array
+        ]
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 60)
+    print("🚀 실험 결과 저장소 V0.1")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RunStore(tmp)
+
+        # 스윕 5만 개 (지표만)
+        num_runs = 50_000
+        start = time.perf_counter()
+        with store:
+            for i in range(num_runs):
+                config = {
+                    'symbol': 'BTC/USDT', 'timeframe': '1h',
+                    'fee': [0.0005, 0.001, 0.002][i % 3],
+                    'learning_rate': 0.001, 'seed': i
+                }
+                metrics = {
+                    'initial_capital': 10000, 'final_capital': 10000 * (1 + rng.normal(0, 0.1)),
+                    'total_return': rng.normal(0, 10), 'sharpe_ratio': rng.normal(0, 1),
+                    'max_drawdown': abs(rng.normal(10, 5)), 'win_rate': rng.uniform(30, 70),
+                    'num_trades': int(rng.integers(10, 500))
+                }
+                store.record(config, metrics)
+        print(f"\n   {num_runs:,}개 기록: {time.perf_counter() - start:.2f}초")
+
+        start = time.perf_counter()
+        best = store.top('sharpe_ratio', n=20, fee=0.001)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"   상위 20개 샤프 (fee=0.001): {elapsed:.2f}ms")
+        print(f"   1위: run {best[0]['run_id']}, 샤프 {best[0]['sharpe_ratio']:.2f}")
+
+        # 자산 곡선 포함 기록
+        equity = 10000 * np.cumprod(1 + rng.normal(0, 0.01, 1000))
+        trades = [
+            {'index': 3, 'type': 'BUY', 'price': 115000.0, 'amount': 0.087},
+            {'index': 10, 'type': 'SELL (Final)', 'price': 116000.0, 'amount': 10080.0},
+        ]
+        run_id = store.record({'fee': 0.001}, {'sharpe_ratio': 1.0}, equity,
+                              np.zeros(1000), trades, checkpoint='model_v0.1.pth')
+        loaded = store.load_equity(run_id)
+        print(f"\n   자산 곡선 지연 로드: {type(loaded).__name__}, 일치: {np.array_equal(loaded, equity)}")
+        print(f"   거래 복원 일치: {store.load_trades(run_id) == trades}")
+
+        del loaded
+        store.close()
@@ -0,0 +1,506 @@
+import json
+import os
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from data.candle_index import to_epoch_ms
+
+
+CANDLE_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+# 헤더 (int64): [마지막 seq, 용량, 필드 수, 마지막 타임스탬프, 값 바이트 수]
+HEADER_SIZE = 5
+META_SIZE = 64 * 1024
+
+
+def _attach(name):
+    """
+    기존 공유 메모리 연결 (읽는 프로세스가 종료될 때 지워지지 않도록 추적 해제)
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _unlink(shm):
+    """
+    공유 메모리 삭제 (생성한 프로세스)
+
+    Python < 3.13에서 spawn된 자식은 부모의 추적 프로세스를 같이 쓰므로
+    자식의 추적 해제가 부모 등록까지 지움 → 다시 등록한 뒤 삭제
+    """
+    resource_tracker.register(shm._name, 'shared_memory')
+    shm.unlink()
+
+
+class RingBuffer:
+    """
+    공유 메모리 링 버퍼 (쓰는 프로세스 1개, 읽는 프로세스 여러 개)
+
+    레이아웃:
+        header      int64 (5,)
+        timestamps  int64 (2C,)
+        values      dtype (2C, F)
+
+    각 행을 slot과 slot + C 두 곳에 기록 (미러링)해서
+    최근 n개(n <= C)는 항상 연속 구간 → 읽을 때 복사 없이 뷰로 반환
+
+    seq는 1부터 증가, 읽는 쪽은 is_valid(seq)로 덮어쓰기 여부 확인
+    """
+
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+
+        header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(header[1])
+        self.num_fields = int(header[2])
+        self._layout(shm.buf, self.capacity, self.num_fields, self._dtype_from(shm))
+
+    @staticmethod
+    def _dtype_from(shm):
+        header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+        return np.dtype(np.float64) if header[4] == 8 else np.dtype(np.float32)
+
+    def _layout(self, buf, capacity, num_fields, dtype):
+        offset = 0
+        self.header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += HEADER_SIZE * 8
+        self.timestamps = np.ndarray((2 * capacity,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 2 * capacity * 8
+        self.values = np.ndarray((2 * capacity, num_fields), dtype=dtype, buffer=buf, offset=offset)
+        self.dtype = dtype
+
+    @staticmethod
+    def nbytes(capacity, num_fields, dtype):
+        return HEADER_SIZE * 8 + 2 * capacity * 8 + 2 * capacity * num_fields * np.dtype(dtype).itemsize
+
+    @classmethod
+    def create(cls, name, capacity, num_fields, dtype=np.float32):
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=cls.nbytes(capacity, num_fields, dtype)
+        )
+        header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+        header[:] = [0, capacity, num_fields, -1, np.dtype(dtype).itemsize]
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        return cls(_attach(name))
+
+    @property
+    def last_seq(self):
+        return int(self.header[0])
+
+    @property
+    def last_timestamp(self):
+        return int(self.header[3])
+
+    def write(self, timestamp, values):
+        """
+        행 1개 기록 (쓰는 프로세스 전용)
+
+        Returns:
+            seq
+        """
+        seq = self.last_seq + 1
+        slot = seq % self.capacity
+
+        self.values[slot] = values
+        self.values[slot + self.capacity] = values
+        self.timestamps[slot] = timestamp
+        self.timestamps[slot + self.capacity] = timestamp
+
+        # 데이터를 다 쓴 뒤 seq 공개
+        self.header[3] = timestamp
+        self.header[0] = seq
+
+        return seq
+
+    def write_many(self, timestamps, values):
+        """여러 행 기록"""
+        seq = self.last_seq
+        for timestamp, row in zip(timestamps, values):
+            seq = self.write(timestamp, row)
+        return seq
+
+    def is_valid(self, seq):
+        """seq 행이 아직 덮어쓰이지 않았는지"""
+        last = self.last_seq
+        return 0 < seq <= last and last - seq < self.capacity
+
+    def window(self, n, end_seq=None):
+        """
+        end_seq까지 최근 n개 (복사 없는 뷰)
+
+        Returns:
+            first_seq, timestamps (n,), values (n, F)
+        """
+        end_seq = self.last_seq if end_seq is None else end_seq
+        n = min(n, end_seq, self.capacity)
+
+        end = end_seq % self.capacity + self.capacity + 1
+        start = end - n
+
+        return end_seq - n + 1, self.timestamps[start:end], self.values[start:end]
+
+    def latest(self):
+        """
+        가장 최근 행
+
+        Returns:
+            seq, timestamp, values (F,) 뷰 (없으면 seq=0)
+        """
+        seq = self.last_seq
+        if seq == 0:
+            return 0, None, None
+        slot = seq % self.capacity
+        return seq, int(self.timestamps[slot]), self.values[slot]
+
+    def read_since(self, seq):
+        """
+        seq 이후 새 행 전부 (복사 없는 뷰, 놓친 행이 용량을 넘으면 남은 것만)
+
+        Returns:
+            first_seq, timestamps, values
+        """
+        last = self.last_seq
+        n = min(last - seq, self.capacity)
+        if n <= 0:
+            return last + 1, self.timestamps[:0], self.values[:0]
+        return self.window(n, end_seq=last)
+
+    def close(self):
+        # 뷰를 먼저 풀어야 공유 메모리를 닫을 수 있음
+        self.header = self.timestamps = self.values = None
+        self.shm.close()
+
+    def unlink(self):
+        if self.owner:
+            _unlink(self.shm)
+
+
+class MarketDataBus:
+    """
+    심볼별 링 버퍼 묶음 (공유 메모리)
+
+    수집 프로세스 1개가 create로 만들고 캔들 + 피처를 기록,
+    전략/페이퍼 트레이딩 프로세스는 attach로 연결해서 복사 없이 읽음
+
+    채널 구성(심볼, 필드, 용량)은 '{name}_meta' 블록에 JSON으로 저장
+    """
+
+    def __init__(self, name, meta, rings, owner=False):
+        self.name = name
+        self.meta = meta
+        self.rings = rings
+        self.owner = owner
+        self.fields = meta['fields']
+        self.symbols = meta['symbols']
+        self._field_index = {field: i for i, field in enumerate(self.fields)}
+        self._meta_shm = None
+
+    @classmethod
+    def create(cls, name, symbols, fields=CANDLE_FIELDS, capacity=4096, dtype=np.float32):
+        """
+        버스 생성 (수집 프로세스)
+
+        Args:
+            name: 버스 이름
+            symbols: 심볼 리스트 (채널)
+            fields: 행의 필드 이름 (캔들 + 피처)
+            capacity: 채널당 보관 행 수
+            dtype: 값 타입 (float32면 모델 입력으로 바로 사용)
+        """
+        meta = {
+            'symbols': list(symbols),
+            'fields': list(fields),
+            'capacity': capacity,
+            'dtype': np.dtype(dtype).name,
+        }
+        payload = json.dumps(meta).encode()
+        if len(payload) > META_SIZE - 8:
+            raise ValueError(f"버스 구성이 너무 큼: {len(payload)} bytes")
+
+        meta_shm = shared_memory.SharedMemory(name=f"{name}_meta", create=True, size=META_SIZE)
+        meta_shm.buf[:8] = len(payload).to_bytes(8, 'little')
+        meta_shm.buf[8:8 + len(payload)] = payload
+
+        rings = {
+            symbol: RingBuffer.create(f"{name}_{i}", capacity, len(fields), dtype)
+            for i, symbol in enumerate(meta['symbols'])
+        }
+
+        bus = cls(name, meta, rings, owner=True)
+        bus._meta_shm = meta_shm
+
+        print(f"✅ 데이터 버스 생성: {name} ({len(symbols)}개 심볼 × {len(fields)}개 필드, "
+              f"{sum(r.shm.size for r in rings.values()) / 1e6:.1f}MB)")
+        return bus
+
+    @classmethod
+    def attach(cls, name):
+        """버스 연결 (읽는 프로세스, 추가 메모리 O(1))"""
+        meta_shm = _attach(f"{name}_meta")
+        size = int.from_bytes(bytes(meta_shm.buf[:8]), 'little')
+        meta = json.loads(bytes(meta_shm.buf[8:8 + size]).decode())
+
+        rings = {
+            symbol: RingBuffer.attach(f"{name}_{i}")
+            for i, symbol in enumerate(meta['symbols'])
+        }
+
+        bus = cls(name, meta, rings)
+        bus._meta_shm = meta_shm
+        return bus
+
+    def field(self, name):
+        """필드 이름 → 열 인덱스"""
+        return self._field_index[name]
+
+    def channel(self, symbol):
+        return self.rings[symbol]
+
+    def publish(self, symbol, timestamp, values):
+        return self.rings[symbol].write(timestamp, values)
+
+    def publish_frame(self, symbol, df, features=None):
+        """
+        데이터프레임에서 마지막 기록 이후 캔들만 발행
+
+        Args:
+            symbol: 심볼
+            df: OHLCV 데이터프레임
+            features: (N, F') 피처 배열 (df 행과 정렬, 필드 순서는 CANDLE_FIELDS 다음)
+
+        Returns:
+            발행한 행 수
+        """
+        ring = self.rings[symbol]
+        timestamps = to_epoch_ms(df['timestamp'].values)
+        new = np.flatnonzero(timestamps > ring.last_timestamp)
+        if len(new) == 0:
+            return 0
+
+        candles = df[CANDLE_FIELDS].to_numpy(dtype=ring.dtype)[new]
+        if features is not None:
+            rows = np.concatenate([candles, np.asarray(features, dtype=ring.dtype)[new]], axis=1)
+        else:
+            rows = candles
+
+        ring.write_many(timestamps[new], rows)
+        return len(new)
+
+    def close(self):
+        for ring in self.rings.values():
+            ring.close()
+        if self._meta_shm is not None:
+            self._meta_shm.close()
+
+    def unlink(self):
+        """공유 메모리 삭제 (생성한 프로세스에서만)"""
+        if not self.owner:
+            return
+        for ring in self.rings.values():
+            ring.unlink()
+        if self._meta_shm is not None:
+            _unlink(self._meta_shm)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        self.unlink()
+
+
+class BusPublisher:
+    """
+    수집 프로세스: 거래소 연결 1개로 여러 심볼 캔들을 받아 피처와 함께 버스에 발행
+
+    심볼별 마감 캔들 이력을 유지하고 새 캔들만 붙여서 피처 계산 (poll마다 비용/메모리 일정)
+    - 유한 창 지표만 있으면 최근 schema.lookback개만 보관 → FeatureArrays(학습)와 같은 값
+    - 재귀 지표(ema/rsi/macd)가 있으면 최근 schema.settle_length(tolerance)개만 보관
+      → 잘린 이력의 남은 가중치가 tolerance 이하
+    """
+
+    def __init__(self, collector, bus, schema=None, history=1000, max_history=None, tolerance=1e-6):
+        """
+        초기화
+
+        Args:
+            collector: DataCollector (거래소 연결 1개 공유)
+            bus: MarketDataBus (create로 만든 것)
+            schema: FeatureSchema (없으면 캔들만 발행)
+            history: seed가 없을 때 처음 받아올 캔들 수
+            max_history: 보관할 최대 캔들 수 (기본: 재현에 필요한 최소 길이)
+            tolerance: 재귀 지표에서 잘린 이력의 허용 가중치
+        """
+        if schema is not None and schema.requires_universe:
+            raise ValueError("교차 자산 지표(universe 필요)는 BusPublisher에서 지원하지 않음")
+
+        required = schema.settle_length(tolerance) if schema is not None else 1
+
+        if max_history is not None and max_history < required:
+            raise ValueError(
+                f"max_history={max_history}로는 피처를 재현할 수 없음 "
+                f"(필요: {required}, 재귀 지표는 tolerance={tolerance} 기준)"
+            )
+
+        self.collector = collector
+        self.bus = bus
+        self.schema = schema
+        self.tolerance = tolerance
+        self.history = max(history, required)
+        self.max_history = max_history if max_history is not None else required
+        self.frames = {}   # symbol → 마감 캔들 DataFrame
+
+    def seed(self, symbol, df):
+        """
+        이력 미리 채우기 (최근 max_history개만 보관, 거래소에서 처음부터 받지 않음)
+
+        Args:
+            symbol: 심볼
+            df: 마감된 OHLCV 데이터프레임
+        """
+        df = df[['timestamp'] + CANDLE_FIELDS].reset_index(drop=True)
+        df['timestamp'] = to_epoch_ms(df['timestamp'].values)
+        self.frames[symbol] = self._trim(df)
+
+    def _trim(self, df):
+        if self.max_history is not None and len(df) > self.max_history:
+            df = df.iloc[-self.max_history:].reset_index(drop=True)
+        return df
+
+    def poll(self):
+        """
+        모든 심볼의 새 마감 캔들을 이력에 붙이고 발행
+
+        Returns:
+            {symbol: 발행한 행 수}
+        """
+        published = {}
+        for symbol in self.bus.symbols:
+            frame = self.frames.get(symbol)
+
+            if frame is None or len(frame) == 0:
+                ohlcv = self.collector.exchange.fetch_ohlcv(
+                    symbol=symbol,
+                    timeframe=self.collector.timeframe,
+                    limit=self.history + 1
+                )
+            else:
+                # 마지막 이력 이후만
+                ohlcv = self.collector.exchange.fetch_ohlcv(
+                    symbol=symbol,
+                    timeframe=self.collector.timeframe,
+                    since=int(frame['timestamp'].iloc[-1]) + 1
+                )
+
+            df = pd.DataFrame(ohlcv, columns=['timestamp'] + CANDLE_FIELDS)
+
+            # 마지막 캔들은 아직 진행 중 → 마감된 캔들만
+            df = df.iloc[:-1]
+
+            if frame is not None and len(frame):
+                df = df[df['timestamp'] > frame['timestamp'].iloc[-1]]
+                if len(df) == 0:
+                    published[symbol] = 0
+                    continue
+                df = pd.concat([frame, df], ignore_index=True)
+
+            frame = self.frames[symbol] = self._trim(df.reset_index(drop=True))
+
+            features = self.schema.compute(frame) if self.schema is not None else None
+            published[symbol] = self.bus.publish_frame(symbol, frame, features)
+
+        return published
+
+    def run(self, interval=10.0):
+        """주기적으로 poll (Ctrl+C로 중지)"""
+        print(f"🔄 발행 시작: {len(self.bus.symbols)}개 심볼, {interval}초 주기")
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    published = self.poll()
+                    total = sum(published.values())
+                    if total:
+                        print(f"   📡 {total}개 캔들 발행")
+                except Exception as e:
+                    print(f"   ❌ 발행 실패: {e}")
+                time.sleep(max(interval - (time.monotonic() - started), 0))
+        except KeyboardInterrupt:
+            print(f"\n⚠️  발행 중지")
+
+
+def _reader(name, symbol, num_reads, results):
+    """읽는 프로세스 예시: 최근 50개 종가 평균 (복사 없음)"""
+    bus = MarketDataBus.attach(name)
+    ring = bus.channel(symbol)
+    close = bus.field('close')
+
+    started = time.perf_counter()
+    total = 0.0
+    for _ in range(num_reads):
+        first_seq, _, values = ring.window(50)
+        total += float(values[:, close].mean())
+    elapsed = time.perf_counter() - started
+
+    shares = np.shares_memory(values, ring.values)
+    results.put((os.getpid(), elapsed / num_reads * 1e6, shares, ring.is_valid(first_seq)))
+
+    del values
+    bus.close()
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import multiprocessing as mp
+
+    import pandas as pd
+
+    from features.indicators import FeatureSchema
+
+    print("=" * 60)
+    print("🚀 공유 메모리 데이터 버스 V0.1")
+    print("=" * 60)
+
+    df = pd.read_csv(os.path.join(PROJECT_ROOT, 'btc_1h_data.csv'))
+    schema = FeatureSchema.moving_averages()
+    features = schema.compute(df)
+
+    name = f"ctb_{os.getpid()}"
+    symbols = ['BTC/USDT', 'ETH/USDT']
+
+    with MarketDataBus.create(name, symbols, fields=CANDLE_FIELDS + schema.names, capacity=512) as bus:
+        count = bus.publish_frame('BTC/USDT', df, features)
+        print(f"\n   발행: {count}개 (용량 512, 마지막 seq {bus.channel('BTC/USDT').last_seq})")
+
+        ctx = mp.get_context('spawn')
+        results = ctx.Queue()
+        readers = [ctx.Process(target=_reader, args=(name, 'BTC/USDT', 10_000, results)) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+
+        for _ in readers:
+            pid, micros, shares, valid = results.get()
+            print(f"   읽기 프로세스 {pid}: {micros:.2f}µs/읽기, 메모리 공유 {shares}, 유효 {valid}")
+
+        seq, timestamp, row = bus.channel('BTC/USDT').latest()
+        print(f"\n   최신: seq {seq}, {pd.to_datetime(timestamp, unit='ms')}, "
+              f"close {row[bus.field('close')]:,.2f}, ma20 {row[bus.field('ma20')]:,.2f}")
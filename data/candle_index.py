@@ -0,0 +1,260 @@
+import numpy as np
+import pandas as pd
+
+
+# 시간봉 단위 → 밀리초
+TIMEFRAME_UNITS = {
+    's': 1000,
+    'm': 60 * 1000,
+    'h': 60 * 60 * 1000,
+    'd': 24 * 60 * 60 * 1000,
+    'w': 7 * 24 * 60 * 60 * 1000,
+}
+
+# 달력 단위 (월/년): 간격이 일정하지 않음 → 누락 검출 안 함
+CALENDAR_UNITS = {'M', 'y'}
+
+
+def is_calendar_timeframe(timeframe):
+    """'1M', '1y'처럼 캔들 간격이 일정하지 않은 시간봉인지"""
+    return timeframe[-1] in CALENDAR_UNITS
+
+
+def timeframe_to_ms(timeframe):
+    """
+    시간봉 문자열을 밀리초로 변환
+
+    Args:
+        timeframe: '1s', '1m', '5m', '1h', '1d' 등
+
+    Returns:
+        캔들 간격 (밀리초)
+    """
+    unit = timeframe[-1]
+    if unit in CALENDAR_UNITS:
+        raise ValueError(f"간격이 일정하지 않은 시간봉: {timeframe}")
+    if unit not in TIMEFRAME_UNITS:
+        raise ValueError(f"지원하지 않는 시간봉: {timeframe}")
+    return int(timeframe[:-1]) * TIMEFRAME_UNITS[unit]
+
+
+def to_epoch_ms(timestamps):
+    """
+    타임스탬프 컬럼(문자열, datetime, 밀리초 정수)을 int64 밀리초 배열로 변환
+    """
+    values = np.asarray(timestamps)
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64, copy=False)
+    values = pd.to_datetime(values).values
+    return values.astype('datetime64[ms]').astype(np.int64)
+
+
+class GapReport:
+    """
+    시계열 하나의 검증 결과
+
+    - missing: 누락 구간 [(시작ms, 끝ms, 개수), ...] (양 끝 포함)
+    - duplicates: 중복 타임스탬프 위치 (원본 인덱스)
+    - out_of_order: 이전 캔들보다 과거인 캔들 위치 (원본 인덱스)
+    """
+
+    def __init__(self, key, timeframe, start, end, num_candles,
+                 missing, duplicates, out_of_order):
+        self.key = key
+        self.timeframe = timeframe
+        self.start = start
+        self.end = end
+        self.num_candles = num_candles
+        self.missing = missing
+        self.duplicates = duplicates
+        self.out_of_order = out_of_order
+
+    @property
+    def num_missing(self):
+        """누락된 캔들 총 개수"""
+        return int(sum(count for _, _, count in self.missing))
+
+    @property
+    def is_clean(self):
+        """누락/중복/역순이 하나도 없는지"""
+        return (
+            len(self.missing) == 0
+            and len(self.duplicates) == 0
+            and len(self.out_of_order) == 0
+        )
+
+    def to_dict(self):
+        return {
+            'key': self.key,
+            'timeframe': self.timeframe,
+            'start': self.start,
+            'end': self.end,
+            'num_candles': self.num_candles,
+            'num_missing': self.num_missing,
+            'missing': list(self.missing),
+            'duplicates': self.duplicates.tolist(),
+            'out_of_order': self.out_of_order.tolist(),
+        }
+
+
+class CandleIndex:
+    """
+    저장된 캔들 시계열의 타임스탬프 인덱스
+
+    누락/중복/역순 캔들을 벡터 연산 O(n)으로 검출하고,
+    시계열별 검증 결과(GapReport)를 보관
+    """
+
+    def __init__(self, timeframe='1h'):
+        """
+        초기화
+
+        Args:
+            timeframe: 시간 단위 (1m, 5m, 1h, 1d 등, 1M/1y는 중복/역순만 검사)
+        """
+        self.timeframe = timeframe
+        self.step = None if is_calendar_timeframe(timeframe) else timeframe_to_ms(timeframe)
+        self.reports = {}  # key → GapReport
+
+    def validate(self, timestamps, key='default'):
+        """
+        타임스탬프 배열 검증
+
+        Args:
+            timestamps: 캔들 타임스탬프 (원본 순서)
+            key: 시계열 이름 (예: 'binance:BTC/USDT:1h')
+
+        Returns:
+            GapReport
+        """
+        ts = to_epoch_ms(timestamps)
+
+        if len(ts) == 0:
+            report = GapReport(key, self.timeframe, None, None, 0, [],
+                               np.empty(0, dtype=np.int64),
+                               np.empty(0, dtype=np.int64))
+            self.reports[key] = report
+            return report
+
+        # 역순: 직전 캔들보다 과거인 캔들
+        out_of_order = np.flatnonzero(ts[1:] < ts[:-1]) + 1
+
+        # 정렬 후 중복/누락 판단
+        order = np.argsort(ts, kind='stable')
+        sorted_ts = ts[order]
+        diffs = np.diff(sorted_ts)
+
+        duplicates = np.sort(order[1:][diffs == 0])
+
+        missing = []
+        if self.step is not None:
+            gap_pos = np.flatnonzero(diffs > self.step)
+            gap_start = sorted_ts[gap_pos] + self.step
+            gap_end = sorted_ts[gap_pos + 1] - self.step
+            gap_count = diffs[gap_pos] // self.step - 1
+            missing = [
+                (int(s), int(e), int(c))
+                for s, e, c in zip(gap_start, gap_end, gap_count)
+                if c > 0
+            ]
+
+        report = GapReport(
+            key=key,
+            timeframe=self.timeframe,
+            start=int(sorted_ts[0]),
+            end=int(sorted_ts[-1]),
+            num_candles=len(ts),
+            missing=missing,
+            duplicates=duplicates,
+            out_of_order=out_of_order
+        )
+        self.reports[key] = report
+
+        return report
+
+    def validate_frame(self, df, key='default'):
+        """
+        OHLCV 데이터프레임 검증 ('timestamp' 컬럼 사용)
+        """
+        return self.validate(df['timestamp'].values, key=key)
+
+    def clean(self, df):
+        """
+        정렬 + 중복 제거 (같은 타임스탬프는 마지막 캔들 유지)
+
+        Returns:
+            정리된 DataFrame (원본 timestamp 형식 유지)
+        """
+        ts = to_epoch_ms(df['timestamp'].values)
+        order = np.argsort(ts, kind='stable')
+        sorted_ts = ts[order]
+
+        # 같은 타임스탬프 묶음의 마지막 위치만 남김
+        keep = np.ones(len(sorted_ts), dtype=bool)
+        keep[:-1] = sorted_ts[1:] != sorted_ts[:-1]
+
+        return df.iloc[order[keep]].reset_index(drop=True)
+
+    def print_report(self, key='default'):
+        """검증 리포트 출력"""
+        report = self.reports[key]
+
+        print(f"\n" + "=" * 60)
+        print(f"🔍 캔들 검증 리포트: {report.key}")
+        print(f"=" * 60)
+        print(f"   시간봉: {report.timeframe}")
+        print(f"   캔들 수: {report.num_candles}개")
+
+        if report.num_candles > 0:
+            start = pd.to_datetime(report.start, unit='ms')
+            end = pd.to_datetime(report.end, unit='ms')
+            print(f"   기간: {start} ~ {end}")
+
+        print(f"   누락 구간: {len(report.missing)}개 ({report.num_missing}개 캔들)")
+        print(f"   중복: {len(report.duplicates)}개")
+        print(f"   역순: {len(report.out_of_order)}개")
+
+        for start, end, count in report.missing[:10]:
+            print(f"   ⚠️  {pd.to_datetime(start, unit='ms')} ~ "
+                  f"{pd.to_datetime(end, unit='ms')} ({count}개)")
+        if len(report.missing) > 10:
+            print(f"   ... 외 {len(report.missing) - 10}개 구간")
+
+        status = "정상 ✅" if report.is_clean else "문제 발견 ❌"
+        print(f"\n   상태: {status}")
+        print(f"=" * 60)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import os
+    import time
+
+    print("=" * 60)
+    print("🚀 캔들 검증기 V0.1")
+    print("=" * 60)
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    df = pd.read_csv(os.path.join(project_root, 'btc_1h_data.csv'))
+
+    index = CandleIndex(timeframe='1h')
+    index.validate_frame(df, key='BTC/USDT:1h')
+    index.print_report('BTC/USDT:1h')
+
+    # 인위적으로 누락/중복/역순 생성
+    broken = pd.concat([df.iloc[:100], df.iloc[120:500], df.iloc[499:500], df.iloc[[700]], df.iloc[500:700]])
+    index.validate_frame(broken, key='broken')
+    index.print_report('broken')
+
+    cleaned = index.clean(broken)
+    print(f"\n정리 후: {len(broken)} → {len(cleaned)}개")
+
+    # 대용량 성능 (5년치 1분봉)
+    n = 5 * 365 * 24 * 60
+    ts = np.arange(n, dtype=np.int64) * 60_000
+    ts = np.delete(ts, np.arange(1000, n, 50_000))
+
+    start = time.perf_counter()
+    big = CandleIndex(timeframe='1m').validate(ts, key='5y-1m')
+    elapsed = time.perf_counter() - start
+    print(f"\n⏱️  {len(ts):,}개 캔들 검증: {elapsed:.3f}초 (누락 {big.num_missing}개)")
@@ -1,7 +1,16 @@
 import ccxt
 import pandas as pd
+import sys
+import os
 from datetime import datetime
 
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from data.candle_index import CandleIndex, to_epoch_ms
+from data.ticker import TickerService
+
 class DataCollector:
     """
     암호화폐 거래소에서 과거 가격 데이터 수집
@@ -22,6 +31,12 @@ class DataCollector:
         self.symbol = symbol
         self.timeframe = timeframe
         
+        # 시계열별 누락/중복 검증 결과
+        self.index = CandleIndex(timeframe=timeframe)
+        
+        # 배치 시세 서비스 (start_ticker_service 후 사용)
+        self.tickers = None
+        
         # 거래소 객체 생성
         try:
             self.exchange = getattr(ccxt, exchange)()
@@ -30,26 +45,29 @@ class DataCollector:
             print(f"❌ 거래소 연결 실패: {e}")
             raise
     
-    def fetch_ohlcv(self, limit=1000):
+    def fetch_ohlcv(self, limit=1000, symbol=None):
         """
         OHLCV 데이터 수집
         
         Args:
             limit: 가져올 캔들 개수 (최대 1000)
+            symbol: 거래 쌍 (기본: 현재 심볼, 교차 자산 유니버스 수집용)
         
         Returns:
             pandas DataFrame [timestamp, open, high, low, close, volume]
         """
+        symbol = symbol or self.symbol
+        
         print(f"\n📊 데이터 수집 중...")
         print(f"   거래소: {self.exchange_name}")
-        print(f"   심볼: {self.symbol}")
+        print(f"   심볼: {symbol}")
         print(f"   시간봉: {self.timeframe}")
         print(f"   개수: {limit}개")
         
         try:
             # API 호출
             ohlcv = self.exchange.fetch_ohlcv(
-                symbol=self.symbol,
+                symbol=symbol,
                 timeframe=self.timeframe,
                 limit=limit
             )
@@ -85,12 +103,160 @@ class DataCollector:
             print(f"❌ 데이터 수집 실패: {e}")
             raise
     
-    def get_latest_price(self):
+    def series_key(self):
+        """
+        검증 리포트용 시계열 이름 (거래소:심볼:시간봉)
+        """
+        return f"{self.exchange_name}:{self.symbol}:{self.timeframe}"
+    
+    def fetch_range(self, since, until, batch_limit=1000):
+        """
+        지정 구간의 캔들만 수집
+        
+        Args:
+            since: 시작 시각 (밀리초, 포함)
+            until: 끝 시각 (밀리초, 포함)
+            batch_limit: API 호출당 최대 캔들 개수
+        
+        Returns:
+            pandas DataFrame [timestamp, open, high, low, close, volume]
+        """
+        step = self.index.step
+        rows = []
+        cursor = since
+        
+        while cursor <= until:
+            # 달력 시간봉(1M 등)은 간격을 모르므로 batch_limit만큼 받고 시각으로 자름
+            limit = batch_limit if step is None else min(batch_limit, (until - cursor) // step + 1)
+            ohlcv = self.exchange.fetch_ohlcv(
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                since=cursor,
+                limit=limit
+            )
+            
+            if not ohlcv:
+                break
+            
+            rows.extend(c for c in ohlcv if c[0] <= until)
+            cursor = ohlcv[-1][0] + (step or 1)
+        
+        df = pd.DataFrame(
+            rows,
+            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        )
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        return df
+    
+    def validate(self, df):
+        """
+        저장된 캔들의 누락/중복/역순 검증
+        
+        Returns:
+            GapReport
+        """
+        report = self.index.validate_frame(df, key=self.series_key())
+        self.index.print_report(self.series_key())
+        return report
+    
+    def repair_gaps(self, df):
+        """
+        누락 구간만 골라서 다시 수집하고 중복/역순 정리
+        
+        전체를 다시 받지 않고 빠진 구간만 요청
+        
+        Args:
+            df: 저장된 OHLCV 데이터프레임
+        
+        Returns:
+            정리된 DataFrame, 복구 후 GapReport
+        """
+        key = self.series_key()
+        report = self.index.validate_frame(df, key=key)
+        
+        print(f"\n🔧 캔들 복구 중...")
+        print(f"   누락 구간: {len(report.missing)}개 ({report.num_missing}개 캔들)")
+        print(f"   중복: {len(report.duplicates)}개, 역순: {len(report.out_of_order)}개")
+        
+        if report.is_clean:
+            print(f"   ✅ 복구할 것 없음")
+            return df, report
+        
+        frames = [df]
+        for since, until, count in report.missing:
+            try:
+                patch = self.fetch_range(since, until)
+                frames.append(patch)
+                print(f"   ✅ {pd.to_datetime(since, unit='ms')}: "
+                      f"{len(patch)}/{count}개 복구")
+            except Exception as e:
+                print(f"   ❌ 구간 복구 실패 ({pd.to_datetime(since, unit='ms')}): {e}")
+        
+        merged = pd.concat(frames, ignore_index=True)
+        # 저장본(문자열)과 수집본(datetime) 형식 통일
+        merged['timestamp'] = pd.to_datetime(to_epoch_ms(merged['timestamp'].values), unit='ms')
+        repaired = self.index.clean(merged)
+        
+        # 거래소에도 없는 구간(점검 등)은 리포트에 남음
+        after = self.index.validate_frame(repaired, key=key)
+        print(f"   ✅ 복구 완료: 남은 누락 {after.num_missing}개")
+        
+        return repaired, after
+    
+    def start_ticker_service(self, symbols=None, interval=1.0, ttl=5.0, exchange=None):
+        """
+        여러 심볼 시세를 백그라운드에서 한 번에 갱신
+        
+        동기 ccxt 객체는 스레드 간 공유가 안전하지 않으므로
+        시세 스레드는 별도 거래소 객체를 사용
+        
+        Args:
+            symbols: 구독할 거래 쌍 (기본: 현재 심볼)
+            interval: 갱신 주기 (초)
+            ttl: 시세 유효 시간 (초)
+            exchange: 시세 스레드 전용 거래소 객체 (기본: 같은 거래소로 새로 생성)
+        
+        Returns:
+            TickerService
+        """
+        # 이미 실행 중이면 먼저 중지
+        self.stop_ticker_service()
+        
+        if exchange is None:
+            exchange = getattr(ccxt, self.exchange_name)()
+        
+        self.tickers = TickerService(
+            exchange,
+            symbols=symbols or [self.symbol],
+            interval=interval,
+            ttl=ttl
+        )
+        self.tickers.subscribe(self.symbol)
+        return self.tickers.start()
+    
+    def stop_ticker_service(self):
+        """시세 서비스 중지"""
+        if self.tickers is not None:
+            self.tickers.stop()
+            self.tickers = None
+    
+    def get_latest_price(self, symbol=None):
         """
         현재 가격 조회
+        
+        시세 서비스가 켜져 있으면 스냅샷에서 바로 읽고,
+        아니면 fetch_ticker 한 번 호출
         """
+        symbol = symbol or self.symbol
+        
+        if self.tickers is not None:
+            price = self.tickers.price(symbol)
+            if price is not None:
+                return price
+        
         try:
-            ticker = self.exchange.fetch_ticker(self.symbol)
+            ticker = self.exchange.fetch_ticker(symbol)
             return ticker['last']
         except Exception as e:
             print(f"❌ 가격 조회 실패: {e}")
@@ -125,7 +291,10 @@ if __name__ == "__main__":
     # 3. 과거 데이터 수집
     df = collector.fetch_ohlcv(limit=1000)
     
-    # 4. CSV 저장
+    # 4. 누락 구간 복구
+    df, report = collector.repair_gaps(df)
+    
+    # 5. CSV 저장
     collector.save_to_csv(df, 'btc_1h_data.csv')
     
     print("\n✅ 모든 작업 완료!")
\ No newline at end of file
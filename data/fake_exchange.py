@@ -0,0 +1,66 @@
+import time
+
+import numpy as np
+
+
+class FakeExchange:
+    """
+    테스트용 로컬 가짜 거래소 (ccxt 인터페이스 일부)
+
+    - fetch_ticker / fetch_tickers: 랜덤 워크 가격
+    - fetch_ohlcv: 메모리에 있는 캔들에서 since/limit 만큼
+    - latency: 호출당 지연 (네트워크 왕복 흉내)
+    - calls: 메서드별 호출 횟수
+    """
+
+    def __init__(self, symbols=('BTC/USDT',), latency=0.0, ohlcv=None, seed=0):
+        """
+        초기화
+
+        Args:
+            symbols: 거래 쌍 리스트
+            latency: 호출당 지연 (초)
+            ohlcv: {symbol: [[ts, o, h, l, c, v], ...]} 캔들 데이터
+            seed: 난수 시드
+        """
+        self.symbols = list(symbols)
+        self.latency = latency
+        self.ohlcv = ohlcv or {}
+        self.rng = np.random.default_rng(seed)
+        self.prices = {symbol: 100.0 * (i + 1) for i, symbol in enumerate(self.symbols)}
+        self.calls = {'fetch_ticker': 0, 'fetch_tickers': 0, 'fetch_ohlcv': 0}
+        self.has = {'fetchTickers': True, 'fetchOHLCV': True}
+
+    def _wait(self, name):
+        self.calls[name] += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def _tick(self, symbol):
+        if symbol not in self.prices:
+            raise KeyError(f"없는 심볼: {symbol}")
+        self.prices[symbol] *= 1 + self.rng.normal(0, 0.001)
+        last = self.prices[symbol]
+        return {
+            'symbol': symbol,
+            'timestamp': int(time.time() * 1000),
+            'last': last,
+            'bid': last * 0.9999,
+            'ask': last * 1.0001,
+        }
+
+    def fetch_ticker(self, symbol):
+        self._wait('fetch_ticker')
+        return self._tick(symbol)
+
+    def fetch_tickers(self, symbols=None):
+        self._wait('fetch_tickers')
+        symbols = self.symbols if symbols is None else symbols
+        return {symbol: self._tick(symbol) for symbol in symbols}
+
+    def fetch_ohlcv(self, symbol, timeframe='1h', since=None, limit=1000):
+        self._wait('fetch_ohlcv')
+        candles = self.ohlcv.get(symbol, [])
+        if since is not None:
+            candles = [c for c in candles if c[0] >= since]
+        return candles[:limit]
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import namedtuple
+
+
+# 심볼 1개의 최신 시세
+Quote = namedtuple('Quote', ['symbol', 'last', 'bid', 'ask', 'timestamp', 'received_at'])
+
+
+class TickerService:
+    """
+    구독한 심볼 전체의 시세를 한 번의 fetch_tickers로 갱신하는 서비스
+
+    - 백그라운드 스레드가 interval마다 갱신
+    - 갱신할 때마다 새 dict를 만들어 참조만 교체 → 읽기는 잠금 없는 dict 조회
+    - ttl보다 오래된 시세는 None
+    """
+
+    def __init__(self, exchange, symbols=(), interval=1.0, ttl=5.0):
+        """
+        초기화
+
+        Args:
+            exchange: ccxt 거래소 객체 (또는 FakeExchange)
+            symbols: 구독할 거래 쌍 리스트
+            interval: 갱신 주기 (초)
+            ttl: 시세 유효 시간 (초)
+        """
+        self.exchange = exchange
+        self.symbols = list(dict.fromkeys(symbols))
+        self.interval = interval
+        self.ttl = ttl
+
+        self.snapshot = {}  # symbol → Quote (통째로 교체)
+
+        self.refresh_count = 0
+        self.error_count = 0
+        self.last_latency = None
+        self.last_error = None
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, *symbols):
+        """구독 추가 (다음 갱신부터 반영)"""
+        self.symbols = list(dict.fromkeys(self.symbols + list(symbols)))
+
+    def unsubscribe(self, *symbols):
+        """구독 해제"""
+        self.symbols = [s for s in self.symbols if s not in symbols]
+        self.snapshot = {s: q for s, q in self.snapshot.items() if s not in symbols}
+
+    def _fetch(self, symbols):
+        """배치 조회 (fetchTickers 미지원 거래소는 심볼별 조회)"""
+        has = getattr(self.exchange, 'has', {}) or {}
+        if has.get('fetchTickers', True):
+            return self.exchange.fetch_tickers(symbols)
+        return {symbol: self.exchange.fetch_ticker(symbol) for symbol in symbols}
+
+    def refresh(self):
+        """
+        구독 심볼 전체를 한 번에 갱신
+
+        Returns:
+            갱신된 심볼 개수
+        """
+        symbols = self.symbols
+        if not symbols:
+            return 0
+
+        start = time.monotonic()
+        try:
+            tickers = self._fetch(symbols)
+        except Exception as e:
+            self.error_count += 1
+            self.last_error = e
+            print(f"❌ 시세 갱신 실패: {e}")
+            return 0
+
+        received_at = time.monotonic()
+        snapshot = dict(self.snapshot)
+        for symbol in symbols:
+            ticker = tickers.get(symbol)
+            if ticker is None or ticker.get('last') is None:
+                continue
+            snapshot[symbol] = Quote(
+                symbol=symbol,
+                last=ticker['last'],
+                bid=ticker.get('bid'),
+                ask=ticker.get('ask'),
+                timestamp=ticker.get('timestamp'),
+                received_at=received_at
+            )
+
+        # 참조 교체 (읽는 쪽은 이전 또는 새 dict 중 하나를 온전히 봄)
+        self.snapshot = snapshot
+        self.refresh_count += 1
+        self.last_latency = received_at - start
+
+        return len(tickers)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.refresh()
+            self._stop.wait(max(self.interval - (time.monotonic() - started), 0))
+
+    def start(self):
+        """백그라운드 갱신 시작 (첫 갱신은 바로 실행)"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ticker-service', daemon=True)
+        self._thread.start()
+
+        print(f"✅ 시세 서비스 시작: {len(self.symbols)}개 심볼, {self.interval}초 주기")
+        return self
+
+    def stop(self):
+        """백그라운드 갱신 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def get(self, symbol, ttl=None):
+        """
+        최신 시세 (잠금 없음)
+
+        Returns:
+            Quote 또는 None (없거나 ttl 초과)
+        """
+        quote = self.snapshot.get(symbol)
+        if quote is None:
+            return None
+
+        ttl = self.ttl if ttl is None else ttl
+        if time.monotonic() - quote.received_at > ttl:
+            return None
+
+        return quote
+
+    def price(self, symbol, ttl=None):
+        """최신 가격 (없거나 오래되면 None)"""
+        quote = self.get(symbol, ttl=ttl)
+        return quote.last if quote is not None else None
+
+    def age(self, symbol):
+        """마지막 갱신 후 경과 시간 (초)"""
+        quote = self.snapshot.get(symbol)
+        return None if quote is None else time.monotonic() - quote.received_at
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from data.fake_exchange import FakeExchange
+
+    print("=" * 60)
+    print("🚀 시세 서비스 V0.1 (가짜 거래소)")
+    print("=" * 60)
+
+    symbols = [f'COIN{i}/USDT' for i in range(200)]
+    exchange = FakeExchange(symbols, latency=0.05)
+
+    # 기존 방식: 심볼별 fetch_ticker
+    start = time.perf_counter()
+    for symbol in symbols[:20]:
+        exchange.fetch_ticker(symbol)
+    per_call = (time.perf_counter() - start) / 20
+    print(f"\n   심볼별 조회: {per_call * 1000:.1f}ms × {len(symbols)}개 = {per_call * len(symbols):.1f}초/틱")
+
+    with TickerService(exchange, symbols, interval=0.2, ttl=1.0) as service:
+        time.sleep(1.0)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            for symbol in symbols:
+                service.price(symbol)
+        read_us = (time.perf_counter() - start) / (100 * len(symbols)) * 1e6
+
+        print(f"   배치 갱신: {service.last_latency * 1000:.1f}ms (갱신 {service.refresh_count}회, "
+              f"fetch_tickers 호출 {exchange.calls['fetch_tickers']}회)")
+        print(f"   읽기: {read_us:.2f}µs/심볼")
+        print(f"   {symbols[0]}: ${service.price(symbols[0]):,.2f} ({service.age(symbols[0]):.2f}초 전)")
+
+    time.sleep(1.1)
+    print(f"   중지 후 ttl 초과: {service.price(symbols[0])}")
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.indicators import FeatureSchema
+
+
+def forward_returns(close, horizons, out=None):
+    """
+    여러 기간의 미래 수익률 행렬 (N, H)
+    
+    Y[t, j] = close[t + h_j] / close[t] - 1, 미래 데이터가 없는 끝부분은 NaN
+    
+    Args:
+        close: (N,) 종가
+        horizons: 캔들 수 리스트 (예: [1, 4, 24])
+        out: 결과를 기록할 (N, H) 배열 (없으면 float32로 생성)
+    """
+    n = len(close)
+    if out is None:
+        out = np.empty((n, len(horizons)), dtype=np.float32)
+    
+    for j, h in enumerate(horizons):
+        column = out[:, j]
+        column[max(n - h, 0):] = np.nan
+        if n > h:
+            np.divide(close[h:], close[:-h], out=column[:-h])
+            column[:-h] -= 1
+    
+    return out
+
+
+class FeatureArrays:
+    """
+    복사 없는 피처 생성 (float32 연속 배열)
+
+    TechnicalFeatures와 같은 피처/레이블을 만들지만
+    - DataFrame 복사 / dropna 없음
+    - 처음부터 float32 (N, F) 배열 하나에 바로 기록
+    - 유효 구간은 [start, stop) 오프셋으로 표시 (행 삭제 대신)
+
+    valid()가 돌려주는 배열은 torch.from_numpy로 복사 없이 텐서가 됨
+    """
+
+    def __init__(self, df, periods=[5, 20, 50], schema=None, horizons=None, universe=None):
+        """
+        초기화
+
+        Args:
+            df: OHLCV 데이터프레임 (복사하지 않음)
+            periods: 이동평균 기간 리스트 (schema가 없을 때)
+            schema: FeatureSchema (없으면 이동평균 기본 피처)
+            horizons: 미래 수익률 기간 리스트 (예: [1, 4, 24])
+                      주면 레이블이 (N, H) 행렬
+            universe: 교차 자산 지표('cross_asset')용 {symbol: OHLCV 데이터프레임}
+        """
+        self.df = df
+        self.schema = schema or FeatureSchema.moving_averages(periods)
+        self.horizons = sorted(horizons) if horizons else None
+        self.universe = universe
+
+        # 유효 구간: 모든 지표가 채워진 시점 ~ 가장 먼 미래 가격이 있는 시점
+        self.start = self.schema.warmup
+        self.stop = len(df) - (self.horizons[-1] if self.horizons else 1)
+
+        self.close = np.ascontiguousarray(df['close'].to_numpy(dtype=np.float32))
+        self.feature_names = self.schema.names
+
+        self.X = None
+        self.y = None
+
+        print(f"📊 입력 데이터: {len(df)}개 캔들 (float32)")
+
+    def compute(self):
+        """
+        피처 행렬 X (N, F)와 레이블 y (N,) 또는 (N, H) 계산
+
+        유효 구간 밖의 값은 NaN
+        """
+        n = len(self.close)
+
+        self.X = np.empty((n, self.schema.num_features), dtype=np.float32)
+
+        # 지표: 공유 중간값(누적합/EMA)을 한 번만 계산해서 X 열에 바로 기록
+        self.schema.compute(self.df, out=self.X, universe=self.universe)
+
+        # 레이블: 미래 수익률 (기본은 다음 캔들 1개)
+        if self.horizons:
+            self.y = forward_returns(self.close, self.horizons)
+        else:
+            self.y = np.empty(n, dtype=np.float32)
+            forward_returns(self.close, [1], out=self.y[:, None])
+
+        print(f"✅ 피처 계산 완료: {self.feature_names}")
+        print(f"   유효 구간: [{self.start}, {self.stop}) → {self.num_samples}개 샘플")
+
+        return self.X, self.y
+
+    @property
+    def num_samples(self):
+        return max(self.stop - self.start, 0)
+
+    def valid(self):
+        """
+        유효 구간 뷰 (복사 없음, C-연속)
+
+        Returns:
+            X (features), y (labels, horizons가 있으면 (N, H))
+        """
+        if self.X is None:
+            self.compute()
+
+        return self.X[self.start:self.stop], self.y[self.start:self.stop]
+
+    def column(self, name):
+        """
+        원본 컬럼의 유효 구간 (예: 'close', 'timestamp')
+        """
+        return self.df[name].to_numpy()[self.start:self.stop]
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    from features.technical import TechnicalFeatures
+
+    print("=" * 60)
+    print("🚀 복사 없는 피처 생성기 V0.1")
+    print("=" * 60)
+
+    df = pd.read_csv(os.path.join(PROJECT_ROOT, 'btc_1h_data.csv'))
+
+    arrays = FeatureArrays(df)
+    X, y = arrays.valid()
+
+    print(f"\n   X: {X.shape} {X.dtype}, C-연속: {X.flags['C_CONTIGUOUS']}")
+    print(f"   y: {y.shape} {y.dtype}, C-연속: {y.flags['C_CONTIGUOUS']}")
+
+    # 기존 경로와 비교
+    tech = TechnicalFeatures(df)
+    tech.add_moving_averages()
+    tech.add_momentum_features()
+    tech.add_labels()
+    X_ref, y_ref = tech.get_features_and_labels()
+
+    print(f"\n   최대 차이 X: {np.abs(X - X_ref).max():.6f}")
+    print(f"   최대 차이 y: {np.abs(y - y_ref).max():.2e}")
@@ -0,0 +1,330 @@
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from data.candle_index import to_epoch_ms
+
+
+def align_closes(frames, timestamps=None):
+    """
+    심볼별 OHLCV를 같은 시각 축으로 정렬 (타임스탬프 형식이 달라도 밀리초로 통일)
+
+    Args:
+        frames: {symbol: DataFrame (timestamp, close)}
+        timestamps: 기준 시각 (없으면 모든 심볼에 공통인 시각)
+
+    Returns:
+        timestamps (T,) 밀리초, close (T, A) - 빠진 캔들은 직전 종가로 채움
+    """
+    series = {}
+    for symbol, df in frames.items():
+        s = pd.Series(df['close'].to_numpy(dtype=np.float64), index=to_epoch_ms(df['timestamp'].values))
+        series[symbol] = s[~s.index.duplicated(keep='last')].sort_index()
+
+    if timestamps is None:
+        index = None
+        for s in series.values():
+            index = s.index if index is None else index.intersection(s.index)
+        timestamps = index.sort_values()
+    timestamps = pd.Index(to_epoch_ms(np.asarray(timestamps)))
+
+    close = np.empty((len(timestamps), len(series)), dtype=np.float64)
+    for j, s in enumerate(series.values()):
+        close[:, j] = s.reindex(s.index.union(timestamps)).ffill().reindex(timestamps).to_numpy()
+
+    return timestamps.to_numpy(), close
+
+
+def log_returns(close):
+    """
+    로그 수익률 (T, A), 첫 행과 결측은 0 (가격 변화 없음으로 처리)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    returns = np.zeros_like(close)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[1:] = np.log(close[1:] / close[:-1])
+    return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _corr_from_cov(cov):
+    std = np.sqrt(np.maximum(np.diagonal(cov, axis1=-2, axis2=-1), 0.0))
+    denom = std[..., :, None] * std[..., None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denom > 0, cov / denom, np.nan)
+
+
+def _mean_offdiag(corr):
+    A = corr.shape[-1]
+    if A < 2:
+        return np.full(corr.shape[:-2], np.nan)
+    total = np.nansum(corr, axis=(-2, -1)) - np.trace(np.nan_to_num(corr), axis1=-2, axis2=-1)
+    return total / (A * (A - 1))
+
+
+class RollingCrossAsset:
+    """
+    실시간 교차 자산 피처 (유니버스 전체, 캔들마다 O(A²) 갱신)
+
+    창 안 로그 수익률의 합(A,)과 외적 합(A, A)을 누적 유지:
+        새 캔들: + r_t, + r_t r_tᵀ
+        빠지는 캔들: - r_{t-W}, - r_{t-W} r_{t-W}ᵀ
+
+    - corr(): 쌍별 상관계수 (A, A)
+    - beta(): 기준 자산(BTC) 대비 베타 (A,)
+    - dispersion(): 최근 캔들 수익률의 단면 표준편차
+    - mean_corr(): 평균 쌍별 상관계수
+
+    누적 오차는 resync 캔들마다 창 버퍼에서 다시 합산해서 제거
+    """
+
+    def __init__(self, symbols, window=168, benchmark=None, resync=None):
+        """
+        초기화
+
+        Args:
+            symbols: 심볼 리스트 (열 순서)
+            window: 롤링 기간 (캔들 수)
+            benchmark: 기준 심볼 (기본: 첫 번째)
+            resync: 다시 합산하는 주기 (기본: window × 10)
+        """
+        self.symbols = list(symbols)
+        self.window = window
+        self.benchmark = self.symbols.index(benchmark) if benchmark is not None else 0
+        self.resync = resync or window * 10
+
+        A = len(self.symbols)
+        self.buffer = np.zeros((window, A), dtype=np.float64)
+        self.sum = np.zeros(A, dtype=np.float64)
+        self.outer = np.zeros((A, A), dtype=np.float64)
+
+        self.head = 0       # 다음에 쓸 버퍼 위치
+        self.count = 0      # 누적 수익률 개수
+        self.last_close = None
+        self.returns = np.zeros(A, dtype=np.float64)
+
+    @property
+    def num_assets(self):
+        return len(self.symbols)
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    def update(self, close):
+        """
+        캔들 1개 (전 종목 종가) 반영
+
+        Args:
+            close: (A,) 종가
+        """
+        close = np.asarray(close, dtype=np.float64)
+        if self.last_close is None:
+            self.last_close = close.copy()
+            return self
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.log(close / self.last_close)
+        r = np.nan_to_num(r, nan=0.0, posinf=0.0, neginf=0.0)
+
+        # 결측 종가는 직전 값 유지
+        self.last_close = np.where(np.isnan(close), self.last_close, close)
+        self.returns = r
+
+        if self.count >= self.window:
+            old = self.buffer[self.head]
+            self.sum -= old
+            self.outer -= np.outer(old, old)
+
+        self.buffer[self.head] = r
+        self.sum += r
+        self.outer += np.outer(r, r)
+
+        self.head = (self.head + 1) % self.window
+        self.count += 1
+
+        if self.count % self.resync == 0:
+            self._resync()
+
+        return self
+
+    def _resync(self):
+        n = min(self.count, self.window)
+        rows = self.buffer if n == self.window else self.buffer[:n]
+        self.sum = rows.sum(axis=0)
+        self.outer = rows.T @ rows
+
+    def cov(self):
+        """창 공분산 (A, A), 모집단 기준"""
+        n = min(self.count, self.window)
+        if n == 0:
+            return np.full((self.num_assets, self.num_assets), np.nan)
+        mean = self.sum / n
+        return self.outer / n - np.outer(mean, mean)
+
+    def corr(self):
+        return _corr_from_cov(self.cov())
+
+    def beta(self):
+        """기준 자산 대비 베타 (A,)"""
+        cov = self.cov()
+        var = cov[self.benchmark, self.benchmark]
+        if not var > 0:
+            return np.full(self.num_assets, np.nan)
+        return cov[:, self.benchmark] / var
+
+    def dispersion(self):
+        """최근 캔들 수익률의 단면 표준편차"""
+        return float(self.returns.std())
+
+    def mean_corr(self):
+        return float(_mean_offdiag(self.corr()))
+
+    def features(self):
+        """
+        심볼별 피처 행렬
+
+        Returns:
+            (A, 4) [기준 상관, 기준 베타, 분산도, 평균 상관] (준비 전에는 NaN)
+        """
+        out = np.full((self.num_assets, 4), np.nan)
+        if not self.ready:
+            return out
+
+        corr = self.corr()
+        out[:, 0] = corr[:, self.benchmark]
+        out[:, 1] = self.beta()
+        out[:, 2] = self.dispersion()
+        out[:, 3] = _mean_offdiag(corr)
+        return out
+
+
+FEATURE_NAMES = ['bench_corr', 'bench_beta', 'dispersion', 'mean_corr']
+
+
+def rolling_cross_asset(close, window=168, benchmark=0, full=False, chunk_size=None):
+    """
+    백테스트용 배치 계산 (RollingCrossAsset를 모든 캔들에 적용한 것과 같은 값)
+
+    기준 자산 상관/베타는 누적합 차이로 O(T·A),
+    쌍별 행렬은 외적 차이 누적합을 청크 단위로 계산 (메모리 O(청크·A²))
+
+    Args:
+        close: (T, A) 종가
+        window: 롤링 기간
+        benchmark: 기준 자산 열 인덱스
+        full: True면 쌍별 상관 행렬 (T, A, A)도 반환
+        chunk_size: 청크 크기 (기본: 약 8MB 분량)
+
+    Returns:
+        dict: bench_corr (T, A), bench_beta (T, A), dispersion (T,), mean_corr (T,),
+              corr (T, A, A) (full=True일 때) - 워밍업 구간은 NaN
+    """
+    r = log_returns(close)
+    T, A = r.shape
+    W = window
+
+    result = {
+        'bench_corr': np.full((T, A), np.nan),
+        'bench_beta': np.full((T, A), np.nan),
+        'dispersion': np.full(T, np.nan),
+        'mean_corr': np.full(T, np.nan),
+    }
+    if T > 1:
+        result['dispersion'][1:] = r[1:].std(axis=1)
+    if full:
+        result['corr'] = np.full((T, A, A), np.nan)
+    if T <= W:
+        return result
+
+    # 창 합: t 시점 창 = r[t-W+1 .. t] (r[0]은 빈 값)
+    def window_sum(values):
+        c = np.zeros((T + 1,) + values.shape[1:], dtype=np.float64)
+        np.cumsum(values, axis=0, out=c[1:])
+        return c[W + 1:] - c[1:T + 1 - W]
+
+    rb = r[:, benchmark]
+    s1 = window_sum(r) / W                       # (T-W, A) 평균
+    s_ib = window_sum(r * rb[:, None]) / W       # E[r_i r_b]
+    s_ii = window_sum(r * r) / W                 # E[r_i²]
+
+    mean_b = s1[:, benchmark]
+    cov_ib = s_ib - s1 * mean_b[:, None]
+    var_i = np.maximum(s_ii - s1 ** 2, 0.0)
+    var_b = var_i[:, benchmark]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['bench_beta'][W:] = np.where(var_b[:, None] > 0, cov_ib / var_b[:, None], np.nan)
+        denom = np.sqrt(var_i * var_b[:, None])
+        result['bench_corr'][W:] = np.where(denom > 0, cov_ib / denom, np.nan)
+
+    # 쌍별 행렬: S_t = S_{t-1} + r_t r_tᵀ - r_{t-W} r_{t-W}ᵀ
+    chunk_size = chunk_size or max(1, (1 << 20) // max(A * A, 1))
+    carry = r[1:W + 1].T @ r[1:W + 1]
+
+    for start in range(W, T, chunk_size):
+        stop = min(start + chunk_size, T)
+
+        S = np.einsum('ti,tj->tij', r[start:stop], r[start:stop])
+        S -= np.einsum('ti,tj->tij', r[start - W:stop - W], r[start - W:stop - W])
+        if start == W:
+            S[0] = carry
+        else:
+            S[0] += carry
+        np.cumsum(S, axis=0, out=S)
+        carry = S[-1].copy()
+
+        mean = s1[start - W:stop - W]
+        cov = S / W - mean[:, :, None] * mean[:, None, :]
+        corr = _corr_from_cov(cov)
+
+        result['mean_corr'][start:stop] = _mean_offdiag(corr)
+        if full:
+            result['corr'][start:stop] = corr
+
+    return result
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("🚀 교차 자산 피처 V0.1")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    T, A, W = 5000, 30, 168
+
+    # BTC 요인 + 개별 노이즈
+    market = rng.normal(0, 0.01, size=T)
+    betas = rng.uniform(0.5, 1.5, size=A)
+    betas[0] = 1.0
+    returns = market[:, None] * betas + rng.normal(0, 0.005, size=(T, A))
+    returns[:, 0] = market
+    close = 100 * np.exp(np.cumsum(returns, axis=0))
+
+    symbols = ['BTC/USDT'] + [f'COIN{i}/USDT' for i in range(1, A)]
+
+    # 배치
+    start = time.perf_counter()
+    batch = rolling_cross_asset(close, window=W, full=True)
+    print(f"\n   배치: {T}개 캔들 × {A}개 자산, {time.perf_counter() - start:.2f}초")
+
+    # 실시간
+    rolling = RollingCrossAsset(symbols, window=W, benchmark='BTC/USDT')
+    start = time.perf_counter()
+    for t in range(T):
+        rolling.update(close[t])
+    elapsed = time.perf_counter() - start
+    print(f"   실시간: 캔들당 {elapsed / T * 1e6:.1f}µs")
+
+    features = rolling.features()
+    print(f"\n   베타 오차 (실제 대비): {np.abs(features[:, 1] - betas).mean():.3f}")
+    print(f"   배치/실시간 차이: 베타 {np.abs(batch['bench_beta'][-1] - features[:, 1]).max():.2e}, "
+          f"상관 행렬 {np.abs(batch['corr'][-1] - rolling.corr()).max():.2e}")
+    print(f"   평균 상관: {features[0, 3]:.3f}, 분산도: {features[0, 2]:.5f}")
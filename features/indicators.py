@@ -0,0 +1,467 @@
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.cross_asset import align_closes, rolling_cross_asset
+
+
+# 이름 → Indicator
+INDICATORS = {}
+
+
+class Indicator:
+    """
+    등록된 지표 정의
+
+    - fn(ctx, **params): 출력 배열 리스트 (float64, 길이 N, 워밍업 구간 NaN)
+    - outputs(params): 출력 피처 이름 리스트
+    - warmup(params): 첫 유효 값의 인덱스
+    - recursive: 지수이동평균처럼 전체 이력에 의존하면 fn(params) → 직렬로 적용되는 EMA 계수 리스트
+                 (유한 창으로 똑같이 재현 불가, settle_length로 허용 오차 내 창 길이 계산)
+    - universe: 다른 심볼 캔들(universe)이 필요한지
+    """
+
+    def __init__(self, name, fn, defaults, outputs, warmup, recursive=False, universe=False):
+        self.name = name
+        self.fn = fn
+        self.defaults = defaults
+        self.outputs = outputs
+        self.warmup = warmup
+        self.recursive = recursive
+        self.universe = universe
+
+
+def register_indicator(name, defaults, outputs, warmup, recursive=False, universe=False):
+    """
+    지표 등록 데코레이터
+
+    예:
+        @register_indicator('ma', defaults={'period': 20},
+                            outputs=lambda p: [f"ma{p['period']}"],
+                            warmup=lambda p: p['period'] - 1)
+        def moving_average(ctx, period):
+            return [ctx.rolling_mean('close', period)]
+    """
+    def decorator(fn):
+        INDICATORS[name] = Indicator(name, fn, defaults, outputs, warmup, recursive, universe)
+        return fn
+    return decorator
+
+
+class IndicatorContext:
+    """
+    지표 간 공유 중간값 캐시
+
+    같은 시계열의 누적합은 한 번만 계산해서 모든 이동평균/표준편차가 재사용하고,
+    EMA와 True Range도 (시계열, 기간)별로 한 번만 계산
+
+    universe: 교차 자산 지표용 다른 심볼 캔들 {symbol: DataFrame}
+    """
+
+    def __init__(self, df, universe=None):
+        self.df = df
+        self.n = len(df)
+        self.universe = universe
+        self._series = {}
+        self._cache = {}
+
+    def universe_close(self, symbols=None):
+        """
+        이 데이터 + 유니버스 종가 (N, 1 + A), 이 데이터의 시각 축에 맞춤
+
+        Args:
+            symbols: 사용할 유니버스 심볼 (기본: 전부)
+        """
+        if self.universe is None:
+            raise ValueError("교차 자산 지표는 universe가 필요함 (예: FeatureArrays(df, universe={...}))")
+
+        symbols = list(self.universe) if symbols is None else list(symbols)
+        key = ('universe', tuple(symbols))
+        if key not in self._cache:
+            missing = [s for s in symbols if s not in self.universe]
+            if missing:
+                raise KeyError(f"universe에 없는 심볼: {missing}")
+
+            frames = {None: self.df}
+            frames.update({s: self.universe[s] for s in symbols})
+            _, close = align_closes(frames, timestamps=self.df['timestamp'].values)
+            self._cache[key] = close
+        return self._cache[key]
+
+    def series(self, name):
+        """
+        기본 컬럼(open/high/low/close/volume) 또는 파생 시계열 (float64)
+        """
+        if name in self._series:
+            return self._series[name]
+
+        if name in ('open', 'high', 'low', 'close', 'volume'):
+            values = self.df[name].to_numpy(dtype=np.float64)
+        elif name == 'prev_close':
+            close = self.series('close')
+            values = np.empty(self.n)
+            values[0] = np.nan
+            values[1:] = close[:-1]
+        elif name == 'tr':
+            # True Range = max(고가-저가, |고가-전종가|, |저가-전종가|)
+            high, low = self.series('high'), self.series('low')
+            prev_close = self.series('prev_close')
+            values = np.fmax(
+                high - low,
+                np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+            )
+            values[0] = np.nan
+        elif name in ('gain', 'loss'):
+            delta = np.empty(self.n)
+            delta[0] = np.nan
+            np.subtract(self.series('close')[1:], self.series('close')[:-1], out=delta[1:])
+            self._series['gain'] = np.where(delta > 0, delta, 0.0)
+            self._series['loss'] = np.where(delta < 0, -delta, 0.0)
+            self._series['gain'][0] = self._series['loss'][0] = np.nan
+            return self._series[name]
+        else:
+            raise KeyError(f"알 수 없는 시계열: {name}")
+
+        self._series[name] = values
+        return values
+
+    def cumsum(self, name, power=1):
+        """
+        0으로 시작하는 누적합 (N+1,), 첫 값 기준으로 이동해서 정밀도 유지
+        """
+        key = ('cumsum', name, power)
+        if key not in self._cache:
+            values = self.series(name)
+            first = np.flatnonzero(~np.isnan(values))
+            offset = values[first[0]] if len(first) else 0.0
+            shifted = np.nan_to_num(values - offset) ** power
+            out = np.empty(self.n + 1)
+            out[0] = 0.0
+            np.cumsum(shifted, out=out[1:])
+            self._cache[key] = (out, offset)
+        return self._cache[key]
+
+    def rolling_mean(self, name, window):
+        key = ('mean', name, window)
+        if key not in self._cache:
+            c, offset = self.cumsum(name)
+            out = np.full(self.n, np.nan)
+            if self.n >= window:
+                out[window - 1:] = (c[window:] - c[:-window]) / window + offset
+            out[:self.first_valid(name) + window - 1] = np.nan
+            self._cache[key] = out
+        return self._cache[key]
+
+    def rolling_std(self, name, window):
+        """모집단 표준편차 (ddof=0), 누적합/제곱 누적합 재사용"""
+        key = ('std', name, window)
+        if key not in self._cache:
+            c1, offset = self.cumsum(name)
+            c2, _ = self.cumsum(name, power=2)
+            out = np.full(self.n, np.nan)
+            if self.n >= window:
+                s1 = c1[window:] - c1[:-window]
+                s2 = c2[window:] - c2[:-window]
+                var = s2 / window - (s1 / window) ** 2
+                out[window - 1:] = np.sqrt(np.maximum(var, 0.0))
+            out[:self.first_valid(name) + window - 1] = np.nan
+            self._cache[key] = out
+        return self._cache[key]
+
+    def ema(self, name, span=None, alpha=None):
+        """지수이동평균 (adjust=False), (시계열, 계수)별 한 번만 계산"""
+        key = ('ema', name, span, alpha)
+        if key not in self._cache:
+            series = pd.Series(self.series(name), copy=False)
+            if alpha is not None:
+                out = series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+            else:
+                out = series.ewm(span=span, adjust=False).mean().to_numpy()
+            self._cache[key] = out
+        return self._cache[key]
+
+    def first_valid(self, name):
+        values = self.series(name)
+        return 0 if not np.isnan(values[0]) else 1
+
+
+# === 기본 지표 ===
+
+@register_indicator('ma', defaults={'period': 20},
+                    outputs=lambda p: [f"ma{p['period']}"],
+                    warmup=lambda p: p['period'] - 1)
+def moving_average(ctx, period):
+    return [ctx.rolling_mean('close', period)]
+
+
+@register_indicator('ma_diff', defaults={'fast': 5, 'slow': 20},
+                    outputs=lambda p: [f"ma{p['fast']}_{p['slow']}_diff"],
+                    warmup=lambda p: max(p['fast'], p['slow']) - 1)
+def moving_average_diff(ctx, fast, slow):
+    return [ctx.rolling_mean('close', fast) - ctx.rolling_mean('close', slow)]
+
+
+@register_indicator('ema', defaults={'span': 20},
+                    outputs=lambda p: [f"ema{p['span']}"],
+                    warmup=lambda p: p['span'] - 1,
+                    recursive=lambda p: [2.0 / (p['span'] + 1)])
+def exponential_moving_average(ctx, span):
+    return [ctx.ema('close', span=span)]
+
+
+@register_indicator('rsi', defaults={'period': 14},
+                    outputs=lambda p: [f"rsi{p['period']}"],
+                    warmup=lambda p: p['period'],
+                    recursive=lambda p: [1.0 / p['period']])
+def relative_strength_index(ctx, period):
+    avg_gain = ctx.ema('gain', alpha=1.0 / period)
+    avg_loss = ctx.ema('loss', alpha=1.0 / period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    rsi[:period] = np.nan
+    return [rsi]
+
+
+@register_indicator('macd', defaults={'fast': 12, 'slow': 26, 'signal': 9},
+                    outputs=lambda p: ['macd', 'macd_signal', 'macd_hist'],
+                    warmup=lambda p: p['slow'] + p['signal'] - 2,
+                    recursive=lambda p: [2.0 / (p['slow'] + 1), 2.0 / (p['signal'] + 1)])
+def macd(ctx, fast, slow, signal):
+    line = ctx.ema('close', span=fast) - ctx.ema('close', span=slow)
+    signal_line = pd.Series(line, copy=False).ewm(span=signal, adjust=False).mean().to_numpy()
+    return [line, signal_line, line - signal_line]
+
+
+@register_indicator('bollinger', defaults={'period': 20, 'num_std': 2.0},
+                    outputs=lambda p: [f"bb{p['period']}_pct", f"bb{p['period']}_width"],
+                    warmup=lambda p: p['period'] - 1)
+def bollinger_bands(ctx, period, num_std):
+    mean = ctx.rolling_mean('close', period)
+    band = num_std * ctx.rolling_std('close', period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 가격이 평평하면 밴드 폭 0 → 중앙(0.5)
+        pct = np.where(band > 0, (ctx.series('close') - (mean - band)) / (2 * band), 0.5)
+        width = 2 * band / mean
+    pct[np.isnan(band)] = np.nan
+    return [pct, width]
+
+
+@register_indicator('atr', defaults={'period': 14},
+                    outputs=lambda p: [f"atr{p['period']}"],
+                    warmup=lambda p: p['period'])
+def average_true_range(ctx, period):
+    return [ctx.rolling_mean('tr', period)]
+
+
+@register_indicator('volume_ratio', defaults={'period': 20},
+                    outputs=lambda p: [f"volume_ratio{p['period']}"],
+                    warmup=lambda p: p['period'] - 1)
+def volume_ratio(ctx, period):
+    mean_volume = ctx.rolling_mean('volume', period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 거래량이 없는 구간 → 1 (평균과 같음)
+        ratio = np.where(mean_volume > 0, ctx.series('volume') / mean_volume, 1.0)
+    ratio[np.isnan(mean_volume)] = np.nan
+    return [ratio]
+
+
+@register_indicator('cross_asset', defaults={'window': 168, 'benchmark': None, 'symbols': None},
+                    outputs=lambda p: (
+                        ([f"bench_corr{p['window']}", f"bench_beta{p['window']}"] if p['benchmark'] else []) +
+                        [f"dispersion{p['window']}", f"mean_corr{p['window']}"]
+                    ),
+                    warmup=lambda p: p['window'],
+                    universe=True)
+def cross_asset(ctx, window, benchmark, symbols):
+    """
+    유니버스 대비 피처: 기준 심볼 상관/베타 (benchmark가 있을 때), 분산도, 평균 상관
+
+    열 0 = 이 데이터, 나머지 = universe (symbols 순서)
+    """
+    symbols = list(ctx.universe) if symbols is None and ctx.universe is not None else symbols
+    close = ctx.universe_close(symbols)
+
+    column = 0 if benchmark is None else 1 + list(symbols).index(benchmark)
+    result = rolling_cross_asset(close, window=window, benchmark=column)
+
+    outputs = []
+    if benchmark:
+        outputs += [result['bench_corr'][:, 0], result['bench_beta'][:, 0]]
+    dispersion = result['dispersion'].copy()
+    dispersion[:window] = np.nan
+    outputs += [dispersion, result['mean_corr']]
+    return outputs
+
+
+class FeatureSchema:
+    """
+    이름 + 파라미터로 선언한 피처 목록
+
+    예:
+        FeatureSchema(['rsi', ('ma', {'period': 5}), ('macd', {'fast': 12})])
+
+    피처 이름/개수/워밍업 길이를 알려주고, 체크포인트 메타데이터로 저장 가능
+    """
+
+    def __init__(self, specs):
+        self.specs = []
+
+        for spec in specs:
+            if isinstance(spec, str):
+                name, params = spec, {}
+            elif isinstance(spec, dict):
+                params = dict(spec)
+                name = params.pop('name')
+            else:
+                name, params = spec
+
+            if name not in INDICATORS:
+                raise KeyError(f"등록되지 않은 지표: {name} (사용 가능: {sorted(INDICATORS)})")
+
+            indicator = INDICATORS[name]
+            unknown = set(params) - set(indicator.defaults)
+            if unknown:
+                raise ValueError(f"{name}: 알 수 없는 파라미터 {sorted(unknown)}")
+
+            self.specs.append((name, {**indicator.defaults, **params}))
+
+    @classmethod
+    def moving_averages(cls, periods=[5, 20, 50]):
+        """
+        V0.1 기본 피처: ma5, ma20, ma50, ma5_20_diff, ma20_50_diff
+        """
+        periods = sorted(periods)
+        specs = [('ma', {'period': p}) for p in periods]
+        specs += [
+            ('ma_diff', {'fast': a, 'slow': b})
+            for a, b in zip(periods[:-1], periods[1:])
+        ]
+        return cls(specs)
+
+    @property
+    def names(self):
+        names = []
+        for name, params in self.specs:
+            names.extend(INDICATORS[name].outputs(params))
+        return names
+
+    @property
+    def num_features(self):
+        return len(self.names)
+
+    @property
+    def warmup(self):
+        """모든 피처가 유효해지는 첫 인덱스"""
+        return max(INDICATORS[name].warmup(params) for name, params in self.specs)
+
+    @property
+    def lookback(self):
+        """
+        마지막 행을 똑같이 재현하는 데 필요한 최근 캔들 수
+        (재귀 지표가 있으면 None - 계산 시작점부터 전체 이력 필요)
+        """
+        if any(INDICATORS[name].recursive for name, _ in self.specs):
+            return None
+        return self.warmup + 1
+
+    def settle_length(self, tolerance=1e-6):
+        """
+        마지막 행을 허용 오차 안으로 재현하는 최근 캔들 수 (재귀 지표 포함)
+
+        EMA는 k개 캔들 뒤 잘린 이력의 남은 가중치가 (1 - α)^k라서
+        직렬 EMA마다 (1 - α)^k ≤ tolerance인 k를 더함 (유한 창 지표만 있으면 lookback과 같음)
+        """
+        length = self.warmup + 1
+        for name, params in self.specs:
+            recursive = INDICATORS[name].recursive
+            if recursive:
+                settle = sum(int(np.ceil(np.log(tolerance) / np.log1p(-alpha))) for alpha in recursive(params))
+                length = max(length, INDICATORS[name].warmup(params) + 1 + settle)
+        return length
+
+    @property
+    def requires_universe(self):
+        """다른 심볼 캔들이 필요한 지표가 있는지"""
+        return any(INDICATORS[name].universe for name, _ in self.specs)
+
+    def compute(self, df, out=None, universe=None):
+        """
+        모든 피처 계산 (공유 중간값은 한 번만)
+
+        Args:
+            df: OHLCV 데이터프레임
+            out: 결과를 기록할 (N, F) 배열 (없으면 float32로 생성)
+            universe: 교차 자산 지표용 {symbol: OHLCV 데이터프레임}
+
+        Returns:
+            (N, F) 피처 행렬
+        """
+        ctx = IndicatorContext(df, universe=universe)
+
+        if out is None:
+            out = np.empty((ctx.n, self.num_features), dtype=np.float32)
+
+        j = 0
+        for name, params in self.specs:
+            for values in INDICATORS[name].fn(ctx, **params):
+                out[:, j] = values
+                j += 1
+
+        return out
+
+    def to_dict(self):
+        return {
+            'specs': [{'name': name, **params} for name, params in self.specs],
+            'names': self.names,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['specs'])
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("🚀 지표 레지스트리 V0.1")
+    print("=" * 60)
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    df = pd.read_csv(os.path.join(project_root, 'btc_1h_data.csv'))
+
+    print(f"\n등록된 지표: {sorted(INDICATORS)}")
+
+    schema = FeatureSchema(
+        FeatureSchema.moving_averages().specs +
+        ['ema', 'rsi', 'macd', 'bollinger', 'atr', 'volume_ratio']
+    )
+    print(f"피처 ({schema.num_features}개): {schema.names}")
+    print(f"워밍업: {schema.warmup}개 캔들")
+
+    X = schema.compute(df)
+    print(f"\n{pd.DataFrame(X[schema.warmup:], columns=schema.names).describe().T}")
+
+    # pandas rolling과 비교
+    ref = df['close'].rolling(20).std(ddof=0).to_numpy()
+    bb = pd.Series(X[:, schema.names.index('bb20_width')])
+    mean = df['close'].rolling(20).mean().to_numpy()
+    print(f"\n볼린저 폭 최대 오차: {np.nanmax(np.abs(bb - 4 * ref / mean)):.2e}")
+
+    # 대용량 성능
+    n = 2_000_000
+    close = 100_000 + np.cumsum(np.random.randn(n))
+    big = pd.DataFrame({
+        'open': close, 'high': close + 5, 'low': close - 5,
+        'close': close, 'volume': np.random.rand(n)
+    })
+    start = time.perf_counter()
+    schema.compute(big)
+    print(f"⏱️  {n:,}개 캔들 × {schema.num_features}개 피처: {time.perf_counter() - start:.2f}초")
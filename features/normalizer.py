@@ -0,0 +1,181 @@
+import numpy as np
+
+
+class OnlineNormalizer:
+    """
+    피처 표준화 (Welford 누적 평균/분산)
+
+    - partial_fit: 배치 단위 누적 (전체 이력을 다시 보지 않음)
+    - update: 캔들 1개 누적, O(F)
+    - transform / transform_one: (x - 평균) / 표준편차
+
+    배치 변환과 캔들 1개 변환은 같은 float32 연산이라 결과가 정확히 일치
+    """
+
+    def __init__(self, num_features, eps=1e-8):
+        """
+        초기화
+
+        Args:
+            num_features: 피처 개수
+            eps: 표준편차 하한 (상수 피처 보호)
+        """
+        self.num_features = num_features
+        self.eps = eps
+
+        self.count = 0
+        self.mean = np.zeros(num_features, dtype=np.float64)
+        self.m2 = np.zeros(num_features, dtype=np.float64)
+
+        self._shift = None
+        self._scale = None
+
+    def partial_fit(self, X):
+        """
+        배치 누적 (Chan 병합 공식)
+
+        Args:
+            X: (N, F) 피처 배열
+        """
+        X = np.asarray(X)
+        n_b = len(X)
+        if n_b == 0:
+            return self
+
+        mean_b = X.mean(axis=0, dtype=np.float64)
+        m2_b = ((X - mean_b) ** 2).sum(axis=0)
+
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+
+        self.mean = self.mean + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * (n_a * n_b / n)
+        self.count = n
+
+        self._shift = None
+        return self
+
+    def fit(self, X, chunk_size=100_000):
+        """
+        처음부터 누적 (청크 단위라 추가 메모리는 청크 크기만큼)
+        """
+        self.count = 0
+        self.mean[:] = 0.0
+        self.m2[:] = 0.0
+
+        for i in range(0, len(X), chunk_size):
+            self.partial_fit(X[i:i + chunk_size])
+
+        return self
+
+    def update(self, x):
+        """
+        캔들 1개 누적 (Welford)
+
+        Args:
+            x: (F,) 피처 벡터
+        """
+        x = np.asarray(x, dtype=np.float64)
+
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+        self._shift = None
+        return self
+
+    @property
+    def var(self):
+        if self.count == 0:
+            return np.ones(self.num_features)
+        return self.m2 / self.count
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def _params(self):
+        """변환용 float32 평균 / 역표준편차 (통계가 바뀔 때만 재계산)"""
+        if self._shift is None:
+            self._shift = self.mean.astype(np.float32)
+            self._scale = (1.0 / np.maximum(self.std, self.eps)).astype(np.float32)
+        return self._shift, self._scale
+
+    def transform(self, X, out=None):
+        """
+        (N, F) 배치 표준화 → float32
+
+        Args:
+            X: (N, F) 피처
+            out: 결과를 기록할 float32 (N, F) 배열 (X 자신이면 제자리 변환, 없으면 새로 할당)
+        """
+        shift, scale = self._params()
+        if out is None:
+            out = np.array(X, dtype=np.float32)
+            out -= shift
+        else:
+            np.subtract(X, shift, out=out, dtype=np.float32)
+        out *= scale
+        return out
+
+    def transform_one(self, x):
+        """
+        캔들 1개 표준화 → float32 (F,), O(F)
+        """
+        shift, scale = self._params()
+        out = np.array(x, dtype=np.float32)
+        out -= shift
+        out *= scale
+        return out
+
+    def inverse_transform(self, X):
+        shift, scale = self._params()
+        return np.asarray(X, dtype=np.float32) / scale + shift
+
+    def state_dict(self):
+        return {
+            'num_features': self.num_features,
+            'eps': self.eps,
+            'count': self.count,
+            'mean': self.mean.tolist(),
+            'm2': self.m2.tolist(),
+        }
+
+    @classmethod
+    def from_state_dict(cls, state):
+        normalizer = cls(state['num_features'], eps=state['eps'])
+        normalizer.count = state['count']
+        normalizer.mean = np.array(state['mean'], dtype=np.float64)
+        normalizer.m2 = np.array(state['m2'], dtype=np.float64)
+        return normalizer
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🚀 피처 정규화 V0.1")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    X = (rng.normal(size=(10_000, 5)) * [500, 500, 500, 50, 50] + 115_000).astype(np.float32)
+
+    # 배치 누적 vs 캔들 1개씩 누적
+    batch = OnlineNormalizer(5).fit(X, chunk_size=1_000)
+    online = OnlineNormalizer(5)
+    for row in X:
+        online.update(row)
+
+    print(f"\n평균 (numpy):  {X.astype(np.float64).mean(axis=0)}")
+    print(f"평균 (배치):   {batch.mean}")
+    print(f"평균 (온라인): {online.mean}")
+    print(f"표준편차 차이: {np.abs(batch.std - X.astype(np.float64).std(axis=0)).max():.2e}")
+
+    # 오프라인 / 온라인 변환 일치
+    offline = batch.transform(X)
+    live = np.stack([batch.transform_one(row) for row in X])
+    print(f"\n변환 일치: {np.array_equal(offline, live)}")
+
+    restored = OnlineNormalizer.from_state_dict(batch.state_dict())
+    print(f"저장/복원 일치: {np.array_equal(restored.transform(X), offline)}")
@@ -0,0 +1,332 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+class FeatureFileWriter:
+    """
+    피처/레이블을 청크 단위로 디스크에 이어 쓰기 (전체를 RAM에 올리지 않음)
+    """
+
+    def __init__(self, root, num_features, label_width=None, feature_names=None):
+        """
+        초기화
+
+        Args:
+            root: 저장 폴더
+            num_features: 피처 개수 F
+            label_width: 레이블 열 개수 H (None이면 (N,) 레이블)
+            feature_names: 피처 이름 리스트
+        """
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.num_features = num_features
+        self.label_width = label_width
+        self.feature_names = feature_names
+        self.num_rows = 0
+
+        self._features = open(os.path.join(root, 'features.f32'), 'wb')
+        self._labels = open(os.path.join(root, 'labels.f32'), 'wb')
+
+    def append(self, X, y):
+        """청크 추가 (float32로 변환해서 기록)"""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+
+        if X.shape[1] != self.num_features or len(X) != len(y):
+            raise ValueError(f"청크 크기 불일치: X={X.shape}, y={y.shape}")
+
+        X.tofile(self._features)
+        y.tofile(self._labels)
+        self.num_rows += len(X)
+
+    def close(self):
+        self._features.close()
+        self._labels.close()
+
+        meta = {
+            'num_rows': self.num_rows,
+            'num_features': self.num_features,
+            'label_width': self.label_width,
+            'feature_names': self.feature_names,
+            'dtype': 'float32',
+        }
+        with open(os.path.join(self.root, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class FeatureFile:
+    """
+    디스크의 피처/레이블 파일을 메모리 맵으로 열기
+
+    root/
+        meta.json      행 수, 피처 개수, 이름
+        features.f32   (N, F) float32
+        labels.f32     (N,) 또는 (N, H) float32
+    """
+
+    def __init__(self, root):
+        with open(os.path.join(root, 'meta.json')) as f:
+            self.meta = json.load(f)
+
+        n = self.meta['num_rows']
+        label_shape = (n,) if self.meta['label_width'] is None else (n, self.meta['label_width'])
+
+        self.root = root
+        self.feature_names = self.meta['feature_names']
+        self.X = np.memmap(os.path.join(root, 'features.f32'), dtype=np.float32,
+                           mode='r', shape=(n, self.meta['num_features']))
+        self.y = np.memmap(os.path.join(root, 'labels.f32'), dtype=np.float32,
+                           mode='r', shape=label_shape)
+
+    @staticmethod
+    def create(root, num_features, label_width=None, feature_names=None):
+        return FeatureFileWriter(root, num_features, label_width, feature_names)
+
+    @staticmethod
+    def write(root, X, y, feature_names=None, chunk_size=1_000_000):
+        """배열 전체를 파일로 저장"""
+        label_width = None if np.ndim(y) == 1 else y.shape[1]
+        with FeatureFileWriter(root, X.shape[1], label_width, feature_names) as writer:
+            for i in range(0, len(X), chunk_size):
+                writer.append(X[i:i + chunk_size], y[i:i + chunk_size])
+        return FeatureFile(root)
+
+    def __len__(self):
+        return len(self.X)
+
+
+# 워커 종료 표시
+_DONE = object()
+
+
+class StreamingLoader:
+    """
+    메모리 맵 파일에서 섞인 청크 단위로 미니배치 공급
+
+    - 청크 순서와 청크 안의 행 순서를 에폭마다 섞음
+    - 백그라운드 스레드가 다음 청크를 미리 읽어 큐에 넣음 (디스크 I/O는 GIL 해제)
+    - 메모리 사용량 ≈ (prefetch + num_workers + 1) × 청크 크기 (데이터 크기와 무관)
+
+    Trainer.train_batches(loader)로 바로 학습
+    """
+
+    def __init__(self, X, y, batch_size=1024, chunk_size=262_144, prefetch=4,
+                 num_workers=2, shuffle=True, seed=None, start=0, stop=None):
+        """
+        초기화
+
+        Args:
+            X: (N, F) 피처 (np.memmap 또는 ndarray)
+            y: (N,) 또는 (N, H) 레이블
+            batch_size: 배치 크기
+            chunk_size: 한 번에 읽는 행 수 (batch_size 배수로 올림)
+            prefetch: 미리 읽어 둘 청크 개수
+            num_workers: 읽기 스레드 개수
+            shuffle: 에폭마다 섞기
+            seed: 난수 시드 (에폭마다 seed + epoch)
+            start, stop: 사용할 행 범위 (FeatureArrays 유효 구간)
+        """
+        self.X = X
+        self.y = y
+        self.batch_size = batch_size
+        self.chunk_size = -(-chunk_size // batch_size) * batch_size
+        self.prefetch = prefetch
+        self.num_workers = num_workers
+        self.shuffle = shuffle
+        self.seed = seed
+        self.start = start
+        self.stop = len(X) if stop is None else stop
+        self.epoch = 0
+
+        # 마지막 에폭 통계
+        self.wait_time = 0.0   # 학습 쪽이 큐에서 기다린 시간
+        self.load_time = 0.0   # 워커가 디스크에서 읽은 시간 (합계)
+
+    @classmethod
+    def from_files(cls, root, **kwargs):
+        feature_file = FeatureFile(root)
+        return cls(feature_file.X, feature_file.y, **kwargs)
+
+    def __len__(self):
+        n = max(self.stop - self.start, 0)
+        full, rest = divmod(n, self.chunk_size)
+        return full * (self.chunk_size // self.batch_size) + -(-rest // self.batch_size)
+
+    def _chunks(self, rng):
+        bounds = [
+            (a, min(a + self.chunk_size, self.stop))
+            for a in range(self.start, self.stop, self.chunk_size)
+        ]
+        if self.shuffle:
+            bounds = [bounds[i] for i in rng.permutation(len(bounds))]
+        return bounds
+
+    def _load(self, a, b, rng):
+        """청크 읽기 (+ 행 섞기), 디스크 → RAM 복사 한 번"""
+        if self.shuffle:
+            rows = rng.permutation(b - a)
+            return self.X[a:b][rows], self.y[a:b][rows]
+        return np.array(self.X[a:b]), np.array(self.y[a:b])
+
+    def _worker(self, tasks, out, stop_event):
+        try:
+            while not stop_event.is_set():
+                try:
+                    a, b, seed = tasks.get_nowait()
+                except queue.Empty:
+                    break
+
+                started = time.perf_counter()
+                chunk = self._load(a, b, np.random.default_rng(seed))
+                self.load_time += time.perf_counter() - started
+
+                # 학습이 중단되면 바로 빠져나오도록 timeout
+                while not stop_event.is_set():
+                    try:
+                        out.put(chunk, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            out.put(e)
+        finally:
+            out.put(_DONE)
+
+    def __iter__(self):
+        batches = self.batches(self.epoch)
+        self.epoch += 1
+        return batches
+
+    def batches(self, epoch=0):
+        """
+        1 에폭 미니배치 반복자
+
+        Yields:
+            X_batch (B, F), y_batch (B,) 또는 (B, H)
+        """
+        seed = None if self.seed is None else self.seed + epoch
+        rng = np.random.default_rng(seed)
+
+        tasks = queue.Queue()
+        for a, b in self._chunks(rng):
+            tasks.put((a, b, int(rng.integers(2**32))))
+
+        out = queue.Queue(maxsize=self.prefetch)
+        stop_event = threading.Event()
+        workers = [
+            threading.Thread(target=self._worker, args=(tasks, out, stop_event), daemon=True)
+            for _ in range(self.num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        self.wait_time = 0.0
+        self.load_time = 0.0
+
+        try:
+            done = 0
+            while done < len(workers):
+                started = time.perf_counter()
+                item = out.get()
+                self.wait_time += time.perf_counter() - started
+
+                if item is _DONE:
+                    done += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                X_chunk, y_chunk = item
+                for i in range(0, len(X_chunk), self.batch_size):
+                    yield X_chunk[i:i + self.batch_size], y_chunk[i:i + self.batch_size]
+        finally:
+            stop_event.set()
+            # 대기 중인 워커가 put에서 막히지 않도록 비움
+            while any(worker.is_alive() for worker in workers):
+                try:
+                    out.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            for worker in workers:
+                worker.join()
+
+
+# 벤치마크: 메모리 학습 vs 스트리밍 학습
+if __name__ == "__main__":
+    import resource
+    import tempfile
+
+    import torch
+
+    from features.window import WindowDataset
+    from features.normalizer import OnlineNormalizer
+    from model.network import MAModel, Trainer
+
+    print("=" * 60)
+    print("🚀 스트리밍 학습 벤치마크 V0.1")
+    print("=" * 60)
+
+    torch.set_num_threads(max(os.cpu_count() - 2, 1))
+
+    n, f = 4_000_000, 14
+    batch_size = 4096
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 청크 단위로 파일 생성 (RAM에 전체를 올리지 않음)
+        with FeatureFile.create(tmp, num_features=f) as writer:
+            for _ in range(n // 500_000):
+                writer.append(rng.normal(size=(500_000, f)), rng.normal(0, 0.01, 500_000))
+        feature_file = FeatureFile(tmp)
+        size_mb = feature_file.X.nbytes / 1e6
+        print(f"\n   데이터: {n:,}행 × {f}피처 ({size_mb:,.0f}MB)")
+
+        normalizer = OnlineNormalizer(f).fit(feature_file.X, chunk_size=500_000)
+
+        # 1) 스트리밍
+        loader = StreamingLoader(feature_file.X, feature_file.y, batch_size=batch_size,
+                                 chunk_size=262_144, prefetch=4, num_workers=2, seed=0)
+        trainer = Trainer(MAModel(input_size=f), lr=0.001, normalizer=normalizer)
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        start = time.perf_counter()
+        trainer.train_batches(loader)
+        streaming = time.perf_counter() - start
+        rss_streaming = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        print(f"\n   스트리밍: {n / streaming:,.0f} 샘플/초 ({streaming:.1f}초)")
+        print(f"   대기 시간: {loader.wait_time:.2f}초 ({loader.wait_time / streaming * 100:.1f}%)")
+        print(f"   최대 RSS 증가: {rss_streaming - rss_before:,.0f}MB")
+
+        # 2) 메모리 (전체 로드)
+        X = np.array(feature_file.X)
+        y = np.array(feature_file.y)
+        dataset = WindowDataset(X, y, window=1)
+        trainer = Trainer(MAModel(input_size=f), lr=0.001, normalizer=normalizer)
+
+        start = time.perf_counter()
+        trainer.train_batches(dataset.batches(batch_size=batch_size, seed=0))
+        in_memory = time.perf_counter() - start
+        rss_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        print(f"\n   메모리: {n / in_memory:,.0f} 샘플/초 ({in_memory:.1f}초)")
+        print(f"   최대 RSS 증가: {rss_memory - rss_before:,.0f}MB")
+        print(f"\n   스트리밍/메모리 처리량: {in_memory / streaming * 100:.0f}%")
+
+        del X, y, dataset, loader, feature_file
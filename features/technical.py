@@ -1,5 +1,13 @@
 import pandas as pd
 import numpy as np
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.indicators import FeatureSchema
 
 class TechnicalFeatures:
     """
@@ -19,6 +27,7 @@ class TechnicalFeatures:
             df: OHLCV 데이터프레임
         """
         self.df = df.copy()  # 원본 보존
+        self.feature_cols = ['ma5', 'ma20', 'ma50', 'ma5_20_diff', 'ma20_50_diff']
         print(f"📊 입력 데이터: {len(self.df)}개 캔들")
     
     def add_moving_averages(self, periods=[5, 20, 50]):
@@ -69,6 +78,73 @@ class TechnicalFeatures:
         
         return self.df
     
+    def add_indicators(self, schema, universe=None):
+        """
+        레지스트리 지표 추가 (FeatureSchema)
+        
+        Args:
+            schema: FeatureSchema 또는 지표 선언 리스트
+            universe: 교차 자산 지표('cross_asset')용 {symbol: OHLCV 데이터프레임}
+        
+        Returns:
+            DataFrame with indicators
+        """
+        if not isinstance(schema, FeatureSchema):
+            schema = FeatureSchema(schema)
+        
+        print(f"\n🔄 지표 계산 중... ({schema.num_features}개)")
+        
+        X = schema.compute(self.df, out=np.empty((len(self.df), schema.num_features)), universe=universe)
+        for j, name in enumerate(schema.names):
+            self.df[name] = X[:, j]
+            print(f"   ✅ {name} 계산 완료")
+        
+        self.schema = schema
+        self.feature_cols = schema.names
+        
+        # NaN 제거 (초기 데이터 부족)
+        before = len(self.df)
+        self.df = self.df.dropna()
+        after = len(self.df)
+        
+        print(f"\n   ⚠️  NaN 제거: {before} → {after}개 ({before-after}개 제거)")
+        
+        return self.df
+
+    def add_cross_asset(self, others, benchmark=None, window=168):
+        """
+        교차 자산 피처 추가 (다른 심볼 대비 상관/베타, 유니버스 분산도)
+
+        레지스트리 지표 'cross_asset'과 같은 계산 (FeatureArrays(df, universe=...)와 같은 값)
+
+        Args:
+            others: {symbol: OHLCV 데이터프레임} (이 데이터 외 유니버스)
+            benchmark: 기준 심볼 (others의 키, None이면 이 데이터가 기준)
+            window: 롤링 기간 (캔들 수)
+
+        Returns:
+            DataFrame with cross-asset features
+        """
+        print(f"\n🔄 교차 자산 피처 계산 중... ({len(others) + 1}개 자산, {window}개 캔들)")
+
+        schema = FeatureSchema([('cross_asset', {'window': window, 'benchmark': benchmark})])
+        X = schema.compute(self.df, out=np.empty((len(self.df), schema.num_features)), universe=others)
+
+        for j, name in enumerate(schema.names):
+            self.df[name] = X[:, j]
+            print(f"   ✅ {name} 계산 완료")
+
+        self.feature_cols = self.feature_cols + [n for n in schema.names if n not in self.feature_cols]
+
+        # NaN 제거 (초기 데이터 부족)
+        before = len(self.df)
+        self.df = self.df.dropna()
+        after = len(self.df)
+
+        print(f"\n   ⚠️  NaN 제거: {before} → {after}개 ({before-after}개 제거)")
+
+        return self.df
+
     def add_labels(self):
         """
         레이블 추가: 미래 수익률
@@ -97,9 +173,7 @@ class TechnicalFeatures:
         Returns:
             X (features), y (labels)
         """
-        feature_cols = ['ma5', 'ma20', 'ma50', 'ma5_20_diff', 'ma20_50_diff']
-        
-        X = self.df[feature_cols].values
+        X = self.df[self.feature_cols].values
         y = self.df['future_return'].values
         
         print(f"\n✅ 학습 데이터 준비 완료")
@@ -116,8 +190,7 @@ class TechnicalFeatures:
         print(f"📈 피처 통계")
         print(f"=" * 60)
         
-        feature_cols = ['ma5', 'ma20', 'ma50', 'ma5_20_diff', 'ma20_50_diff']
-        print(self.df[feature_cols].describe())
+        print(self.df[self.feature_cols].describe())
         
         print(f"\n" + "=" * 60)
         print(f"🎯 레이블 통계 (future_return)")
@@ -0,0 +1,151 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class WindowDataset:
+    """
+    시퀀스 모델용 슬라이딩 윈도우 데이터셋 (복사 없음)
+
+    (N, F) 피처 배열 위에 strided 뷰 (N-W+1, W, F)를 만들어
+    시점 t의 샘플 = X[t-W+1 : t+1], 레이블 = y[t]
+
+    윈도우 전체를 만들지 않고 미니배치를 꺼낼 때만 (B, W, F)를 복사하므로
+    메모리는 원본 피처 + 배치 하나 크기
+    """
+
+    def __init__(self, X, y, window=64, start=0, stop=None):
+        """
+        초기화
+
+        Args:
+            X: (N, F) 피처 배열 (ndarray 또는 np.memmap)
+            y: (N,) 레이블 배열
+            window: 윈도우 길이 (1이면 일반 (B, F) 배치)
+            start: 첫 유효 시점 (FeatureArrays.start)
+            stop: 마지막 유효 시점 + 1 (FeatureArrays.stop)
+        """
+        if len(X) != len(y):
+            raise ValueError(f"X/y 길이 불일치: {len(X)} != {len(y)}")
+
+        self.X = X
+        self.y = y
+        self.window = window
+
+        stop = len(X) if stop is None else stop
+        # 윈도우가 유효 구간 안에서만 시작하도록
+        self.first = max(start + window - 1, window - 1)
+        self.last = stop
+
+        # (N-W+1, F, W) → (N-W+1, W, F) 뷰
+        self.windows = sliding_window_view(X, window, axis=0).transpose(0, 2, 1)
+
+    @classmethod
+    def from_memmap(cls, features_path, labels_path, num_features,
+                    dtype=np.float32, **kwargs):
+        """
+        메모리 맵 파일에서 생성 (필요한 페이지만 디스크에서 읽음)
+
+        Args:
+            features_path: (N, F) 피처 raw 파일
+            labels_path: (N,) 레이블 raw 파일
+            num_features: 피처 개수 F
+        """
+        X = np.memmap(features_path, dtype=dtype, mode='r').reshape(-1, num_features)
+        y = np.memmap(labels_path, dtype=dtype, mode='r')
+        return cls(X, y, **kwargs)
+
+    def __len__(self):
+        return max(self.last - self.first, 0)
+
+    def __getitem__(self, i):
+        """i번째 샘플 (W, F) 뷰와 레이블"""
+        t = self.first + i
+        return self.windows[t - self.window + 1], self.y[t]
+
+    @property
+    def nbytes_view(self):
+        """윈도우를 전부 만들었을 때 필요한 메모리 (참고용)"""
+        return len(self) * self.window * self.X.shape[1] * self.X.dtype.itemsize
+
+    def batch(self, indices):
+        """
+        샘플 인덱스 → (B, W, F) 배치 (window=1이면 (B, F))
+
+        Args:
+            indices: 샘플 인덱스 배열 (0 ~ len-1)
+        """
+        t = np.asarray(indices) + self.first
+
+        if self.window == 1:
+            return np.asarray(self.X[t]), np.asarray(self.y[t])
+
+        return self.windows[t - self.window + 1], np.asarray(self.y[t])
+
+    def batches(self, batch_size=256, shuffle=True, seed=None):
+        """
+        미니배치 반복자
+
+        Args:
+            batch_size: 배치 크기
+            shuffle: 에폭마다 순서 섞기
+            seed: 난수 시드
+
+        Yields:
+            X_batch (B, W, F), y_batch (B,)
+        """
+        n = len(self)
+
+        if shuffle:
+            order = np.random.default_rng(seed).permutation(n)
+        else:
+            order = np.arange(n)
+
+        for i in range(0, n, batch_size):
+            yield self.batch(order[i:i + batch_size])
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    print("=" * 60)
+    print("🚀 슬라이딩 윈도우 데이터셋 V0.1")
+    print("=" * 60)
+
+    n, f, w = 2_000_000, 14, 256
+    X = np.random.rand(n, f).astype(np.float32)
+    y = np.random.randn(n).astype(np.float32)
+
+    dataset = WindowDataset(X, y, window=w)
+
+    print(f"\n   피처: {X.shape}, {X.nbytes / 1e6:,.0f}MB")
+    print(f"   샘플: {len(dataset):,}개 (윈도우 {w})")
+    print(f"   전부 만들면: {dataset.nbytes_view / 1e9:,.1f}GB")
+    print(f"   뷰 공유: {np.shares_memory(dataset.windows, X)}")
+
+    x0, y0 = dataset[0]
+    print(f"   첫 샘플 일치: {np.array_equal(x0, X[:w])}, {y0 == y[w - 1]}")
+
+    start = time.perf_counter()
+    count = 0
+    for X_batch, y_batch in dataset.batches(batch_size=512, seed=0):
+        count += 1
+        if count == 200:
+            break
+    elapsed = time.perf_counter() - start
+    print(f"\n   배치 {X_batch.shape}: {elapsed / count * 1000:.2f}ms/배치")
+
+    # 메모리 맵 버전
+    with tempfile.TemporaryDirectory() as tmp:
+        X.tofile(os.path.join(tmp, 'X.f32'))
+        y.tofile(os.path.join(tmp, 'y.f32'))
+
+        mapped = WindowDataset.from_memmap(
+            os.path.join(tmp, 'X.f32'), os.path.join(tmp, 'y.f32'),
+            num_features=f, window=w
+        )
+        X_batch, _ = mapped.batch(np.arange(10))
+        print(f"   메모리 맵 일치: {np.array_equal(X_batch[3], X[3:3 + w])}")
+        del mapped
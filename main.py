@@ -3,7 +3,7 @@
 이동평균 기반 딥러닝 전략
 """
 
-import torch
+import numpy as np
 import pandas as pd
 import os
 import sys
@@ -14,10 +14,14 @@ sys.path.insert(0, PROJECT_ROOT)
 
 # === 정상 import ===
 from data.collector import DataCollector
-from features.technical import TechnicalFeatures
-from model.network import MAModel, Trainer
+from features.arrays import FeatureArrays
+from features.indicators import FeatureSchema
+from model.network import MAModel, Trainer, to_tensor, save_checkpoint
+from model.retrain import IncrementalRetrainer
+from data.candle_index import to_epoch_ms
 from strategy.ma_strategy import MAStrategy
 from backtest.engine import Backtester
+from backtest.store import RunStore
 
 
 def print_header():
@@ -49,8 +53,13 @@ def main():
         'timeframe': '1h',
         'limit': 1000,
         'ma_periods': [5, 20, 50],
+        'indicators': [],  # 추가 지표 (예: ['rsi', ('macd', {'fast': 12})])
+        'universe': [],    # 교차 자산 지표용 다른 심볼 (예: ['ETH/USDT'] + ('cross_asset', {'benchmark': 'ETH/USDT'}))
         'epochs': 200,
         'learning_rate': 0.001,
+        'warm_start': True,     # 이전 체크포인트에서 이어서 학습
+        'retrain_epochs': 20,   # warm start 재학습 에폭
+        'replay_size': 5000,    # 재학습 때 섞을 과거 캔들 버퍼
         'initial_capital': 10000,
         'fee': 0.001
     }
@@ -60,7 +69,9 @@ def main():
     print(f"   시간봉: {config['timeframe']}")
     print(f"   데이터: {config['limit']}개")
     print(f"   이동평균: {config['ma_periods']}")
-    print(f"   에폭: {config['epochs']}")
+    print(f"   추가 지표: {config['indicators']}")
+    print(f"   유니버스: {config['universe']}")
+    print(f"   에폭: {config['epochs']} (warm start: {config['retrain_epochs']})")
     print(f"   학습률: {config['learning_rate']}")
     print(f"   초기 자본: ${config['initial_capital']:,}")
     print(f"   수수료: {config['fee']*100}%")
@@ -76,57 +87,119 @@ def main():
     
     df = collector.fetch_ohlcv(limit=config['limit'])
     
+    # 교차 자산 지표용 다른 심볼 (같은 시간봉/개수)
+    universe = {
+        symbol: collector.fetch_ohlcv(limit=config['limit'], symbol=symbol)
+        for symbol in config['universe']
+    }
+    
     # 피처 생성
     print_section("3. 피처 생성")
     
-    tech = TechnicalFeatures(df)
-    tech.add_moving_averages(periods=config['ma_periods'])
-    tech.add_momentum_features()
-    tech.add_labels()
+    schema = FeatureSchema(
+        FeatureSchema.moving_averages(config['ma_periods']).specs +
+        config['indicators']
+    )
     
-    X, y = tech.get_features_and_labels()
+    # float32 배열 하나에 기록, 유효 구간만 뷰로 사용 (복사 없음)
+    arrays = FeatureArrays(df, schema=schema, universe=universe)
+    X, y = arrays.valid()
     
-    X_tensor = torch.FloatTensor(X)
-    y_tensor = torch.FloatTensor(y)
+    y_tensor = to_tensor(y)
     
     print(f"✅ 학습 데이터 준비: X={X.shape}, y={y.shape}")
     
     # 모델 학습
     print_section("4. 모델 학습")
     
-    model = MAModel(input_size=5)
-    trainer = Trainer(model, lr=config['learning_rate'])
-    
-    print(f"🔄 {config['epochs']} 에폭 학습 시작...")
-    
-    for epoch in range(config['epochs']):
-        loss = trainer.train_epoch(X_tensor, y_tensor)
-        
-        if epoch % 50 == 0:
-            print(f"   Epoch {epoch}/{config['epochs']}: Loss = {loss:.6f}")
-    
-    print(f"✅ 학습 완료")
-    
-    # 모델 저장
     model_path = os.path.join(PROJECT_ROOT, 'model_v0.1.pth')
-    torch.save(model.state_dict(), model_path)
-    print(f"💾 모델 저장: {model_path}")
+    timestamps_ms = to_epoch_ms(arrays.column('timestamp'))
+    
+    # 이전 체크포인트가 같은 피처로 학습됐으면 이어서 학습
+    # 이름만으로는 파라미터(볼린저 num_std, cross_asset 심볼 등)를 구분 못 하므로 선언(specs)을 비교
+    retrainer = None
+    if config['warm_start'] and os.path.exists(model_path):
+        try:
+            retrainer = IncrementalRetrainer(
+                model_path,
+                epochs=config['retrain_epochs'],
+                replay_size=config['replay_size']
+            )
+            saved_schema = retrainer.checkpoint.get('feature_schema')
+            saved_specs = FeatureSchema.from_dict(saved_schema).to_dict()['specs'] if saved_schema else None
+            if saved_specs != schema.to_dict()['specs'] or retrainer.normalizer is None:
+                print(f"   ⚠️  피처 구성이 달라서 처음부터 학습")
+                retrainer = None
+        except Exception as e:
+            print(f"   ⚠️  체크포인트 로드 실패, 처음부터 학습: {e}")
+            retrainer = None
+    
+    if retrainer is not None:
+        # 마지막 학습 이후 캔들만 새 데이터, 나머지는 리플레이
+        trained_until = retrainer.trained_until
+        if trained_until is None:
+            is_new = np.ones(len(X), dtype=bool)
+        else:
+            is_new = timestamps_ms > trained_until
+        
+        retrainer.replay.extend(X[~is_new], y[~is_new])
+        retrain_count = retrainer.retrain_count
+        retrainer.retrain(X[is_new], y[is_new], trained_until=timestamps_ms[-1])
+        
+        # 새 캔들이 없으면 재학습/저장을 생략함
+        saved = retrainer.retrain_count > retrain_count
+        model = retrainer.model
+        trainer = retrainer.trainer
+    else:
+        model = MAModel.from_schema(schema)
+        trainer = Trainer(model, lr=config['learning_rate'])
+        
+        # 정규화 통계는 학습 데이터로 계산, 체크포인트에 함께 저장
+        trainer.fit_normalizer(X)
+        
+        print(f"🔄 {config['epochs']} 에폭 학습 시작...")
+        
+        for epoch in range(config['epochs']):
+            loss = trainer.train_epoch(X, y_tensor)
+            
+            if epoch % 50 == 0:
+                print(f"   Epoch {epoch}/{config['epochs']}: Loss = {loss:.6f}")
+        
+        print(f"✅ 학습 완료")
+        
+        # 모델 저장
+        save_checkpoint(
+            model, model_path,
+            feature_schema=schema,
+            normalizer=trainer.normalizer,
+            optimizer=trainer.optimizer,
+            config=config,
+            trained_until=int(timestamps_ms[-1])
+        )
+        saved = True
+    
+    if saved:
+        print(f"💾 모델 저장: {model_path}")
+    else:
+        print(f"💾 모델 그대로 유지: {model_path}")
     
     # 신호 생성
     print_section("5. 매매 신호 생성")
     
-    strategy = MAStrategy(model)
-    signals = strategy.generate_signals(X_tensor)
+    strategy = MAStrategy(model, normalizer=trainer.normalizer)
+    # 원본 피처는 더 쓰지 않으므로 제자리 정규화 (추가 (N, F) 복사 없음)
+    signals = strategy.generate_signals(X, out=X)
     positions = strategy.get_positions(signals)
     
     # 신호 품질 분석
-    prices = tech.df['close'].values
-    returns = tech.df['future_return'].values
+    prices = arrays.column('close')
+    returns = y
+    timestamps = arrays.column('timestamp')
     strategy.analyze_signals(signals, prices, returns)
     
     # 신호 저장
     signals_df = pd.DataFrame({
-        'timestamp': tech.df['timestamp'].values,
+        'timestamp': timestamps,
         'price': prices,
         'signal': signals,
         'position': positions,
@@ -154,11 +227,23 @@ def main():
     equity_df.to_csv(equity_path, index=False)
     print(f"\n💾 자산 곡선 저장: {equity_path}")
     
+    # 실행 기록 (설정 + 지표 + 바이너리 배열)
+    store = RunStore(os.path.join(PROJECT_ROOT, 'runs'))
+    run_id = store.record(
+        config, metrics,
+        equity_curve=equity_curve,
+        positions=positions,
+        trades=trades,
+        checkpoint=model_path
+    )
+    store.close()
+    print(f"💾 실행 기록: runs/{run_id}")
+    
     # 요약
     print_section("7. 최종 요약")
     
     print(f"\n📊 V0.1 성과:")
-    print(f"   데이터 기간: {tech.df['timestamp'].min()} ~ {tech.df['timestamp'].max()}")
+    print(f"   데이터 기간: {timestamps.min()} ~ {timestamps.max()}")
     print(f"   샘플 수: {len(X)}개")
     print(f"   거래 횟수: {metrics['num_trades']}회")
     print(f"   총 수익률: {metrics['total_return']:.2f}%")
@@ -169,6 +254,7 @@ def main():
     print(f"   1. model_v0.1.pth")
     print(f"   2. trading_signals.csv")
     print(f"   3. equity_curve.csv")
+    print(f"   4. runs/runs.db (실행 #{run_id})")
     
     print(f"\n⚠️  경고:")
     print(f"   V0.1은 학습용 MVP입니다.")
@@ -0,0 +1,231 @@
+"""
+데이터 병렬 CPU 학습 (torch.distributed, gloo, localhost)
+
+한 명령으로 N개 프로세스 실행:
+    python model/distributed.py --data features_dir --procs 8 --epochs 10
+
+확장 효율 측정:
+    python model/distributed.py --data features_dir --scaling 1,2,4,8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch.nn.parallel import DistributedDataParallel
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.normalizer import OnlineNormalizer
+from features.streaming import FeatureFile
+from model.network import MAModel, Trainer, load_checkpoint, save_checkpoint
+
+
+class ShardedBatches:
+    """
+    프로세스별로 겹치지 않는 미니배치
+
+    에폭마다 모든 프로세스가 같은 시드로 섞은 뒤 rank번째 몫만 사용
+    (all-reduce가 멈추지 않도록 모든 rank의 배치 수를 같게 맞춤)
+    """
+
+    def __init__(self, X, y, batch_size, rank, world_size, seed=0):
+        self.X = X
+        self.y = y
+        self.batch_size = batch_size
+        self.rank = rank
+        self.world_size = world_size
+        self.seed = seed
+
+        # rank당 배치 수 (나머지는 버림)
+        self.num_batches = len(X) // (batch_size * world_size)
+
+    def __len__(self):
+        return self.num_batches
+
+    def epoch(self, epoch):
+        order = np.random.default_rng(self.seed + epoch).permutation(len(self.X))
+        shard = order[self.rank::self.world_size][:self.num_batches * self.batch_size]
+
+        for i in range(0, len(shard), self.batch_size):
+            # 메모리 맵에서 연속 읽기가 되도록 배치 안은 정렬
+            rows = np.sort(shard[i:i + self.batch_size])
+            yield self.X[rows], self.y[rows]
+
+
+def _setup(rank, world_size, port, threads):
+    os.environ['MASTER_ADDR'] = '127.0.0.1'
+    os.environ['MASTER_PORT'] = str(port)
+    torch.set_num_threads(threads)
+    dist.init_process_group('gloo', rank=rank, world_size=world_size)
+
+
+def _worker(rank, world_size, config, results):
+    """프로세스 1개: 자기 몫의 배치로 학습, 기울기는 DDP가 all-reduce"""
+    _setup(rank, world_size, config['port'], config['threads_per_proc'])
+
+    try:
+        data = FeatureFile(config['data'])
+        num_features = data.X.shape[1]
+
+        # 이어서 학습 / 새로 시작
+        start_epoch = 0
+        checkpoint = None
+        if config['resume'] and os.path.exists(config['checkpoint']):
+            model, checkpoint = load_checkpoint(config['checkpoint'])
+            normalizer = checkpoint['normalizer']
+            start_epoch = checkpoint['metadata'].get('epoch', -1) + 1
+        else:
+            model = MAModel(input_size=num_features, feature_names=data.feature_names)
+            normalizer = OnlineNormalizer(num_features).fit(data.X, chunk_size=1_000_000)
+
+        # DDP: 생성 시 rank 0 파라미터를 방송, backward 때 기울기 all-reduce
+        # 유효 배치가 world_size배라도 Adam은 선형 학습률 스케일링 규칙(SGD용)이 맞지 않아 scale_lr일 때만 적용
+        lr = config['learning_rate'] * (world_size if config.get('scale_lr') else 1)
+        ddp_model = DistributedDataParallel(model)
+        trainer = Trainer(ddp_model, lr=lr, normalizer=normalizer)
+
+        if checkpoint is not None and checkpoint.get('optimizer') is not None:
+            trainer.optimizer.load_state_dict(checkpoint['optimizer'])
+            # 복원한 상태에는 이전 실행의 학습률이 들어 있음 (프로세스 수가 바뀌었을 수 있음)
+            for group in trainer.optimizer.param_groups:
+                group['lr'] = lr
+
+        batches = ShardedBatches(data.X, data.y, config['batch_size'], rank, world_size,
+                                 seed=config['seed'])
+
+        if rank == 0:
+            print(f"🔄 {world_size}개 프로세스 학습 시작 "
+                  f"(에폭 {start_epoch}~{config['epochs'] - 1}, rank당 배치 {len(batches)}개)")
+
+        dist.barrier()
+        started = time.perf_counter()
+
+        for epoch in range(start_epoch, config['epochs']):
+            loss = trainer.train_batches(batches.epoch(epoch))
+
+            # rank별 loss 평균
+            loss_tensor = torch.tensor([loss])
+            dist.all_reduce(loss_tensor)
+            loss = loss_tensor.item() / world_size
+
+            if rank == 0:
+                print(f"   Epoch {epoch}/{config['epochs']}: Loss = {loss:.6f}")
+                if config['checkpoint']:
+                    save_checkpoint(
+                        model, config['checkpoint'],
+                        normalizer=normalizer,
+                        optimizer=trainer.optimizer,
+                        epoch=epoch,
+                        world_size=world_size
+                    )
+
+        dist.barrier()
+        elapsed = time.perf_counter() - started
+
+        if rank == 0 and results is not None:
+            epochs_run = max(config['epochs'] - start_epoch, 0)
+            samples = epochs_run * len(batches) * config['batch_size'] * world_size
+            results.put({
+                'world_size': world_size,
+                'seconds': elapsed,
+                'samples_per_sec': samples / elapsed if elapsed > 0 else 0.0,
+            })
+    finally:
+        dist.destroy_process_group()
+
+
+def launch(config, world_size):
+    """
+    world_size개 프로세스로 학습 실행
+
+    Returns:
+        rank 0 결과 (시간, 처리량)
+    """
+    ctx = mp.get_context('spawn')
+    results = ctx.SimpleQueue()
+
+    mp.spawn(_worker, args=(world_size, config, results), nprocs=world_size, join=True)
+
+    return results.get() if not results.empty() else None
+
+
+def scaling_report(config, world_sizes):
+    """
+    프로세스 수별 처리량과 확장 효율 (처리량_N / (N × 처리량_1))
+    """
+    print(f"\n" + "=" * 60)
+    print(f"📊 확장 효율 측정: {world_sizes}")
+    print(f"=" * 60)
+
+    # 측정은 매번 처음부터, 체크포인트 저장 안 함
+    config = dict(config, resume=False, checkpoint=None)
+
+    reports = []
+    for world_size in world_sizes:
+        config['threads_per_proc'] = max(config['total_threads'] // world_size, 1)
+        reports.append(launch(config, world_size))
+
+    base = reports[0]['samples_per_sec'] / reports[0]['world_size']
+
+    print(f"\n{'프로세스':>8} {'샘플/초':>14} {'가속':>8} {'효율':>8}")
+    for report in reports:
+        n = report['world_size']
+        speedup = report['samples_per_sec'] / base
+        print(f"{n:>8} {report['samples_per_sec']:>14,.0f} {speedup:>7.2f}x {speedup / n * 100:>7.1f}%")
+    print(f"=" * 60)
+
+    return reports
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='데이터 병렬 CPU 학습')
+    parser.add_argument('--data', required=True, help='FeatureFile 폴더')
+    parser.add_argument('--procs', type=int, default=max(os.cpu_count() // 4, 1))
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=1024)
+    parser.add_argument('--lr', type=float, default=0.001)
+    parser.add_argument('--scale-lr', action='store_true', help='학습률 × 프로세스 수 (선형 스케일링, SGD용 규칙)')
+    parser.add_argument('--checkpoint', default=os.path.join(PROJECT_ROOT, 'model_dp.pth'))
+    parser.add_argument('--resume', action='store_true')
+    parser.add_argument('--port', type=int, default=29500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scaling', default=None, help='예: 1,2,4,8')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    total_threads = os.cpu_count()
+    config = {
+        'data': args.data,
+        'epochs': args.epochs,
+        'batch_size': args.batch_size,
+        'learning_rate': args.lr,
+        'scale_lr': args.scale_lr,
+        'checkpoint': args.checkpoint,
+        'resume': args.resume,
+        'port': args.port,
+        'seed': args.seed,
+        'total_threads': total_threads,
+        'threads_per_proc': max(total_threads // args.procs, 1),
+    }
+
+    print("=" * 60)
+    print("🚀 데이터 병렬 학습 V0.1 (gloo)")
+    print("=" * 60)
+
+    if args.scaling:
+        scaling_report(config, [int(n) for n in args.scaling.split(',')])
+    else:
+        report = launch(config, args.procs)
+        print(f"\n✅ 학습 완료: {report['seconds']:.1f}초, {report['samples_per_sec']:,.0f} 샘플/초")
+        print(f"💾 체크포인트: {config['checkpoint']}")
@@ -1,17 +1,54 @@
+import numpy as np
 import torch
 import torch.nn as nn
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.normalizer import OnlineNormalizer
+
+
+def to_tensor(array):
+    """
+    numpy 배열 → float32 텐서 (float32 C-연속이면 복사 없음)
+    
+    torch.FloatTensor(X)와 달리 메모리를 공유함
+    """
+    if isinstance(array, torch.Tensor):
+        return array
+    return torch.from_numpy(np.ascontiguousarray(array, dtype=np.float32))
+
+def normalize_tensor(X, normalizer=None, out=None):
+    """
+    원본 피처 → 정규화된 float32 텐서 (정규화 통계가 없으면 그대로)
+    
+    학습(Trainer)과 추론(MAStrategy)이 같은 변환을 쓰도록 공유
+    out: 결과를 기록할 float32 배열 (X 자신이면 제자리 정규화, 복사 없음)
+    """
+    if normalizer is None:
+        return to_tensor(X)
+    if isinstance(X, torch.Tensor):
+        X = X.numpy()
+    return to_tensor(normalizer.transform(X, out=out))
 
 class MAModel(nn.Module):
     """
     이동평균 기반 트레이딩 모델
     
-    입력: [ma5, ma20, ma50, ma5_20_diff, ma20_50_diff]
+    입력: [ma5, ma20, ma50, ma5_20_diff, ma20_50_diff] (기본)
+          또는 FeatureSchema에 선언한 피처
     출력: 예측 수익률
     """
     
-    def __init__(self, input_size=5):
+    def __init__(self, input_size=5, feature_names=None):
         super().__init__()  # nn.Module 초기화 (필수!)
         
+        self.input_size = input_size
+        self.feature_names = feature_names
+        
         # 레이어 정의
         self.network = nn.Sequential(
             nn.Linear(input_size, 32),  # 5 → 32
@@ -25,6 +62,13 @@ class MAModel(nn.Module):
             nn.Linear(16, 1)            # 16 → 1 (수익률)
         )
     
+    @classmethod
+    def from_schema(cls, schema):
+        """
+        피처 스키마에서 입력 크기 결정
+        """
+        return cls(input_size=schema.num_features, feature_names=schema.names)
+    
     def forward(self, x):
         """
         순전파 (입력 → 출력)
@@ -32,32 +76,261 @@ class MAModel(nn.Module):
         return self.network(x)
 
 
+class MultiHorizonMAModel(nn.Module):
+    """
+    여러 기간 수익률을 한 번에 예측하는 모델
+    
+    MAModel과 같은 몸통(trunk)을 공유하고 마지막 층만 기간 수(H)만큼 출력
+    입력: (배치, 피처)
+    출력: (배치, H) 기간별 예측 수익률
+    """
+    
+    def __init__(self, input_size=5, feature_names=None, horizons=(1, 4, 24)):
+        super().__init__()
+        
+        self.input_size = input_size
+        self.feature_names = feature_names
+        self.horizons = list(horizons)
+        
+        # 공유 몸통
+        self.trunk = nn.Sequential(
+            nn.Linear(input_size, 32),
+            nn.ReLU(),
+            nn.Dropout(0.2),
+            
+            nn.Linear(32, 16),
+            nn.ReLU(),
+            nn.Dropout(0.2),
+        )
+        
+        # 기간별 출력 (한 층에 H개)
+        self.heads = nn.Linear(16, len(self.horizons))
+    
+    @classmethod
+    def from_schema(cls, schema, horizons=(1, 4, 24)):
+        return cls(input_size=schema.num_features, feature_names=schema.names, horizons=horizons)
+    
+    def forward(self, x):
+        """
+        순전파: (B, F) → (B, H)
+        """
+        return self.heads(self.trunk(x))
+
+
+class LSTMModel(nn.Module):
+    """
+    시퀀스 모델 (V0.3 준비)
+    
+    입력: (배치, 윈도우, 피처) - WindowDataset 배치
+    출력: 마지막 시점의 예측 수익률
+    """
+    
+    def __init__(self, input_size=5, feature_names=None, hidden_size=32, num_layers=1):
+        super().__init__()
+        
+        self.input_size = input_size
+        self.feature_names = feature_names
+        
+        self.lstm = nn.LSTM(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            num_layers=num_layers,
+            batch_first=True
+        )
+        self.head = nn.Linear(hidden_size, 1)
+    
+    @classmethod
+    def from_schema(cls, schema, **kwargs):
+        return cls(input_size=schema.num_features, feature_names=schema.names, **kwargs)
+    
+    def forward(self, x):
+        """
+        순전파: (B, W, F) → (B, 1)
+        """
+        output, _ = self.lstm(x)
+        return self.head(output[:, -1])
+
+
+def _schema_dict(feature_schema):
+    """FeatureSchema 또는 이미 dict로 저장된 스키마"""
+    if feature_schema is None or isinstance(feature_schema, dict):
+        return feature_schema
+    return feature_schema.to_dict()
+
+
+# 체크포인트의 model_class → 클래스
+MODELS = {
+    'MAModel': MAModel,
+    'MultiHorizonMAModel': MultiHorizonMAModel,
+    'LSTMModel': LSTMModel,
+}
+
+
+def save_checkpoint(model, path, feature_schema=None, normalizer=None, optimizer=None, **metadata):
+    """
+    모델 + 메타데이터 저장
+    
+    Args:
+        model: MAModel
+        path: 저장 경로 (.pth)
+        feature_schema: FeatureSchema 또는 to_dict() 결과 (피처 이름/파라미터 기록)
+        normalizer: OnlineNormalizer (학습 때 사용한 평균/분산)
+        optimizer: 옵티마이저 (이어서 학습할 때 필요)
+        metadata: 추가 정보 (에폭, 설정 등)
+    """
+    checkpoint = {
+        'state_dict': model.state_dict(),
+        'model_class': type(model).__name__,
+        'input_size': model.input_size,
+        'feature_names': model.feature_names,
+        'horizons': getattr(model, 'horizons', None),
+        'feature_schema': _schema_dict(feature_schema),
+        'normalizer': normalizer.state_dict() if normalizer is not None else None,
+        'optimizer': optimizer.state_dict() if optimizer is not None else None,
+        'metadata': metadata,
+    }
+    
+    # 임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)
+    tmp_path = f"{path}.tmp"
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, model_cls=None):
+    """
+    체크포인트 로드 (V0.1의 state_dict만 있는 파일도 지원)
+    
+    Returns:
+        model, checkpoint dict
+    """
+    checkpoint = torch.load(path, map_location='cpu')
+    
+    if 'state_dict' not in checkpoint:
+        # V0.1: state_dict만 저장됨 → 입력 크기는 첫 레이어에서 추론
+        state_dict = checkpoint
+        checkpoint = {
+            'state_dict': state_dict,
+            'input_size': state_dict['network.0.weight'].shape[1],
+            'feature_names': None,
+            'horizons': None,
+            'feature_schema': None,
+            'normalizer': None,
+            'optimizer': None,
+            'metadata': {},
+        }
+    
+    # 저장된 클래스 이름으로 모델 선택
+    model_cls = model_cls or MODELS.get(checkpoint.get('model_class'), MAModel)
+    
+    kwargs = {}
+    if checkpoint.get('horizons'):
+        kwargs['horizons'] = checkpoint['horizons']
+    
+    model = model_cls(
+        input_size=checkpoint['input_size'],
+        feature_names=checkpoint['feature_names'],
+        **kwargs
+    )
+    model.load_state_dict(checkpoint['state_dict'])
+    
+    # 정규화 통계 복원 (없으면 None)
+    if checkpoint.get('normalizer') is not None:
+        checkpoint['normalizer'] = OnlineNormalizer.from_state_dict(checkpoint['normalizer'])
+    
+    return model, checkpoint
+
+
 class Trainer:
     """
     모델 학습 담당
     """
     
-    def __init__(self, model, lr=0.001):
+    def __init__(self, model, lr=0.001, normalizer=None, horizon_weights=None, sharpness=10.0):
         self.model = model
+        self.sharpness = sharpness
         self.optimizer = torch.optim.Adam(
             model.parameters(), 
             lr=lr
         )
+        self.normalizer = normalizer
+        self._buffer = None   # 정규화 결과 재사용 버퍼 (_workspace)
+        
+        # 여러 기간 모델: 기간별 손실 가중치 (기본: 균등)
+        self.horizon_weights = None
+        if horizon_weights is not None:
+            weights = torch.as_tensor(horizon_weights, dtype=torch.float32)
+            self.horizon_weights = weights / weights.sum()
+    
+    def fit_normalizer(self, X):
+        """
+        학습 데이터로 정규화 통계 계산
+        
+        이후 train_epoch / train_batches / evaluate가 원본 피처를 받아서 정규화함
+        
+        Args:
+            X: (N, F) 원본 피처
+        
+        Returns:
+            OnlineNormalizer
+        """
+        self.normalizer = OnlineNormalizer(X.shape[1]).fit(np.asarray(X))
+        return self.normalizer
+    
+    def normalize(self, X, out=None):
+        """
+        원본 피처 → 정규화된 텐서 (정규화 통계가 없으면 그대로)
+        """
+        return normalize_tensor(X, self.normalizer, out=out)
+    
+    def _workspace(self, X):
+        """
+        정규화 결과를 받을 재사용 버퍼 (에폭/배치마다 복사본을 새로 할당하지 않음)
+        
+        다음 호출에서 덮어쓰므로 학습 메서드 안에서만 사용
+        """
+        if self.normalizer is None:
+            return None
+        
+        shape = tuple(X.shape)
+        buffer = self._buffer
+        if buffer is None or buffer.shape[1:] != shape[1:] or len(buffer) < shape[0]:
+            buffer = self._buffer = np.empty(shape, dtype=np.float32)
+        return buffer[:shape[0]]
     
     def profit_loss(self, predictions, actual_returns):
         """
         커스텀 손실: 수익 최대화
         
         예측 부호와 실제 수익률 부호가 일치하면 보상
+        
+        sign은 기울기가 0이라 학습이 안 되므로 tanh(sharpness × 예측)으로 근사
+        
+        여러 기간 (B, H)이면 기간별 손실을 가중 평균 (한 번의 역전파로 전부 학습)
+        
+        분기는 레이블 모양으로 결정 (H=1인 (B, 1) 레이블도 기간별 경로)
+        예측은 레이블 모양에 맞춤 ((B, 1) × (B,)가 (B, B)로 브로드캐스트되지 않도록)
         """
-        signals = torch.sign(predictions.squeeze())
+        predictions = predictions.reshape(actual_returns.shape)
+        signals = torch.tanh(self.sharpness * predictions)
+        
+        if actual_returns.dim() == 2:
+            horizon_loss = -(signals * actual_returns).mean(dim=0)  # (H,)
+            
+            if self.horizon_weights is None:
+                return horizon_loss.mean()
+            return (horizon_loss * self.horizon_weights).sum()
+        
         returns = signals * actual_returns
         return -returns.mean()
     
     def train_epoch(self, X, y):
         """
         1 에폭 학습
+        
+        X는 원본 피처 (정규화 통계가 있으면 정규화), y는 텐서 또는 float32 numpy 배열
         """
+        X, y = self.normalize(X, out=self._workspace(X)), to_tensor(y)
+        
         self.model.train()  # 학습 모드 (Dropout 작동)
         
         # Forward
@@ -71,10 +344,43 @@ class Trainer:
         
         return loss.item()
     
+    def train_batches(self, batches):
+        """
+        미니배치 1 에폭 학습
+        
+        Args:
+            batches: (X_batch, y_batch) 반복자 (예: WindowDataset.batches())
+        
+        Returns:
+            평균 loss
+        """
+        self.model.train()
+        
+        total_loss = 0.0
+        total_count = 0
+        
+        for X_batch, y_batch in batches:
+            X_batch = self.normalize(X_batch, out=self._workspace(X_batch))
+            y_batch = to_tensor(y_batch)
+            
+            predictions = self.model(X_batch)
+            loss = self.profit_loss(predictions, y_batch)
+            
+            self.optimizer.zero_grad()
+            loss.backward()
+            self.optimizer.step()
+            
+            total_loss += loss.item() * len(y_batch)
+            total_count += len(y_batch)
+        
+        return total_loss / max(total_count, 1)
+    
     def evaluate(self, X, y):
         """
-        평가 (Dropout 꺼짐)
+        평가 (Dropout 꺼짐, 원본 피처는 학습과 같이 정규화)
         """
+        X, y = self.normalize(X, out=self._workspace(X)), to_tensor(y)
+        
         self.model.eval()  # 평가 모드
         
         with torch.no_grad():  # 기울기 계산 안 함
@@ -108,4 +414,17 @@ if __name__ == "__main__":
     
     # 평가
     eval_loss = trainer.evaluate(X, y)
-    print(f"\n평가 Loss: {eval_loss:.4f}")
\ No newline at end of file
+    print(f"\n평가 Loss: {eval_loss:.4f}")
+    
+    # 기간 1개 모델: (N, 1) 예측 × (N, 1) 레이블이 (N, N)으로 퍼지지 않는지
+    single = MultiHorizonMAModel(input_size=5, horizons=[1])
+    trainer = Trainer(single, lr=0.001)
+    single.eval()
+    with torch.no_grad():
+        predictions = single(X)
+    y_2d = y.reshape(-1, 1)
+    expected = -(torch.tanh(trainer.sharpness * predictions) * y_2d).mean()
+    loss = trainer.profit_loss(predictions, y_2d)
+    assert torch.allclose(loss, expected), (loss, expected)
+    assert torch.allclose(trainer.profit_loss(predictions, y), expected)
+    print(f"H=1 Loss: {loss.item():.4f} ✅")
\ No newline at end of file
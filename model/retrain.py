@@ -0,0 +1,270 @@
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from features.window import WindowDataset
+from model.network import Trainer, load_checkpoint, save_checkpoint
+
+
+class ReplayBuffer:
+    """
+    최근 이력 고정 크기 링 버퍼 (원본 피처 float32)
+
+    재학습 때 새 캔들과 섞어서 예전 패턴을 잊지 않도록 함
+    """
+
+    def __init__(self, capacity, num_features, label_shape=()):
+        self.capacity = capacity
+        self.X = np.empty((capacity, num_features), dtype=np.float32)
+        self.y = np.empty((capacity,) + tuple(label_shape), dtype=np.float32)
+        self.size = 0
+        self.head = 0   # 다음에 쓸 위치
+
+    def extend(self, X, y):
+        """행 추가 (가득 차면 오래된 것부터 덮어씀)"""
+        X = np.asarray(X)[-self.capacity:]
+        y = np.asarray(y)[-self.capacity:]
+        n = len(X)
+        if n == 0:
+            return
+
+        rows = (self.head + np.arange(n)) % self.capacity
+        self.X[rows] = X
+        self.y[rows] = y
+
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def sample(self, n, rng):
+        """무작위 n개 (복원 없음)"""
+        n = min(n, self.size)
+        rows = rng.choice(self.size, size=n, replace=False)
+        return self.X[rows], self.y[rows]
+
+    def __len__(self):
+        return self.size
+
+
+class IncrementalRetrainer:
+    """
+    마지막 체크포인트에서 이어서 미세조정 (warm start)
+
+    - 모델 / 옵티마이저 / 정규화 통계를 체크포인트에서 복원
+    - 새 캔들 + 리플레이 버퍼 일부로 몇 에폭만 학습
+    - 주기(interval) 또는 피처 드리프트(drift_threshold)로 실행
+    - 학습은 복사본에서 하고 끝나면 체크포인트 저장 + 실시간 모델 교체
+    """
+
+    def __init__(self, checkpoint_path, lr=None, epochs=20, batch_size=256,
+                 replay_size=5000, replay_ratio=4.0, interval=3600,
+                 drift_threshold=1.0, min_new=1, on_swap=None, seed=0):
+        """
+        초기화
+
+        Args:
+            checkpoint_path: 체크포인트 경로 (읽고 덮어씀)
+            lr: 미세조정 학습률 (None이면 저장된 옵티마이저 값)
+            epochs: 재학습 에폭 수
+            batch_size: 배치 크기
+            replay_size: 리플레이 버퍼 크기
+            replay_ratio: 새 캔들 1개당 섞을 리플레이 샘플 수
+            interval: 재학습 주기 (초)
+            drift_threshold: 새 캔들 피처 평균이 학습 평균에서 벗어난 정도 (표준편차 단위)
+            min_new: 재학습에 필요한 최소 새 캔들 수
+            on_swap: 모델 교체 콜백 fn(model, normalizer)
+            seed: 난수 시드
+        """
+        self.checkpoint_path = checkpoint_path
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.replay_ratio = replay_ratio
+        self.interval = interval
+        self.drift_threshold = drift_threshold
+        self.min_new = min_new
+        self.on_swap = on_swap
+        self.rng = np.random.default_rng(seed)
+
+        self.model, self.checkpoint = load_checkpoint(checkpoint_path)
+        self.normalizer = self.checkpoint['normalizer']
+        self.metadata = dict(self.checkpoint.get('metadata') or {})
+
+        self.trainer = self._make_trainer(self.model)
+        if lr is not None:
+            for group in self.trainer.optimizer.param_groups:
+                group['lr'] = lr
+        self.lr = lr
+
+        label_shape = (len(self.model.horizons),) if getattr(self.model, 'horizons', None) else ()
+        self.replay = ReplayBuffer(replay_size, self.model.input_size, label_shape)
+
+        self._pending_X = []
+        self._pending_y = []
+        self.last_retrain = time.monotonic()
+        self.retrain_count = self.metadata.get('retrain_count', 0)
+
+        print(f"✅ 체크포인트 로드: {checkpoint_path} (재학습 {self.retrain_count}회)")
+
+    def _make_trainer(self, model):
+        trainer = Trainer(model, normalizer=self.normalizer)
+        if self.checkpoint.get('optimizer') is not None:
+            trainer.optimizer.load_state_dict(self.checkpoint['optimizer'])
+        return trainer
+
+    @property
+    def feature_names(self):
+        return self.model.feature_names
+
+    @property
+    def trained_until(self):
+        """마지막으로 학습한 캔들 시각 (밀리초, 없으면 None)"""
+        return self.metadata.get('trained_until')
+
+    @property
+    def num_pending(self):
+        return sum(len(X) for X in self._pending_X)
+
+    def add(self, X, y):
+        """
+        새 캔들 추가 (다음 재학습 때 사용)
+
+        Args:
+            X: (N, F) 원본 피처
+            y: (N,) 또는 (N, H) 레이블
+        """
+        if len(X) == 0:
+            return
+        self._pending_X.append(np.asarray(X, dtype=np.float32))
+        self._pending_y.append(np.asarray(y, dtype=np.float32))
+
+    def drift(self):
+        """
+        새 캔들 피처 평균의 드리프트 (학습 평균 대비 표준편차 단위, 피처 중 최대)
+        """
+        if self.num_pending == 0 or self.normalizer is None:
+            return 0.0
+
+        X = np.concatenate(self._pending_X)
+        z = (X.mean(axis=0, dtype=np.float64) - self.normalizer.mean) / np.maximum(
+            self.normalizer.std, self.normalizer.eps
+        )
+        return float(np.abs(z).max())
+
+    def should_retrain(self, now=None):
+        """
+        재학습 조건: 새 캔들이 있고 (주기 경과 또는 드리프트 초과)
+
+        Returns:
+            (bool, 이유)
+        """
+        if self.num_pending < self.min_new:
+            return False, None
+
+        now = time.monotonic() if now is None else now
+        if now - self.last_retrain >= self.interval:
+            return True, 'schedule'
+
+        drift = self.drift()
+        if drift >= self.drift_threshold:
+            return True, f'drift {drift:.2f}'
+
+        return False, None
+
+    def retrain(self, X_new=None, y_new=None, trained_until=None):
+        """
+        새 캔들 + 리플레이로 미세조정 후 모델 교체
+
+        Args:
+            X_new, y_new: 새 캔들 (없으면 add로 쌓인 것)
+            trained_until: 새 캔들의 마지막 시각 (밀리초, 메타데이터용)
+
+        Returns:
+            마지막 에폭 loss (epochs=0이면 None, 저장 여부는 retrain_count로 확인)
+        """
+        if X_new is not None:
+            self.add(X_new, y_new)
+
+        if self.num_pending == 0:
+            print(f"   ⚠️  새 캔들 없음, 재학습 생략")
+            return None
+
+        X_new = np.concatenate(self._pending_X)
+        y_new = np.concatenate(self._pending_y)
+
+        # 새 캔들 + 리플레이 샘플
+        num_replay = int(len(X_new) * self.replay_ratio)
+        X_replay, y_replay = self.replay.sample(num_replay, self.rng) if len(self.replay) else (
+            X_new[:0], y_new[:0]
+        )
+        X = np.concatenate([X_new, X_replay])
+        y = np.concatenate([y_new, y_replay])
+
+        print(f"\n🔄 재학습: 새 캔들 {len(X_new)}개 + 리플레이 {len(X_replay)}개, {self.epochs} 에폭")
+        started = time.perf_counter()
+
+        # 복사본에서 학습 (실시간 모델은 그대로 동작)
+        model = copy.deepcopy(self.model)
+        trainer = Trainer(model, normalizer=self.normalizer)
+        trainer.optimizer.load_state_dict(self.trainer.optimizer.state_dict())
+
+        dataset = WindowDataset(X, y, window=1)
+        loss = None
+        for epoch in range(self.epochs):
+            loss = trainer.train_batches(
+                dataset.batches(batch_size=self.batch_size, seed=int(self.rng.integers(2**31)))
+            )
+
+        elapsed = time.perf_counter() - started
+        loss_text = 'N/A' if loss is None else f'{loss:.6f}'
+        print(f"   ✅ 재학습 완료: Loss = {loss_text} ({elapsed:.2f}초)")
+
+        # 교체: 참조만 바꿈
+        self.model = model
+        self.trainer = trainer
+        self.replay.extend(X_new, y_new)
+        self._pending_X, self._pending_y = [], []
+        self.last_retrain = time.monotonic()
+        self.retrain_count += 1
+
+        self.metadata['retrain_count'] = self.retrain_count
+        self.metadata['last_retrain_loss'] = loss
+        if trained_until is not None:
+            self.metadata['trained_until'] = int(trained_until)
+
+        self.save()
+
+        if self.on_swap is not None:
+            self.on_swap(model, self.normalizer)
+
+        return loss
+
+    def maybe_retrain(self, now=None, trained_until=None):
+        """
+        조건이 맞으면 재학습 (실시간 루프에서 매 캔들 호출)
+
+        Returns:
+            재학습했으면 True
+        """
+        should, reason = self.should_retrain(now)
+        if not should:
+            return False
+
+        print(f"\n⏰ 재학습 조건 충족: {reason}")
+        self.retrain(trained_until=trained_until)
+        return True
+
+    def save(self, path=None):
+        """체크포인트 저장 (임시 파일 → 교체, 원자적)"""
+        save_checkpoint(
+            self.model, path or self.checkpoint_path,
+            feature_schema=self.checkpoint.get('feature_schema'),
+            normalizer=self.normalizer,
+            optimizer=self.trainer.optimizer,
+            **self.metadata
+        )
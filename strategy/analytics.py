@@ -0,0 +1,348 @@
+import numpy as np
+
+
+# 혼동 행렬 축 이름
+SIGNAL_CLASSES = ['sell', 'flat', 'buy']   # 신호 < 0, = 0, > 0
+RETURN_CLASSES = ['down', 'up']            # 수익률 <= 0, > 0
+
+
+def _as_runs(array):
+    """(T,) → (1, T), (R, T)는 그대로"""
+    array = np.asarray(array)
+    return array[None, :] if array.ndim == 1 else array
+
+
+def confusion_matrix(signals, returns):
+    """
+    실행별 혼동 행렬
+
+    Args:
+        signals: (R, T) 신호
+        returns: (T,) 또는 (R, T) 미래 수익률
+
+    Returns:
+        (R, 3, 2) 개수 [신호 sell/flat/buy × 수익률 down/up]
+    """
+    signals = _as_runs(signals)
+    returns = np.broadcast_to(_as_runs(returns), signals.shape)
+    num_runs = len(signals)
+
+    valid = ~np.isnan(returns)
+    codes = (np.sign(signals).astype(np.int64) + 1) * 2 + (returns > 0)
+
+    # 실행마다 6칸씩 오프셋을 줘서 bincount 한 번으로 집계
+    offsets = np.arange(num_runs)[:, None] * 6
+    flat = (codes + offsets)[valid]
+    counts = np.bincount(flat, minlength=num_runs * 6)
+
+    return counts.reshape(num_runs, 3, 2)
+
+
+def average_ranks(values):
+    """
+    행별 순위 (0부터, 동점은 평균 순위)
+
+    Args:
+        values: (R, T)
+
+    Returns:
+        (R, T) float64 순위
+    """
+    values = _as_runs(values)
+    num_runs, T = values.shape
+
+    order = np.argsort(values, axis=1, kind='stable')
+    sorted_values = np.take_along_axis(values, order, axis=1)
+
+    # 동점 구간마다 그룹 번호 (행이 바뀌면 새 그룹)
+    starts = np.ones((num_runs, T), dtype=bool)
+    starts[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+    groups = np.cumsum(starts.reshape(-1)) - 1
+
+    positions = np.tile(np.arange(T, dtype=np.float64), num_runs)
+    means = np.bincount(groups, weights=positions) / np.bincount(groups)
+
+    ranks = np.empty((num_runs, T), dtype=np.float64)
+    np.put_along_axis(ranks, order, means[groups].reshape(num_runs, T), axis=1)
+    return ranks
+
+
+def information_coefficient(scores, returns, method='pearson'):
+    """
+    실행별 IC (예측 점수와 미래 수익률의 상관계수)
+
+    Args:
+        scores: (R, T) 예측값 또는 신호
+        returns: (T,) 또는 (R, T)
+        method: 'pearson' 또는 'spearman' (순위 상관, 동점은 평균 순위)
+
+    Returns:
+        (R,) IC
+    """
+    scores = _as_runs(scores).astype(np.float64)
+    returns = np.broadcast_to(_as_runs(returns), scores.shape).astype(np.float64)
+
+    valid = ~(np.isnan(scores) | np.isnan(returns))
+    if not valid.all():
+        # 결측은 평균으로 채워서 공분산에 영향 없게
+        scores = np.where(valid, scores, np.nan)
+        returns = np.where(valid, returns, np.nan)
+        scores = np.where(valid, scores, np.nanmean(scores, axis=1, keepdims=True))
+        returns = np.where(valid, returns, np.nanmean(returns, axis=1, keepdims=True))
+
+    if method == 'spearman':
+        scores = average_ranks(scores)
+        returns = average_ranks(returns)
+    elif method != 'pearson':
+        raise ValueError(f"알 수 없는 방법: {method}")
+
+    scores = scores - scores.mean(axis=1, keepdims=True)
+    returns = returns - returns.mean(axis=1, keepdims=True)
+
+    cov = np.einsum('rt,rt->r', scores, returns)
+    norm = np.sqrt(np.einsum('rt,rt->r', scores, scores) * np.einsum('rt,rt->r', returns, returns))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(norm > 0, cov / norm, 0.0)
+
+
+def hit_rate_by_group(signals, returns, groups, num_groups=None):
+    """
+    그룹별 적중률 (신호 방향 = 수익률 방향), 그룹 집계는 원-핫 행렬곱
+
+    Args:
+        signals: (R, T)
+        returns: (T,) 또는 (R, T)
+        groups: (T,) 그룹 코드 (0 ~ G-1, 음수는 제외)
+        num_groups: 그룹 개수 G
+
+    Returns:
+        hit_rate (R, G), counts (R, G) - 신호가 있던 샘플 수
+    """
+    signals = _as_runs(signals)
+    returns = np.broadcast_to(_as_runs(returns), signals.shape)
+    groups = np.asarray(groups)
+    num_groups = int(groups.max()) + 1 if num_groups is None else num_groups
+
+    active = (signals != 0) & ~np.isnan(returns)
+    hits = active & (np.sign(signals) == np.sign(returns))
+
+    onehot = np.zeros((len(groups), num_groups), dtype=np.float32)
+    in_range = (groups >= 0) & (groups < num_groups)
+    onehot[np.flatnonzero(in_range), groups[in_range]] = 1.0
+
+    counts = active.astype(np.float32) @ onehot
+    hit_counts = hits.astype(np.float32) @ onehot
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hit_rate = np.where(counts > 0, hit_counts / counts, np.nan)
+
+    return hit_rate, counts.astype(np.int64)
+
+
+def volatility_regimes(returns, window=24, num_regimes=3, edges=None):
+    """
+    변동성 구간 코드 (과거 window개 수익률 표준편차의 분위수)
+
+    returns[t]는 t 시점에 예측하는 미래 수익률이라 t 구간은 returns[t-window .. t-1]만 사용
+
+    Args:
+        returns: (T,) 수익률
+        window: 변동성 계산 기간
+        num_regimes: 구간 개수 (3 = 낮음/보통/높음)
+        edges: 구간 경계 (없으면 전체 구간 분위수, 예: 학습 구간 경계를 검증 구간에 재사용)
+
+    Returns:
+        codes (T,) (워밍업 구간은 -1), edges (num_regimes - 1,)
+    """
+    returns = np.nan_to_num(np.asarray(returns, dtype=np.float64))
+    n = len(returns)
+    vol = np.full(n, np.nan)
+
+    if n > window:
+        c1 = np.concatenate([[0.0], np.cumsum(returns[:-1])])
+        c2 = np.concatenate([[0.0], np.cumsum(returns[:-1] ** 2)])
+        s1 = c1[window:] - c1[:-window]
+        s2 = c2[window:] - c2[:-window]
+        vol[window:] = np.sqrt(np.maximum(s2 / window - (s1 / window) ** 2, 0.0))
+
+    valid = ~np.isnan(vol)
+    if edges is None:
+        edges = np.quantile(vol[valid], np.linspace(0, 1, num_regimes + 1)[1:-1]) if valid.any() else np.array([])
+
+    codes = np.full(n, -1, dtype=np.int64)
+    codes[valid] = np.searchsorted(edges, vol[valid], side='right')
+
+    return codes, edges
+
+
+def hour_of_day(timestamps):
+    """타임스탬프 (T,) → 시간 코드 0~23"""
+    values = np.asarray(timestamps).astype('datetime64[ms]')
+    return values.astype('datetime64[h]').astype(np.int64) % 24
+
+
+def holdings_from_signals(signals, long_only=True):
+    """
+    신호 → 보유 상태 (마지막 0이 아닌 신호 유지)
+
+    long_only=True: 매수 신호 후 1, 매도 신호 후 0 (Backtester와 같음)
+    long_only=False: 매수 1, 매도 -1
+
+    Returns:
+        (R, T) 보유 상태 (t 시점 보유 → t의 미래 수익률을 받음)
+    """
+    signals = _as_runs(signals)
+    num_runs, T = signals.shape
+
+    # 0이 아닌 신호의 마지막 위치를 앞으로 채움
+    nonzero = signals != 0
+    idx = np.where(nonzero, np.arange(T), -1)
+    idx = np.maximum.accumulate(idx, axis=1)
+
+    last = np.take_along_axis(np.sign(signals), np.maximum(idx, 0), axis=1)
+    last[idx < 0] = 0
+
+    if long_only:
+        return (last > 0).astype(np.float32)
+    return last.astype(np.float32)
+
+
+def turnover_adjusted_edge(signals, returns, fee=0.001, long_only=True):
+    """
+    실행별 수익 우위 (수수료 반영)
+
+    Returns:
+        edge (R,) 캔들당 평균 수익, turnover (R,) 캔들당 평균 포지션 변화,
+        net_edge (R,) = edge - fee × turnover
+    """
+    held = holdings_from_signals(signals, long_only=long_only)
+    returns = np.broadcast_to(_as_runs(returns), held.shape)
+    returns = np.nan_to_num(returns)
+
+    edge = (held * returns).mean(axis=1)
+
+    changes = np.abs(np.diff(held, axis=1, prepend=0.0))
+    turnover = changes.mean(axis=1)
+
+    return edge, turnover, edge - fee * turnover
+
+
+def analyze_runs(signals, returns, timestamps=None, predictions=None, fee=0.001,
+                 vol_window=24, num_regimes=3, long_only=True):
+    """
+    여러 실행의 신호를 한 번에 분석 (출력 없음)
+
+    Args:
+        signals: (R, T) 또는 (T,) 신호
+        returns: (T,) 또는 (R, T) 미래 수익률
+        timestamps: (T,) 타임스탬프 (시간대별 적중률)
+        predictions: (R, T) 예측값 (IC용, 없으면 신호 사용)
+        fee: 거래 수수료
+        vol_window: 변동성 계산 기간
+        num_regimes: 변동성 구간 개수
+        long_only: 보유 규칙 (Backtester와 같은 롱 전용)
+
+    Returns:
+        dict (실행별 배열)
+    """
+    signals = _as_runs(signals)
+    num_runs, T = signals.shape
+    returns = np.asarray(returns)
+
+    confusion = confusion_matrix(signals, returns)
+    active = confusion[:, [0, 2], :].sum(axis=(1, 2))
+    correct = confusion[:, 0, 0] + confusion[:, 2, 1]
+    total = confusion.sum(axis=(1, 2))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hit_rate = np.where(active > 0, correct / active, np.nan)
+        buy_precision = confusion[:, 2, 1] / confusion[:, 2].sum(axis=1)
+        sell_precision = confusion[:, 0, 0] / confusion[:, 0].sum(axis=1)
+
+    scores = signals if predictions is None else _as_runs(predictions)
+    ic = information_coefficient(scores, returns)
+    rank_ic = information_coefficient(scores, returns, method='spearman')
+
+    edge, turnover, net_edge = turnover_adjusted_edge(signals, returns, fee=fee, long_only=long_only)
+
+    result = {
+        'num_runs': num_runs,
+        'num_samples': T,
+        'confusion': confusion,
+        'hit_rate': hit_rate,
+        'coverage': active / np.maximum(total, 1),
+        'buy_precision': buy_precision,
+        'sell_precision': sell_precision,
+        'ic': ic,
+        'rank_ic': rank_ic,
+        'edge': edge,
+        'turnover': turnover,
+        'net_edge': net_edge,
+    }
+
+    # 변동성 구간은 공통 수익률(1차원)에서 계산
+    market_returns = returns if returns.ndim == 1 else returns[0]
+    regimes, edges = volatility_regimes(market_returns, window=vol_window, num_regimes=num_regimes)
+    result['regime_edges'] = edges
+    result['hit_rate_by_regime'], result['count_by_regime'] = hit_rate_by_group(
+        signals, returns, regimes, num_groups=num_regimes
+    )
+
+    if timestamps is not None:
+        hours = hour_of_day(timestamps)
+        result['hit_rate_by_hour'], result['count_by_hour'] = hit_rate_by_group(
+            signals, returns, hours, num_groups=24
+        )
+
+    return result
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import os
+    import time
+
+    import pandas as pd
+
+    print("=" * 60)
+    print("🚀 신호 분석 V0.1")
+    print("=" * 60)
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    signals_df = pd.read_csv(os.path.join(project_root, 'trading_signals.csv'))
+
+    returns = signals_df['future_return'].to_numpy()
+    timestamps = pd.to_datetime(signals_df['timestamp']).to_numpy()
+
+    # 1개 실행 (trading_signals.csv)
+    result = analyze_runs(signals_df['signal'].to_numpy(), returns, timestamps=timestamps)
+    print(f"\n   적중률: {result['hit_rate'][0] * 100:.1f}%")
+    print(f"   IC: {result['ic'][0]:.4f}, 순위 IC: {result['rank_ic'][0]:.4f}")
+    print(f"   순 우위: {result['net_edge'][0]:.6f} (회전율 {result['turnover'][0]:.3f})")
+    print(f"   변동성 구간별 적중률: {np.round(result['hit_rate_by_regime'][0] * 100, 1)}")
+
+    # 변동성 구간은 과거 수익률만 사용: returns[t]를 바꿔도 t까지의 구간은 그대로
+    regimes, edges = volatility_regimes(returns)
+    t = len(returns) // 2
+    shocked = returns.copy()
+    shocked[t] = shocked[t] * 100 + 0.05
+    shocked_regimes, _ = volatility_regimes(shocked, edges=edges)
+    assert np.array_equal(regimes[:t + 1], shocked_regimes[:t + 1])
+    assert not np.array_equal(regimes[t + 1:], shocked_regimes[t + 1:])
+    print(f"   변동성 구간 선행 참조 없음 ✅")
+
+    # 1만 개 스윕
+    num_runs = 10_000
+    rng = np.random.default_rng(0)
+    predictions = rng.normal(size=(num_runs, len(returns))).astype(np.float32) + returns * 50
+    sweep_signals = np.sign(predictions)
+
+    start = time.perf_counter()
+    result = analyze_runs(sweep_signals, returns, timestamps=timestamps, predictions=predictions)
+    elapsed = time.perf_counter() - start
+
+    best = np.argsort(result['net_edge'])[::-1][:5]
+    print(f"\n   {num_runs:,}개 실행 × {len(returns)}개 시점: {elapsed:.2f}초")
+    print(f"   순 우위 상위 5개: {best}")
+    print(f"   평균 IC: {result['ic'].mean():.4f}")
@@ -13,7 +13,42 @@ sys.path.insert(0, PROJECT_ROOT)
 print(f"📁 프로젝트 루트: {PROJECT_ROOT}\n")
 
 from features.technical import TechnicalFeatures
-from model.network import MAModel, Trainer
+from model.network import MAModel, Trainer, normalize_tensor, to_tensor
+
+
+def position_step(signal, current_position, is_first):
+    """
+    신호 1개 → (실행할 포지션, 새 상태)
+    
+    get_positions와 실시간 루프가 같은 규칙을 쓰도록 분리
+    
+    Args:
+        signal: 신호 (양수=매수, 음수=매도)
+        current_position: 0=무포지션(현금), 1=롱, -1=숏
+        is_first: 첫 신호 여부
+    
+    Returns:
+        action (1=매수, -1=매도, 0=홀드), current_position
+    """
+    # === 수정: 첫 신호가 매도면 무시 ===
+    if is_first and signal < 0:
+        # 처음부터 매도 불가 (코인 없음)
+        return 0, current_position
+    
+    # === 수정: 첫 신호가 매수면 바로 매수 ===
+    if is_first and signal > 0:
+        return 1, 1
+    
+    # 매수 신호 + (무포지션 or 숏)
+    if signal > 0 and current_position <= 0:
+        return 1, 1
+    
+    # 매도 신호 + (무포지션 or 롱)
+    if signal < 0 and current_position >= 0:
+        return -1, -1
+    
+    # 같은 방향
+    return 0, current_position
 
 
 class MAStrategy:
@@ -21,18 +56,73 @@ class MAStrategy:
     이동평균 기반 트레이딩 전략
     """
     
-    def __init__(self, model):
+    def __init__(self, model, normalizer=None, horizon=None, blend=None):
+        """
+        초기화
+        
+        Args:
+            model: MAModel 또는 MultiHorizonMAModel
+            normalizer: 학습 때 쓴 OnlineNormalizer
+            horizon: 여러 기간 모델에서 사용할 기간 (예: 4)
+            blend: 기간별 가중치 {기간: 가중치} (예: {1: 0.5, 24: 0.5})
+        """
         self.model = model
         self.model.eval()
+        self.normalizer = normalizer
+        
+        # 여러 기간 출력 → 신호 1개로 합치는 가중치 (H,)
+        self.weights = None
+        horizons = getattr(model, 'horizons', None)
+        if horizons is not None:
+            weights = np.zeros(len(horizons), dtype=np.float32)
+            if blend is not None:
+                for h, w in blend.items():
+                    weights[horizons.index(h)] = w
+            else:
+                weights[horizons.index(horizon if horizon is not None else horizons[0])] = 1.0
+            self.weights = torch.from_numpy(weights)
+        elif horizon is not None or blend is not None:
+            raise ValueError("horizon/blend는 여러 기간 모델에서만 사용 가능")
+        
         print("✅ 전략 초기화 완료")
     
-    def generate_signals(self, features):
-        """신호 생성"""
-        print(f"\n📡 신호 생성 중...")
+    def _combine(self, predictions):
+        """(B, H) 기간별 예측 → (B,) 선택/가중합"""
+        if self.weights is None:
+            return predictions.squeeze(-1)
+        return predictions @ self.weights
+    
+    def predict(self, features, out=None):
+        """
+        (B, F) 원본 피처 → (B,) 예측 (정규화 + 기간 선택/가중합, 출력 없음)
+        
+        out: 정규화 결과를 기록할 float32 배열 (features 자신이면 제자리, 복사 없음)
+        """
+        features = normalize_tensor(features, self.normalizer, out=out)
         
+        with torch.no_grad():
+            return self._combine(self.model(features))
+    
+    def predict_raw(self, features, out=None):
+        """
+        (B, F) 원본 피처 → (B, H) 기간별 예측 (합치기 전, 다중 전략 평가용)
+        """
+        features = normalize_tensor(features, self.normalizer, out=out)
+
         with torch.no_grad():
             predictions = self.model(features)
-            signals = torch.sign(predictions.squeeze())
+
+        return predictions if predictions.dim() == 2 else predictions.unsqueeze(-1)
+
+    def generate_signals(self, features, out=None):
+        """
+        신호 생성
+        
+        out: 정규화 결과를 기록할 float32 배열 (원본 피처가 더 필요 없으면 features 자신)
+        """
+        print(f"\n📡 신호 생성 중...")
+        
+        signals = torch.sign(self.predict(features, out=out))
         
         signals_np = signals.numpy()
         
@@ -46,6 +136,25 @@ class MAStrategy:
         
         return signals_np
     
+    def signal_for(self, feature_vector):
+        """
+        캔들 1개 신호 (실시간용, 정규화 O(F))
+        
+        Args:
+            feature_vector: (F,) 원본 피처
+        
+        Returns:
+            1.0 (매수), -1.0 (매도), 0.0
+        """
+        if self.normalizer is not None:
+            feature_vector = self.normalizer.transform_one(feature_vector)
+        
+        x = to_tensor(feature_vector).unsqueeze(0)
+        with torch.no_grad():
+            prediction = self._combine(self.model(x))
+        
+        return float(torch.sign(prediction).item())
+    
     def get_positions(self, signals):
         """포지션 계산"""
         print(f"\n🎯 포지션 계산 중...")
@@ -54,31 +163,10 @@ class MAStrategy:
         current_position = 0  # 0=무포지션(현금), 1=롱, -1=숏
         
         for signal in signals:
-            # === 수정: 첫 신호가 매도면 무시 ===
-            if len(positions) == 0 and signal < 0:
-                # 처음부터 매도 불가 (코인 없음)
-                positions.append(0)
-                continue
-            
-            # === 수정: 첫 신호가 매수면 바로 매수 ===
-            if len(positions) == 0 and signal > 0:
-                positions.append(1)
-                current_position = 1
-                continue
-            
-            # 매수 신호 + (무포지션 or 숏)
-            if signal > 0 and current_position <= 0:
-                positions.append(1)
-                current_position = 1
-            
-            # 매도 신호 + (무포지션 or 롱)
-            elif signal < 0 and current_position >= 0:
-                positions.append(-1)
-                current_position = -1
-            
-            # 같은 방향
-            else:
-                positions.append(0)
+            action, current_position = position_step(
+                signal, current_position, is_first=len(positions) == 0
+            )
+            positions.append(action)
         
         positions = np.array(positions)
         
@@ -94,7 +182,11 @@ class MAStrategy:
         return positions
     
     def analyze_signals(self, signals, prices, returns):
-        """신호 품질 분석"""
+        """
+        신호 품질 분석 (실행 1개, 출력 + 요약 dict 반환)
+        
+        여러 실행을 한 번에 분석하려면 strategy.analytics.analyze_runs
+        """
         print(f"\n" + "=" * 60)
         print(f"📊 신호 품질 분석")
         print(f"=" * 60)
@@ -119,6 +211,14 @@ class MAStrategy:
         
         print(f"\n전체 정확도: {accuracy*100:.1f}%")
         print(f"=" * 60)
+        
+        return {
+            'buy_mean_return': buy_signal_returns.mean(),
+            'buy_win_rate': (buy_signal_returns > 0).mean(),
+            'sell_mean_return': -sell_signal_returns.mean(),
+            'sell_win_rate': (sell_signal_returns < 0).mean(),
+            'accuracy': accuracy,
+        }
 
 
 if __name__ == "__main__":
@@ -146,18 +246,19 @@ if __name__ == "__main__":
     
     # 모델 학습
     print(f"\n🔄 모델 학습 중...")
-    model = MAModel(input_size=5)
+    model = MAModel(input_size=len(tech.feature_cols), feature_names=tech.feature_cols)
     trainer = Trainer(model, lr=0.001)
+    trainer.fit_normalizer(X)
     
     for epoch in range(200):
-        loss = trainer.train_epoch(X_tensor, y_tensor)
+        loss = trainer.train_epoch(X, y_tensor)
         if epoch % 10 == 0:
             print(f"   Epoch {epoch}: Loss = {loss:.6f}")
     
     print(f"✅ 학습 완료")
     
     # 전략 실행
-    strategy = MAStrategy(model)
+    strategy = MAStrategy(model, normalizer=trainer.normalizer)
     signals = strategy.generate_signals(X_tensor)
     positions = strategy.get_positions(signals)
     
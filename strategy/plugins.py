@@ -0,0 +1,409 @@
+import itertools
+
+import numpy as np
+
+
+# 이름 → StrategyPlugin
+STRATEGIES = {}
+
+
+class StrategyPlugin:
+    """
+    등록된 매매 규칙
+
+    - fn(ctx, **params): (T,) 신호 (1=매수, -1=매도, 0=없음)
+    - defaults: 파라미터 기본값
+    """
+
+    def __init__(self, name, fn, defaults):
+        self.name = name
+        self.fn = fn
+        self.defaults = defaults
+
+
+def register_strategy(name, defaults):
+    """
+    매매 규칙 등록 데코레이터
+
+    예:
+        @register_strategy('sign', defaults={'threshold': 0.0, 'horizon': None})
+        def sign_rule(ctx, threshold, horizon):
+            p = ctx.prediction(horizon)
+            return np.where(p > threshold, 1, np.where(p < -threshold, -1, 0))
+    """
+    def decorator(fn):
+        STRATEGIES[name] = StrategyPlugin(name, fn, defaults)
+        return fn
+    return decorator
+
+
+class StrategyContext:
+    """
+    모든 규칙이 공유하는 입력 (피처/추론은 한 번만) + 파생값 캐시
+
+    같은 (시계열, 기간)의 이동평균/표준편차는 규칙 간에 한 번만 계산
+    """
+
+    def __init__(self, prices, predictions=None, features=None, feature_names=None, horizons=None):
+        """
+        초기화
+
+        Args:
+            prices: (T,) 가격
+            predictions: (T,) 또는 (T, H) 모델 예측
+            features: (T, F) 원본 피처
+            feature_names: 피처 이름 리스트
+            horizons: 예측 열별 기간 (예: [1, 4, 24])
+        """
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.n = len(self.prices)
+
+        if predictions is not None:
+            predictions = np.asarray(predictions, dtype=np.float32)
+            if predictions.ndim == 1:
+                predictions = predictions[:, None]
+        self.predictions = predictions
+
+        self.features = features
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.horizons = list(horizons) if horizons is not None else None
+
+        self._cache = {}
+
+    @classmethod
+    def from_strategy(cls, strategy, features, prices, feature_names=None):
+        """
+        MAStrategy의 모델로 한 번만 추론해서 컨텍스트 생성
+
+        Args:
+            strategy: MAStrategy (모델 + 정규화)
+            features: (T, F) 원본 피처
+            prices: (T,) 가격
+            feature_names: 피처 이름 (없으면 모델에 저장된 이름)
+        """
+        predictions = strategy.predict_raw(features).numpy()
+        return cls(
+            prices,
+            predictions=predictions,
+            features=np.asarray(features),
+            feature_names=feature_names or getattr(strategy.model, 'feature_names', None),
+            horizons=getattr(strategy.model, 'horizons', None),
+        )
+
+    def cached(self, key, fn):
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def prediction(self, horizon=None):
+        """(T,) 예측 (여러 기간 모델이면 horizon 열, 기본: 첫 열)"""
+        if self.predictions is None:
+            raise ValueError("예측 없이 만든 컨텍스트")
+        if horizon is None:
+            return self.predictions[:, 0]
+        if self.horizons is None or horizon not in self.horizons:
+            raise KeyError(f"예측에 없는 기간: {horizon} (사용 가능: {self.horizons})")
+        return self.predictions[:, self.horizons.index(horizon)]
+
+    def column(self, name):
+        """(T,) 피처 열"""
+        if self.features is None or self.feature_names is None:
+            raise ValueError("피처 없이 만든 컨텍스트")
+        return self.features[:, self.feature_names.index(name)]
+
+    def series(self, name, horizon=None):
+        """'prediction', 'price' 또는 피처 이름 → (T,) float64"""
+        key = ('series', name, horizon)
+        if name == 'prediction':
+            return self.cached(key, lambda: self.prediction(horizon).astype(np.float64))
+        if name == 'price':
+            return self.prices
+        return self.cached(key, lambda: self.column(name).astype(np.float64))
+
+    def _cumsum(self, name, horizon, power):
+        def build():
+            values = self.series(name, horizon) ** power
+            out = np.zeros(self.n + 1)
+            np.cumsum(values, out=out[1:])
+            return out
+        return self.cached(('cumsum', name, horizon, power), build)
+
+    def rolling_mean(self, name, window, horizon=None):
+        """window개 이동평균 (워밍업 구간 NaN)"""
+        def build():
+            c = self._cumsum(name, horizon, 1)
+            out = np.full(self.n, np.nan)
+            out[window - 1:] = (c[window:] - c[:-window]) / window
+            return out
+        return self.cached(('mean', name, horizon, window), build)
+
+    def rolling_std(self, name, window, horizon=None):
+        """window개 이동 표준편차 (모집단, 워밍업 구간 NaN)"""
+        def build():
+            c2 = self._cumsum(name, horizon, 2)
+            mean = self.rolling_mean(name, window, horizon)
+            out = np.full(self.n, np.nan)
+            out[window - 1:] = (c2[window:] - c2[:-window]) / window
+            return np.sqrt(np.maximum(out - mean ** 2, 0.0))
+        return self.cached(('std', name, horizon, window), build)
+
+
+def _threshold_signals(values, buy, sell):
+    return np.where(values > buy, 1, np.where(values < sell, -1, 0)).astype(np.float32)
+
+
+@register_strategy('sign', defaults={'threshold': 0.0, 'horizon': None})
+def sign_rule(ctx, threshold, horizon):
+    """예측 부호 (threshold 안쪽은 신호 없음), threshold=0이면 MAStrategy와 같음"""
+    return _threshold_signals(ctx.prediction(horizon), threshold, -threshold)
+
+
+@register_strategy('band', defaults={'buy': 0.0, 'sell': 0.0, 'horizon': None})
+def band_rule(ctx, buy, sell, horizon):
+    """비대칭 기준: 예측 > buy 매수, 예측 < sell 매도"""
+    return _threshold_signals(ctx.prediction(horizon), buy, sell)
+
+
+@register_strategy('confirm', defaults={'bars': 2, 'threshold': 0.0, 'horizon': None})
+def confirm_rule(ctx, bars, threshold, horizon):
+    """같은 방향 신호가 bars개 연속일 때만"""
+    raw = _threshold_signals(ctx.prediction(horizon), threshold, -threshold)
+
+    c = np.zeros(ctx.n + 1)
+    np.cumsum(raw, out=c[1:])
+    total = np.zeros(ctx.n)
+    total[bars - 1:] = c[bars:] - c[:-bars]
+
+    return np.where(np.abs(total) == bars, raw, 0).astype(np.float32)
+
+
+@register_strategy('zscore', defaults={'window': 168, 'entry': 1.0, 'horizon': None})
+def zscore_rule(ctx, window, entry, horizon):
+    """예측의 이동 z-점수가 ±entry를 넘을 때"""
+    mean = ctx.rolling_mean('prediction', window, horizon)
+    std = ctx.rolling_std('prediction', window, horizon)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (ctx.series('prediction', horizon) - mean) / std
+    return _threshold_signals(np.nan_to_num(z), entry, -entry)
+
+
+@register_strategy('hold', defaults={'threshold': 0.0, 'bars': 24, 'horizon': None})
+def hold_rule(ctx, threshold, bars, horizon):
+    """
+    매수 신호로 진입, 마지막 매수 신호 후 bars개 지나면 청산 (매도 신호는 무시)
+    """
+    buy = ctx.prediction(horizon) > threshold
+
+    idx = np.where(buy, np.arange(ctx.n), -1)
+    last_buy = np.maximum.accumulate(idx)
+    expired = (last_buy >= 0) & (np.arange(ctx.n) - last_buy >= bars)
+
+    return np.where(buy, 1, np.where(expired, -1, 0)).astype(np.float32)
+
+
+@register_strategy('feature', defaults={'column': 'ma5_20_diff', 'threshold': 0.0})
+def feature_rule(ctx, column, threshold):
+    """피처 열 부호 (모델 없는 기준선, 예: 이동평균 교차)"""
+    return _threshold_signals(ctx.column(column), threshold, -threshold)
+
+
+def grid(name, **param_lists):
+    """
+    파라미터 조합 전체 → 규칙 선언 리스트
+
+    예:
+        grid('sign', threshold=[0, 0.001, 0.002])
+        → [('sign', {'threshold': 0}), ('sign', {'threshold': 0.001}), ...]
+    """
+    keys = list(param_lists)
+    return [
+        (name, dict(zip(keys, values)))
+        for values in itertools.product(*(param_lists[k] for k in keys))
+    ]
+
+
+def stack_positions(signals):
+    """
+    (R, T) 신호 → (R, T) 실행할 포지션 (MAStrategy.get_positions를 벡터화)
+
+    position_step 규칙:
+        첫 신호가 매도면 무시, 그 뒤로는 방향이 바뀔 때만 매수(1)/매도(-1)
+    """
+    signals = np.sign(np.asarray(signals))
+    if signals.ndim == 1:
+        signals = signals[None, :]
+    num_runs, T = signals.shape
+
+    effective = signals.copy()
+    effective[:, 0] = np.maximum(effective[:, 0], 0)
+
+    # 직전까지 마지막 0이 아닌 신호 = 현재 상태
+    idx = np.where(effective != 0, np.arange(T), -1)
+    idx = np.maximum.accumulate(idx, axis=1)
+    state = np.take_along_axis(effective, np.maximum(idx, 0), axis=1)
+    state[idx < 0] = 0
+
+    prev = np.zeros_like(state)
+    prev[:, 1:] = state[:, :-1]
+
+    positions = np.zeros((num_runs, T), dtype=np.int64)
+    positions[(effective > 0) & (prev <= 0)] = 1
+    positions[(effective < 0) & (prev >= 0)] = -1
+    return positions
+
+
+class StrategySet:
+    """
+    여러 매매 규칙을 한 번에 평가 (FeatureSchema와 같은 선언 형식)
+
+    예:
+        StrategySet(grid('sign', threshold=[0, 0.001]) + ['confirm', ('zscore', {'entry': 2})])
+
+    모든 규칙이 같은 StrategyContext를 쓰므로 피처 계산/모델 추론은 한 번,
+    포지션은 (R, T) 행렬로 쌓아서 Backtester.run_batch 한 번으로 백테스팅
+    """
+
+    def __init__(self, specs):
+        self.specs = []
+
+        for spec in specs:
+            if isinstance(spec, str):
+                name, params = spec, {}
+            elif isinstance(spec, dict):
+                params = dict(spec)
+                name = params.pop('name')
+            else:
+                name, params = spec
+
+            if name not in STRATEGIES:
+                raise KeyError(f"등록되지 않은 규칙: {name} (사용 가능: {sorted(STRATEGIES)})")
+
+            plugin = STRATEGIES[name]
+            unknown = set(params) - set(plugin.defaults)
+            if unknown:
+                raise ValueError(f"{name}: 알 수 없는 파라미터 {sorted(unknown)}")
+
+            self.specs.append((name, {**plugin.defaults, **params}))
+
+    def __len__(self):
+        return len(self.specs)
+
+    @property
+    def names(self):
+        """규칙별 표시 이름 (기본값과 다른 파라미터만)"""
+        names = []
+        for name, params in self.specs:
+            defaults = STRATEGIES[name].defaults
+            changed = [f"{k}={v}" for k, v in params.items() if defaults.get(k) != v]
+            names.append(f"{name}({', '.join(changed)})")
+        return names
+
+    def signals(self, ctx):
+        """(R, T) 신호 행렬"""
+        out = np.empty((len(self.specs), ctx.n), dtype=np.float32)
+        for r, (name, params) in enumerate(self.specs):
+            out[r] = STRATEGIES[name].fn(ctx, **params)
+        return out
+
+    def positions(self, ctx):
+        """(R, T) 포지션 행렬"""
+        return stack_positions(self.signals(ctx))
+
+    def evaluate(self, ctx, backtester):
+        """
+        모든 규칙을 한 번에 백테스팅
+
+        Args:
+            ctx: StrategyContext
+            backtester: Backtester
+
+        Returns:
+            dict: names, signals (R, T), positions (R, T), metrics (실행별 배열), equity_curves (R, T+1)
+        """
+        signals = self.signals(ctx)
+        positions = stack_positions(signals)
+        metrics, equity_curves = backtester.run_batch(ctx.prices, positions)
+
+        return {
+            'names': self.names,
+            'signals': signals,
+            'positions': positions,
+            'metrics': metrics,
+            'equity_curves': equity_curves,
+        }
+
+    def to_dict(self):
+        return {
+            'specs': [{'name': name, **params} for name, params in self.specs],
+            'names': self.names,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['specs'])
+
+
+def print_ranking(result, key='sharpe_ratio', top=10):
+    """평가 결과 상위 규칙 출력"""
+    metrics = result['metrics']
+    order = np.argsort(metrics[key])[::-1][:top]
+
+    print(f"\n" + "=" * 60)
+    print(f"🏆 규칙 순위 ({key} 기준, 상위 {len(order)}개 / {len(result['names'])}개)")
+    print(f"=" * 60)
+    print(f"{'규칙':<32} {'수익률':>9} {'샤프':>7} {'낙폭':>7} {'거래':>5}")
+    for r in order:
+        print(f"{result['names'][r]:<32} {metrics['total_return'][r]:>8.2f}% "
+              f"{metrics['sharpe_ratio'][r]:>7.2f} {metrics['max_drawdown'][r]:>6.2f}% "
+              f"{int(metrics['num_trades'][r]):>5}")
+    print(f"=" * 60)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+
+    import pandas as pd
+
+    # === 경로 설정 ===
+    PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, PROJECT_ROOT)
+
+    from backtest.engine import Backtester
+
+    print("=" * 60)
+    print("🚀 다중 전략 평가 V0.1")
+    print("=" * 60)
+
+    signals_df = pd.read_csv(os.path.join(PROJECT_ROOT, 'trading_signals.csv'))
+    prices = signals_df['price'].to_numpy()
+    returns = signals_df['future_return'].to_numpy()
+
+    # 모델 예측 대신: 수익률 + 노이즈 (추론은 한 번만 한다고 가정)
+    rng = np.random.default_rng(0)
+    predictions = returns * 0.3 + rng.normal(0, 0.003, size=len(returns))
+    ctx = StrategyContext(prices, predictions=predictions)
+
+    backtester = Backtester(initial_capital=10000, fee=0.001)
+
+    one = StrategySet(['sign'])
+    start = time.perf_counter()
+    one.evaluate(ctx, backtester)
+    single = time.perf_counter() - start
+
+    many = StrategySet(
+        grid('sign', threshold=np.linspace(0, 0.004, 55).round(5).tolist())
+        + grid('confirm', bars=[2, 3, 4, 6], threshold=[0.0, 0.001, 0.002])
+        + grid('zscore', window=[24, 72, 168], entry=[0.5, 1.0, 1.5, 2.0])
+        + grid('hold', threshold=[0.0, 0.001, 0.002], bars=[6, 12, 24, 48])
+        + grid('band', buy=[0.0, 0.001, 0.002], sell=[0.0, -0.001, -0.002])
+    )
+    start = time.perf_counter()
+    result = many.evaluate(ctx, backtester)
+    batch = time.perf_counter() - start
+
+    print(f"\n   규칙 1개: {single * 1000:.1f}ms, {len(many)}개: {batch * 1000:.1f}ms")
+    print_ranking(result)
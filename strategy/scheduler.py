@@ -0,0 +1,301 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+import sys
+import os
+
+# === 경로 설정 ===
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from strategy.ma_strategy import position_step
+
+
+# 심볼 1개의 판단 결과
+Decision = namedtuple('Decision', ['symbol', 'prediction', 'signal', 'action', 'position', 'latency'])
+
+
+class SymbolPosition:
+    """심볼별 포지션 상태 (MAStrategy.get_positions와 같은 규칙)"""
+
+    __slots__ = ('current_position', 'is_first')
+
+    def __init__(self):
+        self.current_position = 0
+        self.is_first = True
+
+    def update(self, signal):
+        action, self.current_position = position_step(signal, self.current_position, self.is_first)
+        self.is_first = False
+        return action
+
+
+class SchedulerMetrics:
+    """
+    큐 깊이 / 지연 시간 / 배치 크기 통계 (최근 window개)
+    """
+
+    def __init__(self, window=10_000):
+        self.latencies = deque(maxlen=window)   # 요청 → 결과 (초)
+        self.batch_sizes = deque(maxlen=window)
+        self.forward_times = deque(maxlen=window)
+        self.flush_reasons = {'full': 0, 'deadline': 0, 'manual': 0}
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+
+    def summary(self):
+        latencies = np.array(self.latencies) * 1000
+        forward = np.array(self.forward_times) * 1000
+
+        def pct(values, q):
+            return float(np.percentile(values, q)) if len(values) else 0.0
+
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'num_flushes': sum(self.flush_reasons.values()),
+            'flush_reasons': dict(self.flush_reasons),
+            'mean_batch_size': float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            'latency_p50_ms': pct(latencies, 50),
+            'latency_p99_ms': pct(latencies, 99),
+            'latency_max_ms': float(latencies.max()) if len(latencies) else 0.0,
+            'forward_p50_ms': pct(forward, 50),
+        }
+
+    def print_report(self):
+        summary = self.summary()
+
+        print(f"\n" + "=" * 60)
+        print(f"⏱️  추론 스케줄러 통계")
+        print(f"=" * 60)
+        print(f"   배치: {summary['num_flushes']}회, 평균 {summary['mean_batch_size']:.1f}개 "
+              f"(가득 참 {summary['flush_reasons']['full']}, 마감 {summary['flush_reasons']['deadline']}, "
+              f"수동 {summary['flush_reasons']['manual']})")
+        print(f"   큐 깊이: 현재 {summary['queue_depth']}, 최대 {summary['max_queue_depth']}")
+        print(f"   지연: p50 {summary['latency_p50_ms']:.2f}ms, p99 {summary['latency_p99_ms']:.2f}ms, "
+              f"최대 {summary['latency_max_ms']:.2f}ms")
+        print(f"   순전파: p50 {summary['forward_p50_ms']:.2f}ms")
+        print(f"=" * 60)
+
+
+class InferenceScheduler:
+    """
+    여러 심볼의 피처를 모아서 한 번의 배치 순전파로 판단하는 스케줄러
+
+    - submit(symbol, features): 심볼별 피처 벡터 등록 (같은 심볼은 최신 값으로 덮어씀)
+    - 배치가 가득 차거나 첫 요청 후 max_delay가 지나면 flush
+    - 결과는 심볼별 포지션 상태로 전달되고 on_result 콜백 호출
+
+    미리 할당한 float32 버퍼 두 개를 번갈아 써서 요청마다 할당하지 않음
+    """
+
+    def __init__(self, strategy, num_features, max_batch=512, max_delay=0.002, on_result=None):
+        """
+        초기화
+
+        Args:
+            strategy: MAStrategy (모델, 정규화, 기간 선택 사용)
+            num_features: 피처 개수
+            max_batch: 배치 최대 크기
+            max_delay: 첫 요청 후 최대 대기 시간 (초)
+            on_result: 콜백 fn(Decision)
+        """
+        self.strategy = strategy
+        self.num_features = num_features
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.on_result = on_result
+
+        self.positions = {}   # symbol → SymbolPosition
+        self.latest = {}      # symbol → Decision
+        self.metrics = SchedulerMetrics()
+
+        # 이중 버퍼
+        self._buffers = [np.empty((max_batch, num_features), dtype=np.float32) for _ in range(2)]
+        self._submitted = [np.empty(max_batch) for _ in range(2)]
+        self._active = 0
+        self._rows = {}       # symbol → 버퍼 행
+        self._symbols = []
+        self._deadline = None
+
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    def submit(self, symbol, features):
+        """
+        피처 벡터 등록
+
+        Args:
+            symbol: 거래 쌍
+            features: (F,) 원본 피처
+        """
+        now = time.perf_counter()
+
+        with self._cond:
+            row = self._rows.get(symbol)
+
+            # 버퍼가 가득 차면 다른 요청이 flush로 버퍼를 교체할 때까지 대기
+            while row is None and len(self._symbols) >= self.max_batch:
+                self._cond.wait()
+                row = self._rows.get(symbol)
+
+            if row is None:
+                row = len(self._symbols)
+                self._rows[symbol] = row
+                self._symbols.append(symbol)
+                if row == 0:
+                    self._deadline = now + self.max_delay
+                    self._cond.notify()
+
+            self._buffers[self._active][row] = features
+            self._submitted[self._active][row] = now
+
+            depth = len(self._symbols)
+            self.metrics.queue_depth = depth
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, depth)
+            full = depth >= self.max_batch
+
+        if full:
+            self.flush(reason='full')
+
+    def flush(self, reason='manual'):
+        """
+        대기 중인 요청 전부를 한 번의 순전파로 처리
+
+        Returns:
+            Decision 리스트
+        """
+        with self._flush_lock:
+            with self._cond:
+                n = len(self._symbols)
+                if n == 0:
+                    return []
+
+                # 버퍼 교체: 처리하는 동안 새 요청은 다른 버퍼에 기록
+                index = self._active
+                symbols = self._symbols
+                self._active = 1 - self._active
+                self._rows = {}
+                self._symbols = []
+                self._deadline = None
+                self.metrics.queue_depth = 0
+                self._cond.notify_all()
+
+            X = self._buffers[index][:n]
+            submitted = self._submitted[index][:n]
+
+            started = time.perf_counter()
+            predictions = self.strategy.predict(X).numpy().reshape(-1)
+            signals = np.sign(predictions)
+            done = time.perf_counter()
+
+            decisions = []
+            for i, symbol in enumerate(symbols):
+                position = self.positions.get(symbol)
+                if position is None:
+                    position = self.positions[symbol] = SymbolPosition()
+
+                action = position.update(signals[i])
+                decision = Decision(
+                    symbol=symbol,
+                    prediction=float(predictions[i]),
+                    signal=float(signals[i]),
+                    action=action,
+                    position=position.current_position,
+                    latency=float(done - submitted[i])
+                )
+                self.latest[symbol] = decision
+                decisions.append(decision)
+
+                if self.on_result is not None:
+                    self.on_result(decision)
+
+            self.metrics.flush_reasons[reason] += 1
+            self.metrics.batch_sizes.append(n)
+            self.metrics.forward_times.append(done - started)
+            self.metrics.latencies.extend(done - submitted)
+
+            return decisions
+
+    def _run(self):
+        """마감 시간 감시 스레드"""
+        while True:
+            with self._cond:
+                while self._running and self._deadline is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+                remaining = self._deadline - time.perf_counter()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+            self.flush(reason='deadline')
+
+    def start(self):
+        """마감 시간 기반 자동 flush 시작"""
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+
+        self._thread = threading.Thread(target=self._run, name='inference-scheduler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """자동 flush 중지 (남은 요청은 처리)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.flush(reason='manual')
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    from model.network import MAModel
+    from strategy.ma_strategy import MAStrategy
+
+    print("=" * 60)
+    print("🚀 배치 추론 스케줄러 V0.1")
+    print("=" * 60)
+
+    num_symbols, num_features = 500, 5
+    symbols = [f'COIN{i}/USDT' for i in range(num_symbols)]
+    rng = np.random.default_rng(0)
+
+    strategy = MAStrategy(MAModel(input_size=num_features))
+
+    # 기존 방식: 심볼별 generate_signals 대신 signal_for 한 번씩
+    features = rng.normal(size=(num_symbols, num_features)).astype(np.float32)
+    start = time.perf_counter()
+    for row in features:
+        strategy.signal_for(row)
+    print(f"\n   심볼별 추론: {(time.perf_counter() - start) * 1000:.1f}ms ({num_symbols}개)")
+
+    # 스케줄러: 캔들 마감마다 500개 제출
+    with InferenceScheduler(strategy, num_features, max_batch=512, max_delay=0.002) as scheduler:
+        for candle in range(50):
+            features = rng.normal(size=(num_symbols, num_features)).astype(np.float32)
+            for symbol, row in zip(symbols, features):
+                scheduler.submit(symbol, row)
+            time.sleep(0.01)
+
+    scheduler.metrics.print_report()
+    print(f"\n   {symbols[0]}: {scheduler.latest[symbols[0]]}")